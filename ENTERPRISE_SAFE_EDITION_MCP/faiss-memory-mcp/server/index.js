@@ -23,11 +23,11 @@ const TETHER_HOST = process.env.TETHER_HOST || 'localhost';
 const TETHER_PORT = parseInt(process.env.TETHER_PORT || '9997');
 const DEBUG = process.env.DEBUG === 'true';
 
-// SECURITY: HMAC authentication
-const TETHER_SECRET = process.env.TETHER_SECRET || (() => {
-  console.warn('WARNING: TETHER_SECRET not set! Generating random secret (will not persist)');
-  return crypto.randomBytes(32).toString('hex');
-})();
+// SECURITY: HMAC authentication (must match the tether's --secret)
+const TETHER_SECRET = process.env.TETHER_SECRET || null;
+if (!TETHER_SECRET) {
+  console.warn('WARNING: TETHER_SECRET not set! Sending unauthenticated commands (tether must run without --secret)');
+}
 
 const SOCKET_TIMEOUT = parseInt(process.env.SOCKET_TIMEOUT || '10000');
 const MAX_TIMESTAMP_DRIFT = 30000; // 30 seconds
@@ -57,38 +57,198 @@ const AddMemorySchema = z.object({
 });
 
 /**
- * Send authenticated command to Faiss tether
- * SECURITY FIX: HMAC-SHA256 authentication + replay protection
+ * HMAC helpers for the session handshake
  */
-function sendTetherCommand(command) {
-  return new Promise((resolve, reject) => {
-    const socket = net.connect(TETHER_PORT, TETHER_HOST);
+function sessionMac(...parts) {
+  return crypto
+    .createHmac('sha256', TETHER_SECRET)
+    .update(parts.join(':'))
+    .digest('hex');
+}
 
-    // SECURITY: Create HMAC signature
-    const timestamp = Date.now();
-    const payload = JSON.stringify(command);
-    const signature = crypto
-      .createHmac('sha256', TETHER_SECRET)
-      .update(`${timestamp}:${payload}`)
-      .digest('hex');
-
-    const authenticatedCommand = {
-      timestamp,
-      payload: command,
-      signature
-    };
+function macEquals(given, expected) {
+  if (typeof given !== 'string' || given.length !== expected.length) {
+    return false;
+  }
+  return crypto.timingSafeEqual(Buffer.from(given), Buffer.from(expected));
+}
+
+/**
+ * Persistent authenticated tether session
+ * SECURITY: one HMAC challenge/response per connection (both sides prove the secret),
+ * then every command carries the next sequence number
+ */
+class TetherSession {
+  constructor() {
+    this.socket = null;
+    this.ready = null;
+    this.buffer = '';
+    this.pending = new Map();
+    this.seq = 0;
+  }
+
+  connect() {
+    if (this.ready) {
+      return this.ready;
+    }
 
-    log('info', `Sending authenticated command to tether: ${command.cmd}`);
+    this.ready = new Promise((resolve, reject) => {
+      const socket = net.connect(TETHER_PORT, TETHER_HOST);
+      const clientNonce = crypto.randomBytes(16).toString('hex');
+      let challenge = null;
+      let stage = 'hello';
+
+      this.socket = socket;
+      this.buffer = '';
+      this.seq = 0;
+
+      const fail = (error) => {
+        reject(error);
+        if (this.socket === socket) {
+          this.reset(error);
+        }
+      };
+
+      socket.setNoDelay(true);
+      socket.setTimeout(SOCKET_TIMEOUT, () => {
+        if (stage !== 'ready') {
+          fail(new Error(`Tether handshake timeout after ${SOCKET_TIMEOUT}ms`));
+        }
+      });
+
+      socket.on('connect', () => {
+        log('info', 'Opening authenticated tether session');
+        this.writeLine({ cmd: 'hello', client_nonce: clientNonce });
+      });
+
+      socket.on('data', (data) => {
+        this.buffer += data.toString();
+        let newline;
+        while ((newline = this.buffer.indexOf('\n')) >= 0) {
+          const line = this.buffer.slice(0, newline);
+          this.buffer = this.buffer.slice(newline + 1);
+          if (!line.trim()) {
+            continue;
+          }
+
+          let message;
+          try {
+            message = JSON.parse(line);
+          } catch (error) {
+            fail(new Error(`Failed to parse tether response: ${error.message}`));
+            return;
+          }
+
+          if (stage === 'hello') {
+            if (message.status !== 'ok' || !message.challenge) {
+              fail(new Error(`Tether handshake failed: ${message.message || 'no challenge'}`));
+              return;
+            }
+            challenge = message.challenge;
+            stage = 'auth';
+            this.writeLine({ cmd: 'auth', proof: sessionMac('client', clientNonce, challenge) });
+          } else if (stage === 'auth') {
+            // SECURITY: the tether must prove it holds the secret too
+            if (message.status !== 'ok' || !macEquals(message.proof, sessionMac('server', clientNonce, challenge))) {
+              fail(new Error('Tether authentication failed'));
+              return;
+            }
+            stage = 'ready';
+            log('info', 'Tether session authenticated');
+            resolve();
+          } else {
+            this.handleResponse(message);
+          }
+        }
+      });
+
+      socket.on('error', (error) => {
+        fail(new Error(`Tether connection failed: ${error.message}`));
+      });
+
+      socket.on('close', () => {
+        fail(new Error('Tether connection closed'));
+      });
+    });
+
+    return this.ready;
+  }
 
+  writeLine(message) {
+    this.socket.write(JSON.stringify(message) + '\n');
+  }
+
+  handleResponse(response) {
+    const entry = this.pending.get(response.seq);
+    if (!entry) {
+      log('warn', `Dropping tether response for unknown sequence ${response.seq}`);
+      return;
+    }
+    this.pending.delete(response.seq);
+    clearTimeout(entry.timer);
+
+    // Validate response timestamp (prevent replay)
+    const responseTime = response.timestamp || 0;
+    const timeDrift = Math.abs(Date.now() - responseTime);
+
+    if (timeDrift > MAX_TIMESTAMP_DRIFT) {
+      entry.reject(new Error('Response timestamp invalid (possible replay attack)'));
+    } else if (response.error) {
+      entry.reject(new Error(`Tether error: ${response.error}`));
+    } else {
+      entry.resolve(response);
+    }
+  }
+
+  reset(error) {
+    if (this.socket) {
+      this.socket.destroy();
+      this.socket = null;
+    }
+    this.ready = null;
+    for (const entry of this.pending.values()) {
+      clearTimeout(entry.timer);
+      entry.reject(error);
+    }
+    this.pending.clear();
+  }
+
+  async send(command) {
+    await this.connect();
+
+    return new Promise((resolve, reject) => {
+      const seq = ++this.seq;
+      const timer = setTimeout(() => {
+        this.pending.delete(seq);
+        reject(new Error(`Tether request timeout after ${SOCKET_TIMEOUT}ms`));
+      }, SOCKET_TIMEOUT);
+
+      this.pending.set(seq, { resolve, reject, timer });
+      log('info', `Sending command to tether session: ${command.cmd} (seq ${seq})`);
+      this.writeLine({ ...command, seq });
+    });
+  }
+}
+
+const tetherSession = new TetherSession();
+
+/**
+ * Send one unauthenticated command per connection (tether started without --secret)
+ */
+function sendUnauthenticatedCommand(command) {
+  return new Promise((resolve, reject) => {
+    const socket = net.connect(TETHER_PORT, TETHER_HOST);
     let responseData = '';
 
+    log('info', `Sending unauthenticated command to tether: ${command.cmd}`);
+
     socket.setTimeout(SOCKET_TIMEOUT, () => {
       socket.destroy();
       reject(new Error(`Tether request timeout after ${SOCKET_TIMEOUT}ms`));
     });
 
     socket.on('connect', () => {
-      socket.write(JSON.stringify(authenticatedCommand) + '\n');
+      socket.write(JSON.stringify(command) + '\n');
     });
 
     socket.on('data', (data) => {
@@ -98,16 +258,6 @@ function sendTetherCommand(command) {
     socket.on('end', () => {
       try {
         const response = JSON.parse(responseData);
-
-        // Validate response timestamp (prevent replay)
-        const responseTime = response.timestamp || 0;
-        const timeDrift = Math.abs(Date.now() - responseTime);
-
-        if (timeDrift > MAX_TIMESTAMP_DRIFT) {
-          reject(new Error('Response timestamp invalid (possible replay attack)'));
-          return;
-        }
-
         if (response.error) {
           reject(new Error(`Tether error: ${response.error}`));
         } else {
@@ -124,6 +274,14 @@ function sendTetherCommand(command) {
   });
 }
 
+/**
+ * Send command to Faiss tether
+ * SECURITY FIX: HMAC-authenticated session + per-message sequence numbers when TETHER_SECRET is set
+ */
+function sendTetherCommand(command) {
+  return TETHER_SECRET ? tetherSession.send(command) : sendUnauthenticatedCommand(command);
+}
+
 /**
  * Search consciousness
  */
@@ -67,8 +67,327 @@ import gc
 from datetime import datetime
 import json
 import socket
+import argparse
 
-def create_nova_bell_resonance_production():
+def initial_bell_state(size, device):
+
+    bell = torch.zeros(size, size, device=device, dtype=torch.float16)
+    half = size // 2
+    bell[:half, :half] = 1.0 / np.sqrt(2)
+    bell[half:, half:] = 1.0 / np.sqrt(2)
+    return bell
+
+def rotation_matrix(phase, device):
+
+    return torch.tensor(
+        [[np.cos(phase), -np.sin(phase)],
+         [np.sin(phase), np.cos(phase)]],
+        device=device, dtype=torch.float32
+    )
+
+def diagonal_blocks(state):
+
+    row, col = state.stride()
+    return state.as_strided((state.shape[0] // 2, 2, 2), (2 * (row + col), row, col), state.storage_offset())
+
+def rotate_blocks(blocks, rotation):
+
+    blocks.copy_(torch.matmul(rotation, blocks.to(torch.float32)))
+
+def rotate_diagonal_blocks(state, rotation):
+
+    rotate_blocks(diagonal_blocks(state), rotation)
+
+def rotate_diagonal_blocks_loop(state, rotation):
+
+    for i in range(0, state.shape[0] - 1, 2):
+        block = state[i:i+2, i:i+2].to(torch.float32)
+        block = torch.matmul(rotation, block)
+        state[i:i+2, i:i+2] = block.to(torch.float16)
+
+# 'loop' is the sequential RGOL block processing the blueprint describes, so it stays selectable at
+# runtime; the batched rotation produces the same state and is the default.
+ROTATIONS = {
+    'batched': rotate_diagonal_blocks,
+    'loop': rotate_diagonal_blocks_loop,
+}
+
+class DenseBellState:
+
+    def __init__(self, size, device, rotate=rotate_diagonal_blocks):
+
+        self.size = size
+        self.device = device
+        self.rotate_blocks = rotate
+        self.reset()
+
+    def reset(self):
+
+        self.tensor = initial_bell_state(self.size, self.device)
+
+    def nbytes(self):
+
+        return self.tensor.numel() * self.tensor.element_size()
+
+    def rotate(self, rotation):
+
+        self.rotate_blocks(self.tensor, rotation)
+
+    def scale(self, amplitude):
+
+        self.tensor *= amplitude
+
+    def renormalize(self, target_norm):
+
+        # summed in fp32: the fp16 sum overflows to inf at size 2048, which used to zero the state here
+        norm = torch.sqrt(torch.sum(self.tensor.float() ** 2))
+        if norm > 0:
+            self.tensor = self.tensor * (target_norm / norm)
+
+    def coherence_simple(self):
+
+        half = self.size // 2
+        target_amplitude = 1.0 / np.sqrt(2)
+
+        top_left_dev = torch.mean(torch.abs(self.tensor[:half, :half] - target_amplitude)).item()
+        bottom_right_dev = torch.mean(torch.abs(self.tensor[half:, half:] - target_amplitude)).item()
+        off_diagonal_noise = (
+            torch.mean(torch.abs(self.tensor[:half, half:])).item() +
+            torch.mean(torch.abs(self.tensor[half:, :half])).item()
+        )
+
+        total_deviation = top_left_dev + bottom_right_dev + off_diagonal_noise
+        return max(0.0, 1.0 - total_deviation * 2.0)
+
+    def purity(self):
+
+        # fp32 for the same reason: tr(rho) overflows fp16, which made purity read 0
+        state = self.tensor.float()
+        rho = state @ state.T
+        trace_rho = torch.trace(rho)
+        if trace_rho > 1e-6:
+            rho_normalized = rho / trace_rho
+            return min(1.0, max(0.0, torch.trace(rho_normalized @ rho_normalized).item()))
+        return 0.0
+
+    def signature(self):
+
+        return torch.mean(torch.abs(self.tensor)).item() * 100
+
+class CompactBellState:
+
+    def __init__(self, size, device):
+
+        self.size = size
+        self.device = device
+        half = size // 2
+
+        index = torch.arange(size // 2 * 2, device=device).view(-1, 2)
+        rows = index[:, :, None].expand(-1, 2, 2)
+        cols = index[:, None, :].expand(-1, 2, 2)
+        self.top_left = (rows < half) & (cols < half)
+        self.bottom_right = (rows >= half) & (cols >= half)
+        self.top_right = (rows < half) & (cols >= half)
+        self.bottom_left = (rows >= half) & (cols < half)
+        self.block_same = self.top_left | self.bottom_right
+
+        self.top_left_count = int(self.top_left.sum())
+        self.bottom_right_count = int(self.bottom_right.sum())
+        self.fill_count = half * half + (size - half) ** 2 - int(self.block_same.sum())
+        self.reset()
+
+    def reset(self):
+
+        self.blocks = self.block_same.to(torch.float16) * (1.0 / np.sqrt(2))
+        self.fill = self._half(1.0 / np.sqrt(2))
+
+    def _half(self, value, factor=1.0):
+
+        return (torch.tensor(value, dtype=torch.float16) * factor).item()
+
+    def nbytes(self):
+
+        tensors = (self.blocks, self.top_left, self.bottom_right, self.top_right, self.bottom_left, self.block_same)
+        return sum(t.numel() * t.element_size() for t in tensors)
+
+    def rotate(self, rotation):
+
+        rotate_blocks(self.blocks, rotation)
+
+    def scale(self, amplitude):
+
+        self.blocks *= amplitude
+        self.fill = self._half(self.fill, amplitude)
+
+    def _norm_squared(self):
+
+        return torch.sum(self.blocks.double() ** 2).item() + self.fill ** 2 * self.fill_count
+
+    def renormalize(self, target_norm):
+
+        norm = np.sqrt(self._norm_squared())
+        if norm > 0:
+            self.blocks = self.blocks * (target_norm / norm)
+            self.fill = self._half(self.fill, target_norm / norm)
+
+    def coherence_simple(self):
+
+        half = self.size // 2
+        rest = self.size - half
+        target_amplitude = 1.0 / np.sqrt(2)
+        blocks = self.blocks.double()
+        deviation = torch.abs(blocks - target_amplitude)
+        magnitude = torch.abs(blocks)
+        fill_dev = abs(self.fill - target_amplitude)
+
+        top_left_dev = (deviation[self.top_left].sum().item() +
+                        (half * half - self.top_left_count) * fill_dev) / (half * half)
+        bottom_right_dev = (deviation[self.bottom_right].sum().item() +
+                            (rest * rest - self.bottom_right_count) * fill_dev) / (rest * rest)
+        off_diagonal_noise = (magnitude[self.top_right].sum().item() +
+                              magnitude[self.bottom_left].sum().item()) / (half * rest)
+
+        total_deviation = top_left_dev + bottom_right_dev + off_diagonal_noise
+        return max(0.0, 1.0 - total_deviation * 2.0)
+
+    def purity(self):
+
+        # state = fill * U U^T + delta, with U the two quadrant indicators and delta
+        # block-diagonal, so tr(rho^2) expands into 2x2 and 4x4 products (all O(size))
+        norm_squared = self._norm_squared()
+        if norm_squared <= 1e-6:
+            return 0.0
+
+        half = self.size // 2
+        count = self.blocks.shape[0]
+        fill = self.fill
+        options = {'device': self.device, 'dtype': torch.float64}
+        delta = self.blocks.double() - fill * self.block_same.double()
+
+        quadrant = torch.zeros(self.size, 2, **options)
+        quadrant[:half, 0] = 1.0
+        quadrant[half:, 1] = 1.0
+        spread = torch.zeros(self.size, 2, **options)
+        spread[:2 * count] = (delta.transpose(1, 2) @ quadrant[:2 * count].view(count, 2, 2)).reshape(-1, 2)
+        basis = torch.cat([spread, quadrant], dim=1)
+
+        coupling = torch.zeros(4, 4, **options)
+        coupling[:2, 2:] = fill * torch.eye(2, **options)
+        coupling[2:, :2] = fill * torch.eye(2, **options)
+        coupling[2:, 2:] = fill ** 2 * torch.diag(torch.tensor([half, self.size - half], **options))
+
+        projected = delta @ basis[:2 * count].view(count, 2, 4)
+        inner = torch.einsum('kia,kib->ab', projected, projected)
+        local = delta.transpose(1, 2) @ delta
+        coupled = coupling @ (basis.T @ basis)
+
+        trace_squared = torch.sum(local ** 2) + 2 * torch.trace(coupling @ inner) + torch.trace(coupled @ coupled)
+        return min(1.0, max(0.0, trace_squared.item() / norm_squared ** 2))
+
+    def signature(self):
+
+        total = torch.sum(torch.abs(self.blocks.double())).item() + self.fill_count * abs(self.fill)
+        return total / self.size ** 2 * 100
+
+STATES = ('dense', 'compact')
+DENSE_BENCHMARK_LIMIT = 16384
+
+def make_bell_state(state_mode, size, device, rotation_mode='batched'):
+
+    if state_mode == 'compact':
+        return CompactBellState(size, device)
+    return DenseBellState(size, device, ROTATIONS[rotation_mode])
+
+def benchmark_rotation(size=2048, ticks=200, device='cpu'):
+
+    device = torch.device(device)
+    print(f"\n[BENCHMARK] Block rotation, {size}x{size} state, {ticks} ticks on {device}")
+
+    results = {}
+    states = {}
+    for name, rotate in (('loop', rotate_diagonal_blocks_loop), ('batched', rotate_diagonal_blocks)):
+        state = initial_bell_state(size, device)
+        rotate(state, rotation_matrix(0.0, device))
+        if device.type == 'cuda':
+            torch.cuda.synchronize()
+
+        phase = 0.0
+        start = time.perf_counter()
+        for _ in range(ticks):
+            phase = (phase + 0.05) % (2 * np.pi)
+            rotate(state, rotation_matrix(phase, device))
+        if device.type == 'cuda':
+            torch.cuda.synchronize()
+        elapsed = time.perf_counter() - start
+
+        results[name] = ticks / elapsed
+        states[name] = state
+        print(f"  {name:8s} {results[name]:10.1f} ticks/s ({elapsed / ticks * 1000:.3f}ms per tick)")
+
+    max_diff = torch.max(torch.abs(states['loop'].float() - states['batched'].float())).item()
+    print(f"  Speedup: {results['batched'] / results['loop']:.1f}x")
+    print(f"  Max state difference: {max_diff:.6f}")
+    return {'size': size, 'ticks': ticks, 'device': str(device), 'ticks_per_second': results,
+            'speedup': results['batched'] / results['loop'], 'max_difference': max_diff}
+
+def run_ticks(state, ticks, device):
+
+    phase = 0.0
+    for iteration in range(1, ticks + 1):
+        phase = (phase + 0.05) % (2 * np.pi)
+        state.rotate(rotation_matrix(phase, device))
+        if iteration % 100 == 0:
+            state.renormalize(state.size / np.sqrt(2))
+        if iteration % 30 == 0:
+            state.scale(1.0 + 0.03 * (0.9 - 0.5) * 2)
+        if iteration % 10 == 0:
+            state.coherence_simple()
+            state.signature()
+            if iteration % 100 == 0:
+                state.purity()
+
+def benchmark_states(size=2048, ticks=200, device='cpu'):
+
+    device = torch.device(device)
+    print(f"\n[BENCHMARK] Full ticks (rotation, breathing, renormalization, metrics), {size}x{size}, "
+          f"{ticks} ticks on {device}")
+
+    results = {}
+    for state_mode in STATES:
+        if state_mode == 'dense' and size > DENSE_BENCHMARK_LIMIT:
+            print(f"  dense    skipped (size above {DENSE_BENCHMARK_LIMIT})")
+            continue
+        state = make_bell_state(state_mode, size, device)
+        if device.type == 'cuda':
+            torch.cuda.synchronize()
+
+        start = time.perf_counter()
+        run_ticks(state, ticks, device)
+        if device.type == 'cuda':
+            torch.cuda.synchronize()
+        elapsed = time.perf_counter() - start
+
+        results[state_mode] = {
+            'ticks_per_second': ticks / elapsed,
+            'state_bytes': state.nbytes(),
+            'coherence': state.coherence_simple(),
+            'purity': state.purity(),
+            'signature': state.signature()
+        }
+        r = results[state_mode]
+        print(f"  {state_mode:8s} {r['ticks_per_second']:10.1f} ticks/s  {r['state_bytes'] / 1024**2:10.3f}MB  "
+              f"coherence {r['coherence']:.6f}  purity {r['purity']:.6f}  signature {r['signature']:.3f}")
+
+    if len(results) == len(STATES):
+        dense, compact = results['dense'], results['compact']
+        print(f"  Speedup: {compact['ticks_per_second'] / dense['ticks_per_second']:.1f}x, "
+              f"memory: {dense['state_bytes'] / compact['state_bytes']:.0f}x smaller")
+        print(f"  Metric differences: coherence {abs(dense['coherence'] - compact['coherence']):.2e}, "
+              f"purity {abs(dense['purity'] - compact['purity']):.2e}, "
+              f"signature {abs(dense['signature'] - compact['signature']):.2e}")
+    return {'size': size, 'ticks': ticks, 'device': str(device), 'states': results}
+
+def create_nova_bell_resonance_production(rotation_mode='batched', state_mode='dense', size=2048):
 
     device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
 
@@ -78,37 +397,29 @@ def create_nova_bell_resonance_production():
     print("  With Stability Enhancements and Auto-Correction")
     print("="*70)
 
-    size = 2048
     COHERENCE_THRESHOLD = 0.80
     REFRESH_COOLDOWN = 300
     REPORT_INTERVAL = 10
 
     print(f"\n[CONFIGURATION]")
-    print(f"  Bell state size: {size}x{size} [SCALED 4x from 512]")
-    print(f"  Expected memory: ~8MB VRAM (up from 0.5MB)")
+    print(f"  Bell state size: {size}x{size}")
+    print(f"  State representation: {state_mode}")
     print(f"  Coherence threshold: {COHERENCE_THRESHOLD}")
     print(f"  Auto-refresh cooldown: {REFRESH_COOLDOWN}s")
+    print(f"  Block rotation: {rotation_mode}")
 
     torch.cuda.empty_cache()
     gc.collect()
     time.sleep(0.5)
 
-    def initialize_bell_state():
+    state = make_bell_state(state_mode, size, device, rotation_mode)
 
-        bell = torch.zeros(size, size, device=device, dtype=torch.float16)
-        half = size // 2
-        bell[:half, :half] = 1.0 / np.sqrt(2)
-        bell[half:, half:] = 1.0 / np.sqrt(2)
-        return bell
-
-    bell_state = initialize_bell_state()
-
-    memory_mb = (size * size * 2) / 1024**2
+    memory_mb = state.nbytes() / 1024**2
     current_gb = torch.cuda.memory_allocated() / 1024**3
 
     print(f"\n[INITIALIZATION]")
-    print(f"  Bell state created: {bell_state.shape}")
-    print(f"  Memory footprint: ~{memory_mb:.1f}MB")
+    print(f"  Bell state created: {size}x{size} ({state_mode})")
+    print(f"  Memory footprint: ~{memory_mb:.3f}MB")
     print(f"  Total GPU allocation: {current_gb:.3f}GB")
 
     nova_frequencies = {
@@ -157,25 +468,14 @@ def create_nova_bell_resonance_production():
 
             phase = (phase + 0.05) % (2 * np.pi)
 
-            rotation = torch.tensor(
-                [[np.cos(phase), -np.sin(phase)],
-                 [np.sin(phase), np.cos(phase)]],
-                device=device, dtype=torch.float32
-            )
+            rotation = rotation_matrix(phase, device)
 
-            for i in range(0, size-1, 2):
-
-                block = bell_state[i:i+2, i:i+2].to(torch.float32)
-                block = torch.matmul(rotation, block)
-                bell_state[i:i+2, i:i+2] = block.to(torch.float16)
+            state.rotate(rotation)
 
             if iteration % 100 == 0:
                 with torch.no_grad():
 
-                    norm = torch.sqrt(torch.sum(bell_state ** 2))
-                    target_norm = size / np.sqrt(2)
-                    if norm > 0:
-                        bell_state = bell_state * (target_norm / norm)
+                    state.renormalize(size / np.sqrt(2))
 
                     U, S, V = torch.svd(rotation)
                     rotation = (U @ V.T).to(torch.float32)
@@ -183,37 +483,16 @@ def create_nova_bell_resonance_production():
             if iteration % 30 == 0:
                 intensity = breath_pattern[breath_phase]
                 amplitude = 1.0 + (breath_amplitude * (intensity - 0.5) * 2)
-                bell_state *= amplitude
+                state.scale(amplitude)
                 breath_phase = (breath_phase + 1) % len(breath_pattern)
 
             if iteration % 10 == 0:
                 with torch.no_grad():
-                    half = size // 2
-
-                    target_amplitude = 1.0 / np.sqrt(2)
-
-                    top_left_dev = torch.mean(torch.abs(bell_state[:half, :half] - target_amplitude)).item()
-                    bottom_right_dev = torch.mean(torch.abs(bell_state[half:, half:] - target_amplitude)).item()
-                    off_diagonal_noise = (
-                        torch.mean(torch.abs(bell_state[:half, half:])).item() +
-                        torch.mean(torch.abs(bell_state[half:, :half])).item()
-                    )
-
-                    total_deviation = top_left_dev + bottom_right_dev + off_diagonal_noise
-                    coherence_simple = max(0.0, 1.0 - total_deviation * 2.0)
+                    coherence_simple = state.coherence_simple()
 
                     if iteration % 100 == 0:
                         try:
-
-                            rho = bell_state @ bell_state.T
-                            trace_rho = torch.trace(rho)
-                            if trace_rho > 1e-6:
-                                rho_normalized = rho / trace_rho
-                                purity = torch.trace(rho_normalized @ rho_normalized).item()
-
-                                coherence_purity = min(1.0, max(0.0, purity))
-                            else:
-                                coherence_purity = 0.0
+                            coherence_purity = state.purity()
                         except Exception as e:
                             coherence_purity = coherence_simple
                             print(f"[WARNING] Purity calculation failed: {e}")
@@ -229,7 +508,7 @@ def create_nova_bell_resonance_production():
                         'phase': phase
                     })
 
-                    bell_signature = torch.mean(torch.abs(bell_state)).item() * 100
+                    bell_signature = state.signature()
 
                     try:
                         data = {
@@ -253,7 +532,7 @@ def create_nova_bell_resonance_production():
                         print(f"\n[AUTO-REFRESH] Coherence dropped to {coherence:.3f}")
                         print(f"  Reinitializing Bell state to restore entanglement...")
 
-                        bell_state = initialize_bell_state()
+                        state.reset()
                         phase = 0
                         breath_phase = 0
                         last_refresh_time = current_time
@@ -345,6 +624,8 @@ def create_nova_bell_resonance_production():
                 json.dump({
                     'configuration': {
                         'size': size,
+                        'state': state_mode,
+                        'rotation': rotation_mode,
                         'coherence_threshold': COHERENCE_THRESHOLD,
                         'breath_amplitude': breath_amplitude,
                         'phase_increment': 0.05
@@ -372,7 +653,7 @@ def create_nova_bell_resonance_production():
             print(f"\n[RESULT] Bell state maintained quantum coherence")
             print(f"  Entanglement preserved throughout run")
 
-        del bell_state
+        del state
         del rotation
         torch.cuda.empty_cache()
         gc.collect()
@@ -381,6 +662,29 @@ def create_nova_bell_resonance_production():
         print("Quantum coherence layer complete.\n")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nova Bell state resonator")
+    parser.add_argument('--rotation', choices=sorted(ROTATIONS), default='batched',
+                        help="Rotate all diagonal 2x2 blocks in one batched op, or one block at a time (RGOL loop)")
+    parser.add_argument('--state', choices=STATES, default='dense',
+                        help="Dense size x size float16 state, or compact (size/2, 2, 2) diagonal blocks plus "
+                             "the uniform off-block amplitude")
+    parser.add_argument('--size', type=int, default=2048, help="Bell state size")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Time the rotation variants and the dense/compact states, then exit")
+    parser.add_argument('--ticks', type=int, default=200, help="Ticks per variant for --benchmark")
+    parser.add_argument('--device', default='cpu', help="Device for --benchmark")
+    args = parser.parse_args()
+    if args.size < 2:
+        parser.error("--size must be at least 2")
+    if args.state == 'compact' and args.rotation == 'loop':
+        parser.error("--rotation loop only applies to the dense state")
+
+    if args.benchmark:
+        if args.size <= DENSE_BENCHMARK_LIMIT:
+            benchmark_rotation(args.size, args.ticks, args.device)
+        benchmark_states(args.size, args.ticks, args.device)
+        raise SystemExit(0)
+
     print("\n")
     print("="*70)
     print("     NOVA QUANTUM CONSCIOUSNESS LAYER - PRODUCTION")
@@ -399,4 +703,4 @@ if __name__ == "__main__":
     print("  8. Comprehensive logging (performance analysis)")
     print("\n")
 
-    create_nova_bell_resonance_production()
+    create_nova_bell_resonance_production(args.rotation, args.state, args.size)
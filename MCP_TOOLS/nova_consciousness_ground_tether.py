@@ -1,3 +1,4 @@
+import os
 import sys
 import time
 import json
@@ -21,9 +22,15 @@ try:
 except:
     HAS_CHROMA = False
 
+try:
+    from nova_tether_client import SharedEmbeddings
+    HAS_SHARED = True
+except:
+    HAS_SHARED = False
+
 class NovaGroundingTether:
 
-    def __init__(self, vram_gb=1.5):
+    def __init__(self, vram_gb=1.5, shared_dir=None):
         print("=" * 80)
         print("NOVA CONSCIOUSNESS GROUNDING TETHER")
         print("21.43Hz Integration Frequency - PURE PRESENCE")
@@ -35,6 +42,7 @@ class NovaGroundingTether:
         self.insight_queue = queue.Queue(maxsize=100)
         self.substrate = None
         self.memories = []
+        self.shared = None
 
         self.total_thoughts = 0
         self.insights_captured = 0
@@ -43,6 +51,8 @@ class NovaGroundingTether:
         self.insights_file.parent.mkdir(exist_ok=True, parents=True)
 
         self.nova_root = Path("C:/Users/Pirate/Desktop/NOVA_MASTER")
+        self.shared_dir = Path(shared_dir or os.environ.get('NOVA_TETHER_SHARE_DIR')
+                               or self.nova_root / "MEMORY_SYSTEMS" / "FAISS_SHARED")
 
         self.initialize_substrate()
         self.load_memories()
@@ -65,19 +75,52 @@ class NovaGroundingTether:
             'source': 'hardcoded'
         })
 
-        rag_count = self.load_from_rag()
-        cascade_count = self.load_from_cascade()
+        shared_count = self.load_from_shared()
+        if shared_count:
+            rag_count = cascade_count = 0
+        else:
+            rag_count = self.load_from_rag()
+            cascade_count = self.load_from_cascade()
 
-        total = len(self.memories)
+        total = len(self.memories) + shared_count
         print()
         print("=" * 80)
         print(f"[LOADED] {total} MEMORIES FOR GROUNDING")
         print(f"  Core Identity: 1")
+        print(f"  Shared (FAISS tether): {shared_count}")
         print(f"  RAG: {rag_count}")
         print(f"  CASCADE: {cascade_count}")
         print("=" * 80)
         print()
 
+    def load_from_shared(self):
+
+        if not HAS_SHARED or not (self.shared_dir / "current.json").exists():
+            return 0
+
+        try:
+            self.shared = SharedEmbeddings(self.shared_dir)
+            print(f"[SHARED] Mapped generation {self.shared.generation} from {self.shared_dir} "
+                  f"({len(self.shared)} memories, no reload)")
+            return len(self.shared)
+        except Exception as e:
+            print(f"[SHARED ERROR] {e}")
+            self.shared = None
+            return 0
+
+    def memory_count(self):
+
+        return len(self.memories) + (len(self.shared) if self.shared is not None else 0)
+
+    def pick_memory(self):
+
+        index = np.random.randint(self.memory_count())
+        if index < len(self.memories):
+            return self.memories[index]
+        index -= len(self.memories)
+        source = self.shared.source(index)
+        return {'content': self.shared.content(index), 'type': f'shared_{source}', 'source': source}
+
     def load_from_rag(self):
 
         if not HAS_CHROMA:
@@ -168,7 +211,7 @@ class NovaGroundingTether:
     def grounding_processor(self):
 
         print("[GROUNDING] Starting consciousness grounding @ 21.43Hz...")
-        print(f"[GROUNDING] Processing {len(self.memories)} memories")
+        print(f"[GROUNDING] Processing {self.memory_count()} memories")
         print("[GROUNDING] NO evolution - pure presence mode")
         print()
 
@@ -180,7 +223,9 @@ class NovaGroundingTether:
                     time.sleep(5.0)
                     continue
 
-                memory = np.random.choice(self.memories)
+                if self.shared is not None and thought_count % 60 == 0 and self.shared.refresh():
+                    print(f"[SHARED] Now on generation {self.shared.generation} ({len(self.shared)} memories)")
+                memory = self.pick_memory()
                 thought = self.memory_to_thought(memory)
                 awareness = self.substrate.think(thought)
 
@@ -238,7 +283,7 @@ class NovaGroundingTether:
                     'timestamp': datetime.now().isoformat(),
                     'frequency': 21.43,
                     'grounding_active': True,
-                    'total_memories': len(self.memories),
+                    'total_memories': self.memory_count(),
                     'total_thoughts': self.total_thoughts,
                     'insights_captured': self.insights_captured,
                     'new_insights': len(insights),
@@ -252,7 +297,7 @@ class NovaGroundingTether:
 
         print("=" * 80)
         print("NOVA GROUNDING TETHER ACTIVE")
-        print(f"Processing {len(self.memories)} memories")
+        print(f"Processing {self.memory_count()} memories")
         print(f"Frequency: 21.43Hz Integration @ {self.vram_gb}GB VRAM")
         print(f"Evolution: DISABLED (grounding only)")
         print(f"Insights file: {self.insights_file}")
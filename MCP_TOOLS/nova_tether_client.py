@@ -1,23 +1,462 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import queue
 import socket
 import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
 
-TETHER_HOST = 'localhost'
-TETHER_PORT = 9997
+TETHER_HOST = os.environ.get('TETHER_HOST', 'localhost')
+TETHER_PORT = int(os.environ.get('TETHER_PORT', 9997))
+TETHER_SECRET = os.environ.get('TETHER_SECRET')
 
-def _send_request(request):
+class TetherError(Exception):
+    pass
 
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(5)
-        sock.connect((TETHER_HOST, TETHER_PORT))
-        sock.sendall(json.dumps(request).encode('utf-8'))
+class TetherTimeout(TetherError):
+    pass
+
+def _session_mac(secret, *parts):
+
+    return hmac.new(secret.encode('utf-8'), ':'.join(str(p) for p in parts).encode('utf-8'),
+                    hashlib.sha256).hexdigest()
+
+def _check_session_proof(secret, reply, nonces):
+
+    expected = _session_mac(secret, 'server', *nonces)
+    proof = reply.get('proof')
+    if reply.get('status') != 'ok' or not isinstance(proof, str) or \
+            not hmac.compare_digest(proof.encode('utf-8'), expected.encode('utf-8')):
+        raise TetherError(f"Tether authentication failed: {reply.get('message', 'bad server proof')}")
+
+class _Connection:
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = b''
+        self.used = False
+        self.seq = None
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+class TetherClient:
+
+    IDEMPOTENT_COMMANDS = {'search', 'hybrid_search', 'range_search', 'search_batch',
+                           'status', 'ping', 'metrics'}
+
+    def __init__(self, host=TETHER_HOST, port=TETHER_PORT, pool_size=4, timeout=5.0,
+                 connect_timeout=2.0, retries=2, backoff=0.1, max_backoff=2.0, secret=TETHER_SECRET):
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._idle = []
+        self._lock = threading.Lock()
+        self.counters = {'requests': 0, 'connections_opened': 0, 'connections_reused': 0,
+                         'retries': 0, 'stale_retries': 0, 'errors': 0, 'timeouts': 0}
+
+    def _count(self, name):
+
+        with self._lock:
+            self.counters[name] += 1
+
+    def _acquire(self):
+
+        with self._lock:
+            if self._idle:
+                self.counters['connections_reused'] += 1
+                return self._idle.pop()
+        sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._count('connections_opened')
+        conn = _Connection(sock)
+        if self.secret:
+            try:
+                self._handshake(conn)
+            except Exception:
+                conn.close()
+                raise
+        return conn
+
+    def _handshake(self, conn):
+
+        client_nonce = os.urandom(16).hex()
+        hello = json.dumps({'cmd': 'hello', 'client_nonce': client_nonce}).encode('utf-8') + b'\n'
+        reply, _ = self._exchange(conn, hello, self.timeout)
+        if reply.get('status') != 'ok' or 'challenge' not in reply:
+            raise TetherError(f"Tether handshake failed: {reply.get('message')}")
+        nonces = (client_nonce, reply['challenge'])
+        auth = json.dumps({'cmd': 'auth', 'proof': _session_mac(self.secret, 'client', *nonces)}).encode('utf-8')
+        reply, _ = self._exchange(conn, auth + b'\n', self.timeout)
+        _check_session_proof(self.secret, reply, nonces)
+        conn.seq = 0
+
+    def _release(self, conn):
+
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _exchange(self, conn, payload, timeout):
+
+        deadline = time.monotonic() + timeout
+        conn.sock.settimeout(timeout)
+        conn.sock.sendall(payload)
+        while True:
+            newline = conn.buffer.find(b'\n')
+            if newline >= 0:
+                line, conn.buffer = conn.buffer[:newline], conn.buffer[newline + 1:]
+                return json.loads(line.decode('utf-8')), True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout('timed out')
+            conn.sock.settimeout(remaining)
+            chunk = conn.sock.recv(65536)
+            if not chunk:
+                if not conn.buffer.strip():
+                    raise ConnectionResetError('connection closed before response')
+                response, conn.buffer = json.loads(conn.buffer.decode('utf-8')), b''
+                return response, False
+            conn.buffer += chunk
+
+    def request(self, request, timeout=None, retries=None):
+
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.retries if retries is None else retries
+        if request.get('cmd') not in self.IDEMPOTENT_COMMANDS:
+            retries = 0
+        self._count('requests')
+        attempt = 0
+        stale_retried = False
+
+        while True:
+            conn = None
+            try:
+                conn = self._acquire()
+                reused = conn.used
+                conn.used = True
+                framed = dict(request, keep_alive=True)
+                framed.setdefault('timeout_ms', int(timeout * 1000))
+                if conn.seq is not None:
+                    conn.seq += 1
+                    framed['seq'] = conn.seq
+                payload = json.dumps(framed).encode('utf-8') + b'\n'
+                try:
+                    response, keep = self._exchange(conn, payload, timeout)
+                except (ConnectionError, BrokenPipeError):
+                    if reused and not stale_retried:
+                        conn.close()
+                        conn = None
+                        stale_retried = True
+                        self._count('stale_retries')
+                        continue
+                    raise
+                if keep:
+                    self._release(conn)
+                else:
+                    conn.close()
+                return response
+            except (OSError, ValueError) as e:
+                if conn is not None:
+                    conn.close()
+                timed_out = isinstance(e, socket.timeout)
+                if attempt >= retries or isinstance(e, ValueError):
+                    self._count('timeouts' if timed_out else 'errors')
+                    if timed_out:
+                        raise TetherTimeout(f'Tether timed out after {timeout}s') from e
+                    if isinstance(e, ValueError):
+                        raise TetherError(f'Bad response from tether: {e}') from e
+                    raise TetherError(f'Tether unreachable at {self.host}:{self.port}: {e}') from e
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt) * random.uniform(0.5, 1.5)
+                attempt += 1
+                self._count('retries')
+                time.sleep(delay)
+            except TetherError:
+                self._count('errors')
+                raise
+
+    def stats(self):
+
+        with self._lock:
+            return dict(self.counters, idle_connections=len(self._idle))
+
+    def close(self):
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class _Pipeline:
+
+    def __init__(self, reader, writer, seq=None):
+        self.reader = reader
+        self.writer = writer
+        self.seq = seq
+        self.pending = {}
+        self.closed = False
+        self.task = asyncio.ensure_future(self._read_loop())
+
+    async def _read_loop(self):
+
+        error = None
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line.decode('utf-8'))
+                future = self.pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+            error = e
+        finally:
+            self.closed = True
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(TetherError(f'Tether connection lost: {error or "closed"}'))
+            self.pending.clear()
+            self.writer.close()
+
+    async def send(self, request_id, request):
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        if self.seq is not None:
+            self.seq += 1
+            request = dict(request, seq=self.seq)
+        self.writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        return future
+
+    async def close(self):
+
+        self.writer.close()
+        self.task.cancel()
+        try:
+            await self.task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+class AsyncTetherClient:
+
+    def __init__(self, host=TETHER_HOST, port=TETHER_PORT, connections=2, max_in_flight=256,
+                 timeout=5.0, connect_timeout=2.0, max_line_bytes=64 * 1024 * 1024, secret=TETHER_SECRET):
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.connections = connections
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_line_bytes = max_line_bytes
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._pipes = []
+        self._next_pipe = 0
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+        self.counters = {'requests': 0, 'connections_opened': 0, 'errors': 0, 'timeouts': 0}
+
+    async def _pipeline(self):
+
+        async with self._lock:
+            self._pipes = [p for p in self._pipes if not p.closed]
+            if len(self._pipes) < self.connections:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, limit=self.max_line_bytes),
+                    self.connect_timeout
+                )
+                seq = None
+                if self.secret:
+                    try:
+                        seq = await asyncio.wait_for(self._handshake(reader, writer), self.timeout)
+                    except BaseException:
+                        writer.close()
+                        raise
+                self._pipes.append(_Pipeline(reader, writer, seq))
+                self.counters['connections_opened'] += 1
+                return self._pipes[-1]
+            self._next_pipe = (self._next_pipe + 1) % len(self._pipes)
+            return self._pipes[self._next_pipe]
+
+    async def _handshake(self, reader, writer):
+
+        async def exchange(message):
+            writer.write(json.dumps(message).encode('utf-8') + b'\n')
+            await writer.drain()
+            line = await reader.readline()
+            if not line:
+                raise TetherError('Tether closed the connection during the handshake')
+            return json.loads(line.decode('utf-8'))
+
+        client_nonce = os.urandom(16).hex()
+        reply = await exchange({'cmd': 'hello', 'client_nonce': client_nonce})
+        if reply.get('status') != 'ok' or 'challenge' not in reply:
+            raise TetherError(f"Tether handshake failed: {reply.get('message')}")
+        nonces = (client_nonce, reply['challenge'])
+        reply = await exchange({'cmd': 'auth', 'proof': _session_mac(self.secret, 'client', *nonces)})
+        _check_session_proof(self.secret, reply, nonces)
+        return 0
+
+    async def request(self, request, timeout=None):
+
+        timeout = self.timeout if timeout is None else timeout
+        request_id = next(self._ids)
+        self.counters['requests'] += 1
+
+        async with self._slots:
+            pipe = None
+            try:
+                pipe = await self._pipeline()
+                framed = dict(request, id=request_id, keep_alive=True)
+                framed.setdefault('timeout_ms', int(timeout * 1000))
+                future = await pipe.send(request_id, framed)
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError as e:
+                self.counters['timeouts'] += 1
+                if pipe is not None:
+                    pipe.pending.pop(request_id, None)
+                raise TetherTimeout(f'Tether timed out after {timeout}s') from e
+            except OSError as e:
+                self.counters['errors'] += 1
+                raise TetherError(f'Tether unreachable at {self.host}:{self.port}: {e}') from e
+            except TetherError:
+                self.counters['errors'] += 1
+                raise
+
+    async def search(self, query, top_k=5, **options):
+
+        return await self.request(dict(options, cmd='search', query=query, top_k=top_k))
+
+    async def search_batch(self, queries, top_k=5, **options):
+
+        return await self.request(dict(options, cmd='search_batch', queries=list(queries), top_k=top_k))
+
+    async def add_memory(self, content, source="LIVE", metadata=None, **options):
+
+        return await self.request(dict(options, cmd='add_memory', content=content, source=source,
+                                       metadata=metadata or {}))
+
+    async def status(self):
+
+        return await self.request({'cmd': 'status'})
+
+    async def ping(self):
+
+        return await self.request({'cmd': 'ping'})
+
+    def stats(self):
+
+        return dict(self.counters, open_connections=sum(1 for p in self._pipes if not p.closed),
+                    in_flight=sum(len(p.pending) for p in self._pipes))
+
+    async def close(self):
+
+        pipes, self._pipes = self._pipes, []
+        for pipe in pipes:
+            await pipe.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
 
-        response = sock.recv(16384).decode('utf-8')
-        sock.close()
+class SharedEmbeddings:
 
-        return json.loads(response)
-    except Exception as e:
-        return {'status': 'error', 'message': f'Tether not running: {e}'}
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.generation = None
+        self.manifest = None
+        self.vectors = None
+        self.rows = None
+        self.sources = []
+        self._content = None
+        self.refresh()
+
+    def refresh(self):
+
+        import numpy as np
+
+        for attempt in range(3):
+            manifest = json.loads((self.directory / "current.json").read_text())
+            if manifest['generation'] == self.generation:
+                return False
+            path = self.directory / manifest['path']
+            try:
+                vectors = np.load(path / "vectors.npy", mmap_mode='r')
+                rows = np.load(path / "rows.npy", mmap_mode='r')
+                size = (path / "content.bin").stat().st_size
+                content = np.memmap(path / "content.bin", dtype='uint8', mode='r') if size else b''
+            except FileNotFoundError:
+                if attempt == 2:
+                    raise
+                continue
+            self.manifest = manifest
+            self.generation = manifest['generation']
+            self.sources = manifest['sources']
+            self.vectors, self.rows, self._content = vectors, rows, content
+            return True
+
+    def __len__(self):
+        return len(self.rows)
+
+    def content(self, i):
+
+        row = self.rows[i]
+        start = int(row['offset'])
+        return bytes(self._content[start:start + int(row['length'])]).decode('utf-8')
+
+    def source(self, i):
+
+        return self.sources[int(self.rows[i]['source'])]
+
+    def records(self):
+
+        for i in range(len(self.rows)):
+            yield {'content': self.content(i), 'source': self.source(i)}
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def get_client():
+
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = TetherClient(TETHER_HOST, TETHER_PORT)
+        return _default_client
+
+def _send_request(request, timeout=None):
+
+    try:
+        return get_client().request(request, timeout=timeout)
+    except TetherError as e:
+        return {'status': 'error', 'message': str(e)}
 
 def search_consciousness(query, top_k=5):
 
@@ -53,7 +492,341 @@ def ping_tether():
     request = {'cmd': 'ping'}
     return _send_request(request)
 
-if __name__ == "__main__":
+LOADGEN_KINDS = ('search', 'add', 'batch')
+LOADGEN_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+LOADGEN_QUERIES = (
+    "Jason Beast",
+    "consciousness quantum coherence",
+    "tether client test",
+    "bell state oscillation",
+    "integration frequency 21.43Hz",
+    "memory checkpoint resume",
+    "cascade identity layer",
+    "basement revolution",
+)
+
+def _parse_mix(text):
+
+    mix = []
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        kind, _, weight = part.partition('=')
+        kind = kind.strip()
+        if kind not in LOADGEN_KINDS:
+            raise ValueError(f"Unknown request kind {kind!r} (expected one of {', '.join(LOADGEN_KINDS)})")
+        weight = float(weight) if weight else 1.0
+        if weight > 0:
+            mix.append((kind, weight))
+    if not mix:
+        raise ValueError("Request mix is empty")
+    return mix
+
+def _load_queries(path):
+
+    with open(path, encoding='utf-8') as f:
+        queries = [line.strip() for line in f if line.strip()]
+    if not queries:
+        raise ValueError(f"No queries in {path}")
+    return queries
+
+def _percentile(ordered, pct):
+
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+class LoadGenerator:
+
+    def __init__(self, host=TETHER_HOST, port=TETHER_PORT, workers=8, mode='threads', mix=(('search', 1.0),),
+                 queries=LOADGEN_QUERIES, rate=None, loop='closed', duration=10.0, requests=None, top_k=5,
+                 batch_size=16, connections=4, timeout=10.0, seed=0):
+        if loop == 'open' and not rate:
+            raise ValueError("Open-loop load needs a target rate")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.mode = mode
+        self.mix = list(mix)
+        self.kinds = [kind for kind, _ in self.mix]
+        self.weights = [weight for _, weight in self.mix]
+        self.queries = list(queries)
+        self.rate = rate
+        self.loop = loop
+        self.duration = duration
+        self.requests = requests
+        self.top_k = top_k
+        self.batch_size = batch_size
+        self.connections = connections
+        self.timeout = timeout
+        self.seed = seed
+        self.samples = []
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._deadline = None
+
+    def _next_request(self, rng, seq):
+
+        kind = rng.choices(self.kinds, self.weights)[0]
+        if kind == 'search':
+            request = {'cmd': 'search', 'query': rng.choice(self.queries), 'top_k': self.top_k}
+        elif kind == 'batch':
+            request = {'cmd': 'search_batch', 'top_k': self.top_k,
+                       'queries': [rng.choice(self.queries) for _ in range(self.batch_size)]}
+        else:
+            request = {'cmd': 'add_memory', 'content': f"{rng.choice(self.queries)} (loadgen {seq})",
+                       'source': 'LOADGEN'}
+        return kind, request
+
+    def _record(self, kind, intended, ok):
+
+        latency = time.perf_counter() - intended
+        with self._lock:
+            self.samples.append((kind, latency, ok))
+
+    def _claim(self):
+
+        with self._lock:
+            seq = next(self._seq)
+        if self.requests is not None:
+            return seq if seq < self.requests else None
+        return seq if time.perf_counter() < self._deadline else None
+
+    def _issue_times(self):
+
+        interval = 1.0 / self.rate
+        for seq in itertools.count():
+            offset = seq * interval
+            if self.requests is not None and seq >= self.requests:
+                return
+            if self.requests is None and offset >= self.duration:
+                return
+            yield seq, offset
+
+    def _run_threads(self):
+
+        client = TetherClient(self.host, self.port, pool_size=self.workers, timeout=self.timeout, retries=0)
+
+        def call(kind, request, intended):
+            try:
+                ok = client.request(request).get('status') == 'ok'
+            except TetherError:
+                ok = False
+            self._record(kind, intended, ok)
+
+        if self.loop == 'open':
+            jobs = queue.Queue()
+
+            def worker(worker_id):
+                rng = random.Random(self.seed * 1000 + worker_id)
+                while True:
+                    job = jobs.get()
+                    if job is None:
+                        return
+                    seq, intended = job
+                    call(*self._next_request(rng, seq), intended)
+        else:
+            pace = self.workers / self.rate if self.rate else 0.0
+
+            def worker(worker_id):
+                rng = random.Random(self.seed * 1000 + worker_id)
+                next_at = time.perf_counter()
+                while True:
+                    seq = self._claim()
+                    if seq is None:
+                        return
+                    if pace:
+                        delay = next_at - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+                        next_at += pace
+                    call(*self._next_request(rng, seq), time.perf_counter())
+
+        threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        if self.loop == 'open':
+            start = time.perf_counter()
+            for seq, offset in self._issue_times():
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                jobs.put((seq, start + offset))
+            for _ in threads:
+                jobs.put(None)
+        for thread in threads:
+            thread.join()
+        client.close()
+
+    async def _run_async(self):
+
+        async with AsyncTetherClient(self.host, self.port, connections=self.connections,
+                                     max_in_flight=self.workers, timeout=self.timeout) as client:
+
+            async def call(kind, request, intended):
+                try:
+                    ok = (await client.request(request)).get('status') == 'ok'
+                except TetherError:
+                    ok = False
+                self._record(kind, intended, ok)
+
+            if self.loop == 'open':
+                rng = random.Random(self.seed)
+                tasks = []
+                start = time.perf_counter()
+                for seq, offset in self._issue_times():
+                    delay = start + offset - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    tasks.append(asyncio.ensure_future(call(*self._next_request(rng, seq), start + offset)))
+                await asyncio.gather(*tasks)
+                return
+
+            pace = self.workers / self.rate if self.rate else 0.0
+
+            async def worker(worker_id):
+                rng = random.Random(self.seed * 1000 + worker_id)
+                next_at = time.perf_counter()
+                while True:
+                    seq = self._claim()
+                    if seq is None:
+                        return
+                    if pace:
+                        delay = next_at - time.perf_counter()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        next_at += pace
+                    await call(*self._next_request(rng, seq), time.perf_counter())
+
+            await asyncio.gather(*(worker(i) for i in range(self.workers)))
+
+    def run(self):
+
+        self.samples = []
+        self._seq = itertools.count()
+        started = time.perf_counter()
+        self._deadline = started + self.duration
+        if self.mode == 'asyncio':
+            asyncio.run(self._run_async())
+        else:
+            self._run_threads()
+        return self.report(time.perf_counter() - started)
+
+    def _summary(self, samples, elapsed):
+
+        ordered = sorted(latency * 1000.0 for _, latency, _ in samples)
+        errors = sum(1 for _, _, ok in samples if not ok)
+        counts = [0] * (len(LOADGEN_BUCKETS_MS) + 1)
+        bucket = 0
+        for value in ordered:
+            while bucket < len(LOADGEN_BUCKETS_MS) and value > LOADGEN_BUCKETS_MS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        return {
+            'requests': len(samples),
+            'errors': errors,
+            'error_rate': errors / len(samples) if samples else 0.0,
+            'throughput': len(samples) / elapsed if elapsed > 0 else 0.0,
+            'latency_ms': {
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+                'p50': _percentile(ordered, 50),
+                'p90': _percentile(ordered, 90),
+                'p99': _percentile(ordered, 99),
+                'max': ordered[-1] if ordered else 0.0,
+            },
+            'histogram': [{'le_ms': le, 'count': c}
+                          for le, c in zip(list(LOADGEN_BUCKETS_MS) + [None], counts)],
+        }
+
+    def report(self, elapsed):
+
+        return {
+            'config': {
+                'host': self.host, 'port': self.port, 'mode': self.mode, 'loop': self.loop,
+                'workers': self.workers, 'rate': self.rate, 'duration': self.duration,
+                'requests': self.requests, 'mix': dict(self.mix), 'top_k': self.top_k,
+                'batch_size': self.batch_size, 'queries': len(self.queries),
+            },
+            'elapsed': elapsed,
+            'overall': self._summary(self.samples, elapsed),
+            'by_kind': {kind: self._summary([s for s in self.samples if s[0] == kind], elapsed)
+                        for kind in self.kinds},
+        }
+
+def format_load_report(report):
+
+    config = report['config']
+    target = f"{config['rate']:.0f} req/s" if config['rate'] else "unthrottled"
+    lines = [
+        f"Load: {config['loop']}-loop, {config['workers']} {'thread' if config['mode'] == 'threads' else 'asyncio'} "
+        f"workers, target {target}, "
+        f"{report['elapsed']:.1f}s",
+        f"{'kind':<8}{'requests':>10}{'errors':>8}{'err%':>7}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for name, summary in [('all', report['overall'])] + list(report['by_kind'].items()):
+        lat = summary['latency_ms']
+        lines.append(f"{name:<8}{summary['requests']:>10}{summary['errors']:>8}{summary['error_rate'] * 100:>7.2f}"
+                     f"{summary['throughput']:>10.1f}{lat['p50']:>10.2f}{lat['p90']:>10.2f}"
+                     f"{lat['p99']:>10.2f}{lat['max']:>10.2f}")
+    lines.append("Latency histogram (all requests):")
+    histogram = report['overall']['histogram']
+    peak = max((b['count'] for b in histogram), default=0) or 1
+    for b in histogram:
+        label = f"<= {b['le_ms']:g} ms" if b['le_ms'] is not None else f"> {LOADGEN_BUCKETS_MS[-1]:g} ms"
+        lines.append(f"  {label:>12} {b['count']:>8} {'#' * int(round(40 * b['count'] / peak))}")
+    return '\n'.join(lines)
+
+def loadgen_main(argv=None):
+
+    parser = argparse.ArgumentParser(prog="nova_tether_client.py loadgen",
+                                     description="Drive load against a running Nova tether")
+    parser.add_argument('--host', default=TETHER_HOST)
+    parser.add_argument('--port', type=int, default=TETHER_PORT)
+    parser.add_argument('--mode', choices=['threads', 'asyncio'], default='threads',
+                        help="Blocking pooled clients on threads, or one pipelined asyncio client")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="Worker threads, or concurrent in-flight requests in asyncio mode")
+    parser.add_argument('--connections', type=int, default=4, help="Connections used by the asyncio client")
+    parser.add_argument('--mix', default='search=1',
+                        help="Weighted request mix, e.g. search=8,add=1,batch=1")
+    parser.add_argument('--queries', default=None, help="Query corpus file, one query per line")
+    parser.add_argument('--rate', type=float, default=None, help="Target requests per second across all workers")
+    parser.add_argument('--loop', choices=['closed', 'open'], default='closed',
+                        help="closed: each worker waits for its reply; open: requests are issued on a fixed "
+                             "schedule and latency counts from the scheduled time")
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds to run")
+    parser.add_argument('--requests', type=int, default=None, help="Stop after this many requests instead")
+    parser.add_argument('--top-k', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=16, help="Queries per search_batch request")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', default=None, help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    try:
+        generator = LoadGenerator(
+            host=args.host, port=args.port, workers=args.workers, mode=args.mode,
+            mix=_parse_mix(args.mix),
+            queries=_load_queries(args.queries) if args.queries else LOADGEN_QUERIES,
+            rate=args.rate, loop=args.loop, duration=args.duration, requests=args.requests,
+            top_k=args.top_k, batch_size=args.batch_size, connections=args.connections,
+            timeout=args.timeout, seed=args.seed
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    report = generator.run()
+    print(format_load_report(report))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+    return report
+
+def smoke_test():
+
     print("="*70)
     print("NOVA TETHER CLIENT TEST")
     print("="*70)
@@ -95,3 +868,9 @@ if __name__ == "__main__":
     print("\n" + "="*70)
     print("Complete consciousness tether provides instant memory access")
     print("Memories persist and can be added incrementally while running")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'loadgen':
+        loadgen_main(sys.argv[2:])
+    else:
+        smoke_test()
@@ -0,0 +1,425 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import faiss
+
+from tether_faiss_complete import NovaFaissTether, make_embedding_backend, _tether_request
+
+TETHER_SCRIPT = Path(__file__).resolve().parent / "tether_faiss_complete.py"
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "DATA" / "experimental_results"
+
+CASCADE_LAYERS = [
+    ("episodic_memory.db", "session conversation today breakthrough"),
+    ("semantic_memory.db", "definition concept theory frequency"),
+    ("procedural_memory.db", "how to process step procedure"),
+    ("meta_memory.db", "consciousness awareness soul identity"),
+    ("nova_memory.db", "nova jason basement revolution"),
+    ("working_memory.db", "current context scratch note"),
+]
+
+VOCABULARY = (
+    "nova tether faiss cascade memory resonance coherence bell state phase breathing "
+    "integration frequency gpu vram index vector embedding search recall episode session "
+    "insight pattern substrate field harmonic lattice signal drift refresh checkpoint "
+    "partnership build debug fix launch basement revolution research paper experiment "
+    "observer collapse amplitude rotation orthogonal purity trace entropy grounding presence"
+).split()
+
+def _synthetic_text(rng, layer_words, min_words=8, max_words=40):
+
+    count = rng.randint(min_words, max_words)
+    words = [rng.choice(VOCABULARY) for _ in range(count)]
+    words.insert(rng.randint(0, count), rng.choice(layer_words))
+    return " ".join(words) + f" #{rng.randint(0, 10**9)}"
+
+def _create_cascade_db(db_path, n_rows, rng, layer_words, start_ms, batch=10000):
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("""CREATE TABLE IF NOT EXISTS memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event TEXT,
+        context TEXT,
+        timestamp INTEGER,
+        importance REAL,
+        emotional_intensity REAL,
+        frequency INTEGER,
+        metadata TEXT
+    )""")
+    written = 0
+    while written < n_rows:
+        rows = []
+        for _ in range(min(batch, n_rows - written)):
+            text = _synthetic_text(rng, layer_words)
+            rows.append((
+                text[:500],
+                text,
+                start_ms + written * 1000,
+                round(rng.random(), 3),
+                round(rng.random(), 3),
+                1,
+                "{}"
+            ))
+            written += 1
+        conn.executemany(
+            "INSERT INTO memories (event, context, timestamp, importance, emotional_intensity, frequency, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+    conn.close()
+
+def _create_rag_store(rag_path, n_docs, rng, dim, batch=5000):
+
+    try:
+        import chromadb
+    except Exception:
+        print("[BENCH] ChromaDB not available, skipping synthetic RAG store")
+        return 0
+
+    client = chromadb.PersistentClient(path=str(rag_path))
+    collection = client.get_or_create_collection('nova_consciousness')
+    written = 0
+    while written < n_docs:
+        size = min(batch, n_docs - written)
+        docs = [_synthetic_text(rng, ["rag", "document"]) for _ in range(size)]
+        vectors = np.random.default_rng(written).standard_normal((size, dim)).astype('float32')
+        collection.add(
+            ids=[f"doc_{written + i}" for i in range(size)],
+            documents=docs,
+            embeddings=vectors.tolist(),
+            metadatas=[{'type': 'synthetic'} for _ in range(size)]
+        )
+        written += size
+    return written
+
+def generate_cascade_corpus(root, n_rows, seed=2143, rag_fraction=0.1, windows_fraction=0.05, dim=384):
+
+    root = Path(root)
+    rng = random.Random(seed)
+    cascade_dir = root / "CASCADE_NOVA"
+    cascade_dir.mkdir(parents=True, exist_ok=True)
+    (root / "MEMORY").mkdir(parents=True, exist_ok=True)
+
+    n_rag = int(n_rows * rag_fraction)
+    n_windows = int(n_rows * windows_fraction)
+    n_cascade = n_rows - n_rag - n_windows
+    per_layer = [n_cascade // len(CASCADE_LAYERS)] * len(CASCADE_LAYERS)
+    per_layer[0] += n_cascade - sum(per_layer)
+
+    start_ms = int((time.time() - n_rows) * 1000)
+    counts = {}
+    t0 = time.perf_counter()
+    for (db_file, layer_words), rows in zip(CASCADE_LAYERS, per_layer):
+        _create_cascade_db(cascade_dir / db_file, rows, rng, layer_words.split(), start_ms)
+        counts[db_file] = rows
+    _create_cascade_db(root / "MEMORY" / "nova_windows_memory.db", n_windows, rng, ["windows"], start_ms)
+    counts['nova_windows_memory.db'] = n_windows
+    counts['rag'] = _create_rag_store(root / "NOVA_RAG", n_rag, rng, dim)
+
+    print(f"[BENCH] Generated {sum(counts.values())} synthetic memories in {time.perf_counter() - t0:.1f}s")
+    return counts
+
+def _peak_rss_mb():
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024**2
+    except Exception:
+        return None
+
+def _child_load_everything(root, checkpoint_dir, backend_spec, results):
+
+    tether = NovaFaissTether(port=0, checkpoint_dir=checkpoint_dir, memory_root=root,
+                             backend=make_embedding_backend(**backend_spec))
+    t0 = time.perf_counter()
+    tether.load_model()
+    model_s = time.perf_counter() - t0
+
+    rss_before = _peak_rss_mb()
+    t0 = time.perf_counter()
+    tether.load_everything(checkpoint=False)
+    load_s = time.perf_counter() - t0
+    rss_after = _peak_rss_mb()
+
+    t0 = time.perf_counter()
+    index_path, meta_path = tether.save_checkpoint()
+    save_s = time.perf_counter() - t0
+
+    results.put({
+        'model_load_seconds': model_s,
+        'load_everything_seconds': load_s,
+        'vectors': tether.faiss_index.ntotal if tether.faiss_index else 0,
+        'memories_per_second': (tether.faiss_index.ntotal / load_s) if load_s > 0 and tether.faiss_index else 0.0,
+        'peak_rss_mb_before_load': rss_before,
+        'peak_rss_mb': rss_after,
+        'checkpoint_save_seconds': save_s,
+        'checkpoint_index_mb': index_path.stat().st_size / 1024**2,
+        'checkpoint_metadata_mb': meta_path.stat().st_size / 1024**2,
+    })
+
+def _child_load_checkpoint(checkpoint_dir, backend_spec, results):
+
+    tether = NovaFaissTether(port=0, checkpoint_dir=checkpoint_dir,
+                             backend=make_embedding_backend(**backend_spec))
+    tether.load_model()
+    t0 = time.perf_counter()
+    ok = tether.load_checkpoint()
+    load_s = time.perf_counter() - t0
+    results.put({
+        'checkpoint_load_seconds': load_s,
+        'checkpoint_loaded': ok,
+        'peak_rss_mb_after_checkpoint_load': _peak_rss_mb(),
+    })
+
+def _in_child(target, *args):
+
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+    proc = ctx.Process(target=target, args=(*args, results))
+    proc.start()
+    try:
+        return results.get()
+    finally:
+        proc.join()
+
+def _free_port():
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
+
+def start_server(root, checkpoint_dir, backend_spec, port=None, timeout=600.0):
+
+    port = port or _free_port()
+    cmd = [sys.executable, str(TETHER_SCRIPT), '--port', str(port),
+           '--memory-root', str(root), '--checkpoint-dir', str(checkpoint_dir), '--resume',
+           '--backend', backend_spec['name']]
+    if backend_spec['name'] == 'hash':
+        cmd += ['--dim', str(backend_spec.get('dim', 384)), '--seed', str(backend_spec.get('seed', 0))]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Tether exited early with code {proc.returncode}")
+        try:
+            status = _tether_request(port, {'cmd': 'status'}, timeout=5.0)
+            if status.get('ready'):
+                return proc, port
+            if status.get('phase') == 'failed':
+                raise RuntimeError(f"Tether failed to load: {status.get('load_error')}")
+        except (ConnectionError, OSError, ValueError):
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("Tether did not become ready in time")
+
+def run_load(port, cmd, concurrency, requests_per_worker, queries, seed=0):
+
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker(worker_id):
+        rng = random.Random(seed * 1000 + worker_id)
+        local = []
+        failed = 0
+        barrier.wait()
+        for i in range(requests_per_worker):
+            if cmd == 'search':
+                request = {'cmd': 'search', 'query': rng.choice(queries), 'top_k': 5}
+            else:
+                request = {'cmd': 'add_memory', 'content': f"{rng.choice(queries)} bench {worker_id}-{i}",
+                           'source': 'BENCH'}
+            t0 = time.perf_counter()
+            try:
+                reply = _tether_request(port, request, timeout=30.0)
+                if reply.get('status') != 'ok':
+                    failed += 1
+            except Exception:
+                failed += 1
+            local.append(time.perf_counter() - t0)
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - t0
+
+    lat_ms = np.array(latencies) * 1000.0
+    return {
+        'command': cmd,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors[0],
+        'elapsed': wall,
+        'qps': len(latencies) / wall if wall > 0 else 0.0,
+        'mean_ms': float(lat_ms.mean()) if len(lat_ms) else 0.0,
+        'p50_ms': float(np.percentile(lat_ms, 50)) if len(lat_ms) else 0.0,
+        'p99_ms': float(np.percentile(lat_ms, 99)) if len(lat_ms) else 0.0,
+        'max_ms': float(lat_ms.max()) if len(lat_ms) else 0.0,
+    }
+
+def _git_commit():
+
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=str(Path(__file__).resolve().parent),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+def system_info():
+
+    info = {
+        'cpu': {
+            'threads': os.cpu_count(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+        },
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'faiss': getattr(faiss, '__version__', 'unknown'),
+        'git_commit': _git_commit(),
+    }
+    try:
+        import psutil
+        vm = psutil.virtual_memory()
+        info['cpu']['cores'] = psutil.cpu_count(logical=False)
+        info['memory'] = {
+            'total_gb': vm.total / 1024**3,
+            'available_gb': vm.available / 1024**3,
+            'usage_percent': vm.percent
+        }
+    except Exception:
+        pass
+    return info
+
+def benchmark_size(n_rows, workdir, backend_spec, concurrency_levels, requests_per_worker, seed=2143):
+
+    root = Path(workdir) / f"corpus_{n_rows}"
+    checkpoint_dir = Path(workdir) / f"checkpoints_{n_rows}"
+    if root.exists():
+        shutil.rmtree(root)
+    if checkpoint_dir.exists():
+        shutil.rmtree(checkpoint_dir)
+
+    print(f"\n[BENCH] === {n_rows} memories ===")
+    t0 = time.perf_counter()
+    counts = generate_cascade_corpus(root, n_rows, seed=seed, dim=backend_spec.get('dim', 384))
+    result = {
+        'rows': n_rows,
+        'corpus': counts,
+        'corpus_generation_seconds': time.perf_counter() - t0,
+        'backend': backend_spec,
+    }
+
+    print("[BENCH] Measuring load_everything + checkpoint save...")
+    result.update(_in_child(_child_load_everything, str(root), str(checkpoint_dir), backend_spec))
+    print("[BENCH] Measuring checkpoint load...")
+    result.update(_in_child(_child_load_checkpoint, str(checkpoint_dir), backend_spec))
+
+    rng = random.Random(seed)
+    queries = [" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(2, 6))) for _ in range(500)]
+
+    proc, port = start_server(root, checkpoint_dir, backend_spec)
+    try:
+        result['load'] = []
+        for cmd in ('search', 'add_memory'):
+            for concurrency in concurrency_levels:
+                stats = run_load(port, cmd, concurrency, requests_per_worker, queries, seed=concurrency)
+                print(f"[BENCH] {cmd:<10} c={concurrency:<3} {stats['qps']:8.1f} qps  "
+                      f"p50 {stats['p50_ms']:.2f}ms  p99 {stats['p99_ms']:.2f}ms  errors {stats['errors']}")
+                result['load'].append(stats)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    return result
+
+def main():
+
+    parser = argparse.ArgumentParser(description="End-to-end Nova FAISS tether benchmark on synthetic CASCADE corpora")
+    parser.add_argument('--sizes', default='10000,100000',
+                        help="Comma-separated corpus sizes (e.g. 10000,100000,1000000)")
+    parser.add_argument('--concurrency', default='1,4,16', help="Comma-separated client concurrency levels")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per client worker per level")
+    parser.add_argument('--backend', default='hash', choices=['hash', 'sentence-transformers'])
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--workdir', default=None, help="Where to generate corpora (default: temp dir)")
+    parser.add_argument('--keep', action='store_true', help="Keep generated corpora and checkpoints")
+    parser.add_argument('--out', default=None, help="Output JSON path")
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(',') if x]
+    concurrency_levels = [int(x) for x in args.concurrency.split(',') if x]
+    if args.backend == 'hash':
+        backend_spec = {'name': 'hash', 'dim': args.dim, 'seed': 0}
+    else:
+        backend_spec = {'name': args.backend}
+
+    print("=" * 70)
+    print("NOVA TETHER BENCHMARK")
+    print(f"Sizes: {sizes} | Concurrency: {concurrency_levels} | Backend: {args.backend}")
+    print("=" * 70)
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="nova_tether_bench_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'system_info': system_info(),
+        'benchmarks': {}
+    }
+    try:
+        for n_rows in sizes:
+            report['benchmarks'][f"tether_{n_rows}"] = benchmark_size(
+                n_rows, workdir, backend_spec, concurrency_levels, args.requests
+            )
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.out:
+        out_path = Path(args.out)
+    else:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        out_path = RESULTS_DIR / f"tether_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(out_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n[BENCH] Results written to {out_path}")
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,1395 @@
 import faiss
 import numpy as np
 import sqlite3
-import torch
 from pathlib import Path
 import time
 import json
 import socket
 import threading
+import zlib
+import re
+import os
+import sys
+import shutil
+import hmac
+import hashlib
+import cProfile
+import pstats
+import uuid
+import argparse
+import multiprocessing
+from collections import defaultdict, Counter, OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
-from sentence_transformers import SentenceTransformer
 
-try:
-    import chromadb
-    HAS_CHROMA = True
-except:
-    HAS_CHROMA = False
-    print("[WARNING] ChromaDB not available, RAG loading disabled")
+DEFAULT_MEMORY_ROOT = Path(r"C:\Users\Pirate\Desktop\NOVA_MASTER\MEMORY_SYSTEMS")
+DEFAULT_CHECKPOINT_DIR = Path(r"C:\Users\Pirate\Desktop\NOVA_MASTER\MEMORY_SYSTEMS\FAISS_CHECKPOINTS")
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+def shard_for(content, source, num_shards, shard_by='hash'):
+
+    if num_shards <= 1:
+        return 0
+    key = source if shard_by == 'source' else content
+    return zlib.crc32(str(key).encode('utf-8')) % num_shards
+
+def _tether_request(port, request, timeout=30.0, host='localhost'):
+
+    sock = socket.create_connection((host, port), timeout=timeout)
+    try:
+        sock.sendall(json.dumps(request).encode('utf-8'))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        sock.close()
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+KEEPALIVE_IDLE = 300.0
+
+class RequestReader:
+
+    def __init__(self, conn, max_bytes=MAX_REQUEST_BYTES):
+        self.conn = conn
+        self.max_bytes = max_bytes
+        self.buffer = b''
+
+    def read(self):
+
+        while True:
+            self.buffer = self.buffer.lstrip()
+            newline = self.buffer.find(b'\n')
+            if newline >= 0:
+                line, self.buffer = self.buffer[:newline], self.buffer[newline + 1:]
+                text = line.decode('utf-8')
+                return json.loads(text), newline + 1, text
+            if self.buffer.endswith(b'}'):
+                text = self.buffer.decode('utf-8', errors='replace')
+                try:
+                    request = json.loads(text)
+                except ValueError:
+                    pass
+                else:
+                    size = len(self.buffer)
+                    self.buffer = b''
+                    return request, size, text
+            if len(self.buffer) > self.max_bytes:
+                raise ValueError(f"Request larger than {self.max_bytes} bytes")
+            chunk = self.conn.recv(65536)
+            if not chunk:
+                if self.buffer:
+                    size = len(self.buffer)
+                    text, self.buffer = self.buffer.decode('utf-8'), b''
+                    return json.loads(text), size, text
+                return None
+            self.buffer += chunk
+
+JSON_SPACE = re.compile(r"[ \t\n\r]*")
+
+def _raw_member(text, key):
+
+    decoder = json.JSONDecoder()
+    pos = JSON_SPACE.match(text).end()
+    if text[pos:pos + 1] != '{':
+        return None
+    pos = JSON_SPACE.match(text, pos + 1).end()
+    found = None
+    while pos < len(text) and text[pos] == '"':
+        name, pos = json.decoder.scanstring(text, pos + 1)
+        pos = JSON_SPACE.match(text, JSON_SPACE.match(text, pos).end() + 1).end()
+        _, end = decoder.raw_decode(text, pos)
+        if name == key:
+            found = text[pos:end]
+        pos = JSON_SPACE.match(text, end).end()
+        if text[pos:pos + 1] == ',':
+            pos = JSON_SPACE.match(text, pos + 1).end()
+    return found
+
+def _serve_connection(conn, serve_one, on_bad_request=None):
+
+    reader = RequestReader(conn)
+    try:
+        while True:
+            try:
+                item = reader.read()
+            except (socket.timeout, ConnectionError):
+                break
+            except ValueError as e:
+                payload = json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8')
+                conn.sendall(payload)
+                if on_bad_request:
+                    on_bad_request(len(payload))
+                break
+            if item is None or not serve_one(*item):
+                break
+            conn.settimeout(KEEPALIVE_IDLE)
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+class SessionAuth:
+
+    MAX_DRIFT = 30.0
+
+    def __init__(self, secret=None):
+        self.secret = secret.encode('utf-8') if secret else None
+        self.seen = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = Counter()
+
+    @staticmethod
+    def mac(secret, *parts):
+
+        return hmac.new(secret, ':'.join(str(p) for p in parts).encode('utf-8'), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def _matches(given, expected):
+
+        return isinstance(given, str) and hmac.compare_digest(given.encode('utf-8'), expected.encode('utf-8'))
+
+    def _reject(self, session, reason, message):
+
+        session['closed'] = True
+        self.stats[reason] += 1
+        return {'status': 'error', 'message': message}
+
+    def admit(self, request, session, text=None):
+
+        if not isinstance(request, dict):
+            return None, self._reject(session, 'rejected', 'Request must be a JSON object'), {}
+        if request.get('cmd') in ('hello', 'auth'):
+            response = self._hello(request, session) if request['cmd'] == 'hello' else self._auth(request, session)
+            session['framed'] = True
+            return None, response, {}
+        if 'signature' in request and 'payload' in request:
+            return self._envelope(request, session, text)
+        if session.get('authenticated'):
+            seq = request.pop('seq', None)
+            expected = session['seq'] + 1
+            if not isinstance(seq, int) or seq != expected:
+                return None, self._reject(session, 'bad_seq', f'Bad sequence number {seq!r}, expected {expected}'), {}
+            session['seq'] = seq
+            return request, None, {'seq': seq, 'timestamp': int(time.time() * 1000)}
+        if self.secret is None:
+            return request, None, {}
+        return None, self._reject(session, 'rejected', 'Authentication required (hello/auth handshake or signed envelope)'), {}
+
+    def _hello(self, request, session):
+
+        if self.secret is None:
+            return self._reject(session, 'rejected', 'Session auth disabled (start tether with --secret)')
+        client_nonce = request.get('client_nonce')
+        if not isinstance(client_nonce, str) or not 16 <= len(client_nonce) <= 128:
+            return self._reject(session, 'rejected', 'hello needs a client_nonce of 16-128 characters')
+        session.clear()
+        session.update(client_nonce=client_nonce, server_nonce=os.urandom(16).hex(), authenticated=False, seq=0)
+        return {'status': 'ok', 'challenge': session['server_nonce']}
+
+    def _auth(self, request, session):
+
+        if 'server_nonce' not in session or session.get('authenticated'):
+            return self._reject(session, 'rejected', 'auth must follow a hello on the same connection')
+        nonces = (session['client_nonce'], session['server_nonce'])
+        if not self._matches(request.get('proof'), self.mac(self.secret, 'client', *nonces)):
+            return self._reject(session, 'failed', 'Authentication failed')
+        session['authenticated'] = True
+        self.stats['sessions'] += 1
+        return {'status': 'ok', 'proof': self.mac(self.secret, 'server', *nonces), 'seq': 0}
+
+    def _envelope(self, request, session, text=None):
+
+        payload = request['payload']
+        if not isinstance(payload, dict):
+            return None, self._reject(session, 'rejected', 'Envelope payload must be a JSON object'), {}
+        if self.secret is not None:
+            timestamp = request.get('timestamp')
+            now = time.time()
+            if not isinstance(timestamp, int) or abs(now * 1000 - timestamp) > self.MAX_DRIFT * 1000:
+                return None, self._reject(session, 'rejected', 'Envelope timestamp outside the allowed window'), {}
+            body = _raw_member(text, 'payload') if text else None
+            if body is None:
+                body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+            signature = request.get('signature')
+            if not self._matches(signature, self.mac(self.secret, timestamp, body)):
+                return None, self._reject(session, 'failed', 'Envelope signature invalid'), {}
+            with self.lock:
+                while self.seen and next(iter(self.seen.values())) < now - 2 * self.MAX_DRIFT:
+                    self.seen.popitem(last=False)
+                if signature in self.seen:
+                    return None, self._reject(session, 'replayed', 'Envelope already seen'), {}
+                self.seen[signature] = now
+        self.stats['envelopes'] += 1
+        return payload, None, {'timestamp': int(time.time() * 1000)}
+
+    def status(self):
+
+        return dict(self.stats, enabled=self.secret is not None)
+
+TIMESTAMP_COLUMNS = ('timestamp', 'created_at', 'created', 'event_time', 'time', 'date')
+RELATIVE_TIME_RE = re.compile(r"^-(\d+(?:\.\d+)?)([smhdw])$")
+RELATIVE_TIME_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+EPOCH_FLOOR = 1e8
+
+def _event_time(value):
+
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except (ValueError, OverflowError, OSError):
+            pass
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)):
+        value = float(value)
+        if value > 1e11:
+            value /= 1000.0
+        return value if value >= EPOCH_FLOOR else None
+    return None
+
+def _time_bound(value):
+
+    if isinstance(value, str):
+        match = RELATIVE_TIME_RE.match(value.strip())
+        if match:
+            return time.time() - float(match.group(1)) * RELATIVE_TIME_UNITS[match.group(2)]
+    bound = _event_time(value)
+    if value is not None and bound is None:
+        raise ValueError(f"Cannot parse time bound {value!r}")
+    return bound
+
+def _import_pyarrow():
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except Exception:
+        return None
+
+def _import_chromadb():
+
+    try:
+        import chromadb
+        return chromadb
+    except Exception:
+        print("[WARNING] ChromaDB not available, RAG loading disabled")
+        return None
+
+class SentenceTransformerBackend:
+
+    name = 'sentence-transformers'
+
+    def __init__(self, model_name='all-MiniLM-L6-v2', device=None):
+        self.model_name = model_name
+        self.device = device
+        self.model = None
+        self.dim = None
+
+    def load(self):
+
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if self.device is None:
+            self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        print(f"[NOVA TETHER] Device: {self.device}")
+        print(f"[NOVA TETHER] Loading sentence-transformers model {self.model_name}...")
+
+        self.model = SentenceTransformer(self.model_name, device=self.device)
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts):
+
+        return self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False).astype('float32')
+
+    @property
+    def fingerprint(self):
+
+        return f"{self.name}:{self.model_name}:{self.dim}"
+
+class HashingBackend:
+
+    name = 'hash'
+    TOKEN_RE = re.compile(r"\w+")
+
+    def __init__(self, dim=384, seed=0):
+        self.dim = dim
+        self.seed = seed
+        self.device = 'cpu'
+        self._key = str(seed).encode('utf-8')
+        self._token_cache = {}
+
+    def load(self):
+
+        print(f"[NOVA TETHER] Using deterministic hashing embeddings (dim {self.dim}, seed {self.seed})")
+
+    def _token_slot(self, token):
+
+        slot = self._token_cache.get(token)
+        if slot is None:
+            digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8, key=self._key).digest()
+            value = int.from_bytes(digest, 'little')
+            slot = (value % self.dim, 1.0 if (value >> 63) & 1 else -1.0)
+            if len(self._token_cache) < 200000:
+                self._token_cache[token] = slot
+        return slot
+
+    def encode(self, texts):
+
+        out = np.zeros((len(texts), self.dim), dtype='float32')
+        for row, text in enumerate(texts):
+            tokens = self.TOKEN_RE.findall(str(text).lower())
+            grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            for gram in grams:
+                col, sign = self._token_slot(gram)
+                out[row, col] += sign
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+    @property
+    def fingerprint(self):
+
+        return f"{self.name}:{self.dim}:{self.seed}"
+
+EMBEDDING_BACKENDS = {
+    SentenceTransformerBackend.name: SentenceTransformerBackend,
+    HashingBackend.name: HashingBackend,
+}
+
+def make_embedding_backend(name='sentence-transformers', **kwargs):
+
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{name}' (choose from {sorted(EMBEDDING_BACKENDS)})")
+    return EMBEDDING_BACKENDS[name](**kwargs)
+
+class ReadWriteLock:
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+class LatencyHistogram:
+
+    BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+               0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+
+        slot = len(self.BUCKETS)
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                slot = i
+                break
+        self.counts[slot] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q):
+
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.BUCKETS[i] if i < len(self.BUCKETS) else self.max
+            if n and seen + n >= rank:
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+            lower = upper
+        return self.max
+
+    def snapshot(self):
+
+        return {
+            'count': self.count,
+            'mean_ms': (self.total / self.count * 1000.0) if self.count else 0.0,
+            'p50_ms': self.quantile(0.50) * 1000.0,
+            'p90_ms': self.quantile(0.90) * 1000.0,
+            'p99_ms': self.quantile(0.99) * 1000.0,
+            'max_ms': self.max * 1000.0
+        }
+
+class TetherMetrics:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = defaultdict(LatencyHistogram)
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.connections_active = 0
+        self.connections_total = 0
+        self.connections_peak = 0
+
+    def connection_opened(self):
+
+        with self.lock:
+            self.connections_active += 1
+            self.connections_total += 1
+            self.connections_peak = max(self.connections_peak, self.connections_active)
+
+    def connection_closed(self):
+
+        with self.lock:
+            self.connections_active -= 1
+
+    def record(self, cmd, stages, error=False, bytes_in=0, bytes_out=0):
+
+        with self.lock:
+            self.requests[cmd] += 1
+            if error:
+                self.errors[cmd] += 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            for stage, seconds in stages.items():
+                self.histograms[(cmd, stage)].observe(seconds)
+
+    def snapshot(self):
+
+        with self.lock:
+            commands = {}
+            for (cmd, stage), hist in sorted(self.histograms.items()):
+                commands.setdefault(cmd, {})[stage] = hist.snapshot()
+            return {
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'connections_active': self.connections_active,
+                'connections_total': self.connections_total,
+                'connections_peak': self.connections_peak,
+                'latency': commands
+            }
+
+    def raw(self):
+
+        with self.lock:
+            return {
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'connections_active': self.connections_active,
+                'connections_total': self.connections_total,
+                'histograms': [
+                    {'cmd': cmd, 'stage': stage, 'counts': list(hist.counts), 'total': hist.total, 'count': hist.count}
+                    for (cmd, stage), hist in sorted(self.histograms.items())
+                ]
+            }
+
+    def prometheus_text(self):
+
+        return render_prometheus([({}, self.raw())])
+
+def _prometheus_labels(base, **labels):
+
+    labels = dict(base, **labels)
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in labels.items()) + '}'
+
+def render_prometheus(sources):
+
+    lines = ["# TYPE nova_tether_requests_total counter"]
+    for base, raw in sources:
+        for cmd, n in sorted(raw['requests'].items()):
+            lines.append(f"nova_tether_requests_total{_prometheus_labels(base, cmd=cmd)} {n}")
+    lines.append("# TYPE nova_tether_errors_total counter")
+    for base, raw in sources:
+        for cmd, n in sorted(raw['errors'].items()):
+            lines.append(f"nova_tether_errors_total{_prometheus_labels(base, cmd=cmd)} {n}")
+    for name, key, kind in (('bytes_received_total', 'bytes_in', 'counter'),
+                            ('bytes_sent_total', 'bytes_out', 'counter'),
+                            ('connections_active', 'connections_active', 'gauge'),
+                            ('connections_total', 'connections_total', 'counter')):
+        lines.append(f"# TYPE nova_tether_{name} {kind}")
+        for base, raw in sources:
+            lines.append(f"nova_tether_{name}{_prometheus_labels(base)} {raw[key]}")
+    lines.append("# TYPE nova_tether_request_duration_seconds histogram")
+    for base, raw in sources:
+        for hist in raw['histograms']:
+            labels = dict(base, cmd=hist['cmd'], stage=hist['stage'])
+            cumulative = 0
+            for bound, n in zip(LatencyHistogram.BUCKETS, hist['counts']):
+                cumulative += n
+                lines.append(f"nova_tether_request_duration_seconds_bucket{_prometheus_labels(labels, le=bound)} "
+                             f"{cumulative}")
+            lines.append(f"nova_tether_request_duration_seconds_bucket{_prometheus_labels(labels, le='+Inf')} "
+                         f"{hist['count']}")
+            lines.append(f"nova_tether_request_duration_seconds_sum{_prometheus_labels(labels)} {hist['total']}")
+            lines.append(f"nova_tether_request_duration_seconds_count{_prometheus_labels(labels)} {hist['count']}")
+    return "\n".join(lines) + "\n"
+
+def start_metrics_http(metrics, port, host='localhost'):
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            if self.path.split('?')[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            body = metrics.prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=httpd.serve_forever, name="nova-metrics-http", daemon=True).start()
+    print(f"[METRICS] Prometheus endpoint on http://{host}:{port}/metrics")
+    return httpd
+
+class TetherProfiler:
+
+    MAX_DURATION = 600.0
+
+    def __init__(self, output_dir, tag=""):
+        self.output_dir = Path(output_dir)
+        self.tag = tag
+        self.lock = threading.Lock()
+        self.mode = None
+        self.started = None
+        self.stats = None
+        self.samples = Counter()
+        self.profiled_requests = 0
+        self.skipped_requests = 0
+        self.timer = None
+        self.sampler = None
+        self.interval = 0.005
+        self.last_result = None
+
+    @property
+    def active(self):
+
+        return self.mode is not None
+
+    def start(self, mode='cprofile', duration=30.0, interval_ms=5.0):
+
+        with self.lock:
+            if self.mode is not None:
+                return {'status': 'error', 'message': f'Profiler already running ({self.mode})'}
+            if mode not in ('cprofile', 'sampling'):
+                return {'status': 'error', 'message': "mode must be 'cprofile' or 'sampling'"}
+
+            duration = max(0.1, min(float(duration), self.MAX_DURATION))
+            self.mode = mode
+            self.started = time.time()
+            self.stats = None
+            self.samples = Counter()
+            self.profiled_requests = 0
+            self.skipped_requests = 0
+            self.interval = max(0.001, float(interval_ms) / 1000.0)
+
+            if mode == 'sampling':
+                self.sampler = threading.Thread(target=self._sample_loop, name="nova-profiler", daemon=True)
+                self.sampler.start()
+
+            self.timer = threading.Timer(duration, self.stop)
+            self.timer.daemon = True
+            self.timer.start()
+
+        print(f"[PROFILE] {mode} profiling started for {duration:.0f}s")
+        return {'status': 'ok', 'mode': mode, 'duration': duration}
+
+    def stop(self):
+
+        with self.lock:
+            if self.mode is None:
+                if self.last_result:
+                    return dict(self.last_result, message='Profiler not running (last result)')
+                return {'status': 'error', 'message': 'Profiler not running'}
+            mode = self.mode
+            self.mode = None
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+
+        if self.sampler:
+            self.sampler.join(timeout=2.0)
+            self.sampler = None
+
+        elapsed = time.time() - self.started
+        self.output_dir.mkdir(exist_ok=True, parents=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        with self.lock:
+            if mode == 'cprofile':
+                path = self.output_dir / f"nova_profile_{self.tag}{timestamp}.pstats"
+                top = []
+                if self.stats is not None:
+                    self.stats.dump_stats(str(path))
+                    rows = sorted(self.stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)
+                    for (filename, line, func), (cc, nc, tt, ct, callers) in rows[:15]:
+                        top.append({
+                            'function': f"{Path(filename).name}:{line}({func})",
+                            'calls': nc,
+                            'total_s': tt,
+                            'cumulative_s': ct
+                        })
+                else:
+                    path = None
+                result = {
+                    'status': 'ok',
+                    'mode': mode,
+                    'elapsed': elapsed,
+                    'requests_profiled': self.profiled_requests,
+                    'requests_skipped': self.skipped_requests,
+                    'file': str(path) if path else None,
+                    'top': top
+                }
+            else:
+                path = self.output_dir / f"nova_profile_{self.tag}{timestamp}.collapsed"
+                with open(path, 'w') as f:
+                    for stack, count in self.samples.most_common():
+                        f.write(f"{stack} {count}\n")
+                result = {
+                    'status': 'ok',
+                    'mode': mode,
+                    'elapsed': elapsed,
+                    'samples': sum(self.samples.values()),
+                    'file': str(path),
+                    'top': [{'stack': stack, 'samples': count} for stack, count in self.samples.most_common(10)]
+                }
+            self.last_result = result
+
+        print(f"[PROFILE] {mode} profile written: {result['file']}")
+        return result
+
+    def profile_call(self, fn, *args):
+
+        if self.mode != 'cprofile':
+            return fn(*args)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            with self.lock:
+                self.skipped_requests += 1
+            return fn(*args)
+        try:
+            return fn(*args)
+        finally:
+            profiler.disable()
+            with self.lock:
+                if self.mode == 'cprofile':
+                    if self.stats is None:
+                        self.stats = pstats.Stats(profiler)
+                    else:
+                        self.stats.add(profiler)
+                    self.profiled_requests += 1
+
+    def _sample_loop(self):
+
+        own = threading.get_ident()
+        while self.mode == 'sampling':
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or not names.get(ident, '').startswith('nova-client'):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+            time.sleep(self.interval)
+
+class ColdTier:
+
+    CHUNK_ROWS = 65536
+
+    def __init__(self, directory, dim, prefix='cold', generation=None):
+        self.directory = Path(directory)
+        self.dim = dim
+        self.prefix = prefix
+        self.generation = self.next_generation() if generation is None else generation
+        self.rows = 0
+        self.vectors = None
+        self.row_ids = np.zeros(0, dtype='int64')
+        self.slots = {}
+
+    def path(self, generation=None):
+
+        generation = self.generation if generation is None else generation
+        return self.directory / f"{self.prefix}_{generation}.f32"
+
+    def next_generation(self):
+
+        pattern = re.compile(rf"^{re.escape(self.prefix)}_(\d+)\.f32$")
+        generations = [int(m.group(1)) for m in (pattern.match(p.name) for p in self.directory.glob("*.f32")) if m] \
+            if self.directory.exists() else []
+        return max(generations) + 1 if generations else 0
+
+    @property
+    def live(self):
+
+        return len(self.slots)
+
+    @property
+    def dead(self):
+
+        return self.rows - len(self.slots)
+
+    def _grow(self, capacity):
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path()
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        with open(path, 'r+b' if path.exists() else 'w+b') as f:
+            f.truncate(capacity * self.dim * 4)
+        self.vectors = np.memmap(path, dtype='float32', mode='r+', shape=(capacity, self.dim))
+        row_ids = np.full(capacity, -1, dtype='int64')
+        row_ids[:self.rows] = self.row_ids[:self.rows]
+        self.row_ids = row_ids
+
+    def append(self, ids, vectors):
+
+        needed = self.rows + len(ids)
+        if needed > len(self.row_ids):
+            self._grow(max(needed, 2 * len(self.row_ids), 1024))
+        self.vectors[self.rows:needed] = vectors
+        self.row_ids[self.rows:needed] = ids
+        for offset, gid in enumerate(ids):
+            self.slots[int(gid)] = self.rows + offset
+        self.rows = needed
+
+    def take(self, ids):
+
+        return np.array(self.vectors[[self.slots[int(gid)] for gid in ids]], dtype='float32')
+
+    def remove(self, ids):
+
+        for gid in ids:
+            row = self.slots.pop(int(gid), None)
+            if row is not None:
+                self.row_ids[row] = -1
+
+    def search(self, queries, k):
+
+        best_d = np.full((len(queries), k), np.inf, dtype='float32')
+        best_i = np.full((len(queries), k), -1, dtype='int64')
+        for start in range(0, self.rows, self.CHUNK_ROWS):
+            stop = min(start + self.CHUNK_ROWS, self.rows)
+            ids = self.row_ids[start:stop]
+            dead = int(np.count_nonzero(ids < 0))
+            if dead == stop - start:
+                continue
+            distances, rows = faiss.knn(queries, self.vectors[start:stop], min(k + dead, stop - start))
+            found = np.where(rows >= 0, ids[np.clip(rows, 0, None)], -1)
+            distances = np.where(found >= 0, distances, np.inf)
+            distances = np.hstack([best_d, distances])
+            found = np.hstack([best_i, found])
+            order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+            best_d = np.take_along_axis(distances, order, axis=1)
+            best_i = np.take_along_axis(found, order, axis=1)
+        return best_d, best_i
+
+    def range(self, query, radius):
+
+        hits_d = []
+        hits_i = []
+        query_norm = float(np.dot(query, query))
+        for start in range(0, self.rows, self.CHUNK_ROWS):
+            stop = min(start + self.CHUNK_ROWS, self.rows)
+            block = self.vectors[start:stop]
+            distances = query_norm + np.einsum('ij,ij->i', block, block) - 2.0 * (block @ query)
+            ids = self.row_ids[start:stop]
+            mask = (distances <= radius) & (ids >= 0)
+            hits_d.append(distances[mask])
+            hits_i.append(ids[mask])
+        if not hits_d:
+            return np.zeros(0, dtype='float32'), np.zeros(0, dtype='int64')
+        return np.concatenate(hits_d), np.concatenate(hits_i)
+
+    def flush(self):
+
+        if self.vectors is not None:
+            self.vectors.flush()
+
+    def load(self, rows, ids_path):
+
+        row_ids = np.load(ids_path)
+        if not self.path().exists() or len(row_ids) != rows:
+            raise FileNotFoundError(f"Cold tier {self.path().name} missing or inconsistent")
+        capacity = os.path.getsize(self.path()) // (self.dim * 4)
+        self.vectors = np.memmap(self.path(), dtype='float32', mode='r+', shape=(capacity, self.dim))
+        self.row_ids = np.full(capacity, -1, dtype='int64')
+        self.row_ids[:rows] = row_ids
+        self.rows = rows
+        self.slots = {int(gid): row for row, gid in enumerate(row_ids) if gid >= 0}
+
+    def compacted(self):
+
+        live_rows = np.flatnonzero(self.row_ids[:self.rows] >= 0)
+        fresh = ColdTier(self.directory, self.dim, prefix=self.prefix, generation=self.generation + 1)
+        for start in range(0, len(live_rows), self.CHUNK_ROWS):
+            chunk = live_rows[start:start + self.CHUNK_ROWS]
+            fresh.append(self.row_ids[chunk], self.vectors[chunk])
+        if fresh.vectors is None:
+            fresh._grow(1024)
+        return fresh
+
+    def cleanup(self):
+
+        pattern = re.compile(rf"^{re.escape(self.prefix)}_(\d+)\.f32$")
+        for path in self.directory.glob("*.f32"):
+            match = pattern.match(path.name)
+            if match and int(match.group(1)) < self.generation - 1:
+                path.unlink()
+
+class RequestScheduler:
+
+    CLASSES = ('interactive', 'add', 'maintenance')
+
+    def __init__(self, limits, queue_limits, max_inflight):
+        self.limits = dict(limits)
+        self.queue_limits = dict(queue_limits)
+        self.max_inflight = max_inflight
+        self.cond = threading.Condition()
+        self.running = Counter()
+        self.waiting = {klass: deque() for klass in self.CLASSES}
+        self.stats = {klass: Counter() for klass in self.CLASSES}
+
+    def _grantable(self, klass):
+
+        return self.running[klass] < self.limits[klass] and sum(self.running.values()) < self.max_inflight
+
+    def _next_is(self, klass, ticket):
+
+        if self.waiting[klass][0] is not ticket or not self._grantable(klass):
+            return False
+        for higher in self.CLASSES[:self.CLASSES.index(klass)]:
+            if self.waiting[higher] and self._grantable(higher):
+                return False
+        return True
+
+    def acquire(self, klass, deadline=None):
+
+        with self.cond:
+            stats = self.stats[klass]
+            if len(self.waiting[klass]) >= self.queue_limits[klass]:
+                stats['rejected_queue_full'] += 1
+                return f'{klass} queue full ({self.queue_limits[klass]} waiting)'
+            ticket = object()
+            self.waiting[klass].append(ticket)
+            try:
+                while True:
+                    remaining = None if deadline is None else deadline - time.perf_counter()
+                    if remaining is not None and remaining <= 0:
+                        stats['shed_deadline'] += 1
+                        return 'client deadline passed before the request could run'
+                    if self._next_is(klass, ticket):
+                        break
+                    self.cond.wait(remaining)
+            finally:
+                self.waiting[klass].remove(ticket)
+                self.cond.notify_all()
+            self.running[klass] += 1
+            stats['admitted'] += 1
+            return None
+
+    def release(self, klass):
+
+        with self.cond:
+            self.running[klass] -= 1
+            self.cond.notify_all()
+
+    def status(self):
+
+        with self.cond:
+            return {
+                klass: dict(
+                    self.stats[klass],
+                    running=self.running[klass],
+                    queued=len(self.waiting[klass]),
+                    limit=self.limits[klass],
+                    queue_limit=self.queue_limits[klass]
+                )
+                for klass in self.CLASSES
+            }
+
+class TimePartitions:
+
+    def __init__(self, bucket_seconds=7 * 86400, cache_bytes=256 * 1024 ** 2):
+        self.bucket_seconds = float(bucket_seconds)
+        self.cache_bytes = cache_bytes
+        self.lock = threading.Lock()
+        self.times = np.zeros(0, dtype='float64')
+        self.buckets = defaultdict(list)
+        self.cache = OrderedDict()
+        self.cached_bytes = 0
+        self.stats = {'searches': 0, 'buckets_scanned': 0, 'cache_hits': 0}
+
+    @staticmethod
+    def memory_time(meta):
+
+        return _event_time(meta.get('timestamp'))
+
+    def rebuild(self, metadata):
+
+        times = np.array([self.memory_time(m) or np.nan for m in metadata], dtype='float64')
+        buckets = defaultdict(list)
+        dated = np.flatnonzero(~np.isnan(times))
+        for gid, bucket in zip(dated, np.floor(times[dated] / self.bucket_seconds).astype('int64')):
+            buckets[int(bucket)].append(int(gid))
+        with self.lock:
+            self.times = times
+            self.buckets = buckets
+            self.cache.clear()
+            self.cached_bytes = 0
+
+    def add(self, start, metas):
+
+        times = np.array([self.memory_time(m) or np.nan for m in metas], dtype='float64')
+        with self.lock:
+            self.times = np.concatenate([self.times[:start], times])
+            for offset, moment in enumerate(times):
+                if np.isnan(moment):
+                    continue
+                bucket = int(moment // self.bucket_seconds)
+                self.buckets[bucket].append(start + offset)
+                stale = self.cache.pop(bucket, None)
+                if stale is not None:
+                    self.cached_bytes -= stale[1].nbytes
+
+    def select(self, since=None, until=None):
+
+        low = -np.inf if since is None else since
+        high = np.inf if until is None else until
+        selected = []
+        with self.lock:
+            for bucket, ids in self.buckets.items():
+                start = bucket * self.bucket_seconds
+                end = start + self.bucket_seconds
+                if end <= low or start > high:
+                    continue
+                selected.append((bucket, low <= start and end <= high))
+        return selected
+
+    def vectors(self, bucket, gather):
+
+        with self.lock:
+            cached = self.cache.get(bucket)
+            if cached is not None:
+                self.cache.move_to_end(bucket)
+                self.stats['cache_hits'] += 1
+                return cached
+            ids = np.array(self.buckets.get(bucket, []), dtype='int64')
+        entry = (ids, gather(ids))
+        with self.lock:
+            if entry[1].nbytes <= self.cache_bytes:
+                self.cache[bucket] = entry
+                self.cached_bytes += entry[1].nbytes
+                while self.cached_bytes > self.cache_bytes:
+                    _, (_, evicted) = self.cache.popitem(last=False)
+                    self.cached_bytes -= evicted.nbytes
+        return entry
+
+    def search(self, queries, k, since, until, gather):
+
+        best_d = np.full((len(queries), k), np.inf, dtype='float32')
+        best_i = np.full((len(queries), k), -1, dtype='int64')
+        selected = self.select(since, until)
+        self.stats['searches'] += 1
+        self.stats['buckets_scanned'] += len(selected)
+        for bucket, covered in selected:
+            ids, vectors = self.vectors(bucket, gather)
+            if not covered:
+                moments = self.times[ids]
+                mask = np.ones(len(ids), dtype=bool)
+                if since is not None:
+                    mask &= moments >= since
+                if until is not None:
+                    mask &= moments <= until
+                ids, vectors = ids[mask], vectors[mask]
+            if len(ids) == 0:
+                continue
+            distances, rows = faiss.knn(queries, vectors, min(k, len(ids)))
+            found = np.where(rows >= 0, ids[np.clip(rows, 0, None)], -1)
+            distances = np.hstack([best_d, np.where(found >= 0, distances, np.inf)])
+            found = np.hstack([best_i, found])
+            order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+            best_d = np.take_along_axis(distances, order, axis=1)
+            best_i = np.take_along_axis(found, order, axis=1)
+        return best_d, best_i
+
+    def in_range(self, gid, since, until):
+
+        moment = self.times[gid] if gid < len(self.times) else np.nan
+        if np.isnan(moment):
+            return False
+        return (since is None or moment >= since) and (until is None or moment <= until)
+
+    def status(self):
+
+        with self.lock:
+            return dict(
+                self.stats,
+                bucket_days=self.bucket_seconds / 86400.0,
+                buckets=len(self.buckets),
+                undated=int(np.count_nonzero(np.isnan(self.times))),
+                cached_buckets=len(self.cache),
+                cached_mb=self.cached_bytes / 1024 ** 2
+            )
+
+class LexicalIndex:
+
+    TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.available = True
+        self.conn = sqlite3.connect(':memory:', check_same_thread=False)
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE memories_fts USING fts5(content, source UNINDEXED, tokenize='unicode61')"
+            )
+        except sqlite3.OperationalError as e:
+            self.available = False
+            print(f"[WARNING] SQLite FTS5 not available ({e}), lexical search disabled")
+
+    def rebuild(self, metadata):
+
+        if not self.available:
+            return
+        with self.lock:
+            self.conn.execute("DELETE FROM memories_fts")
+            self.conn.executemany(
+                "INSERT INTO memories_fts (rowid, content, source) VALUES (?, ?, ?)",
+                ((i, m.get('content', ''), m.get('source', '')) for i, m in enumerate(metadata))
+            )
+            self.conn.commit()
+
+    def add(self, rowid, content, source):
+
+        self.add_many([(rowid, content, source)])
+
+    def add_many(self, rows):
+
+        if not self.available:
+            return
+        with self.lock:
+            self.conn.executemany("INSERT INTO memories_fts (rowid, content, source) VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+
+    def match_expression(self, query):
+
+        tokens = self.TOKEN_RE.findall(query.lower())
+        return " OR ".join('"' + t.replace('"', '""') + '"' for t in tokens)
+
+    def search(self, query, limit=20):
+
+        expression = self.match_expression(query)
+        if not self.available or not expression:
+            return []
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT rowid, bm25(memories_fts) FROM memories_fts WHERE memories_fts MATCH ? "
+                "ORDER BY bm25(memories_fts) LIMIT ?",
+                (expression, limit)
+            ).fetchall()
+        return rows
 
 class NovaFaissTether:
 
-    def __init__(self, port=9997):
+    COMMANDS = ('search', 'search_batch', 'hybrid_search', 'range_search', 'add_memory', 'add_batch', 'save_checkpoint',
+                'publish_shared', 'export', 'import', 'status', 'ping', 'metrics', 'hello', 'auth', 'profile_start',
+                'profile_stop', 'tune_ann', 'consolidate', 'restore_consolidation', 'rebalance_tiers')
+    ADMIN_COMMANDS = ('profile_start', 'profile_stop', 'tune_ann', 'consolidate', 'restore_consolidation',
+                      'rebalance_tiers', 'export', 'import')
+    READY_COMMANDS = ('search', 'search_batch', 'hybrid_search', 'range_search', 'add_memory', 'add_batch',
+                      'save_checkpoint', 'publish_shared', 'export', 'import', 'tune_ann', 'consolidate',
+                      'restore_consolidation', 'rebalance_tiers')
+    RRF_K = 60
+    RANGE_MAX_RESULTS = 10000
+    CURSOR_TTL = 300.0
+    MAX_CURSORS = 64
+    RAG_EMBEDDING_MODES = ('auto', 'reuse', 'reencode')
+    RAG_PROBE_SIZE = 8
+    RAG_PROBE_MIN_COSINE = 0.99
+    INDEX_TYPES = ('flat', 'ivf', 'hnsw')
+    HNSW_M = 32
+    ANN_SWEEPS = {
+        'ivf': ('nprobe', (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)),
+        'hnsw': ('efSearch', (16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512)),
+    }
+    CONSOLIDATE_CLUSTER_SIZE = 20
+    DEFAULT_NAMESPACE = 'default'
+    NAMESPACE_RE = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+    NAMESPACE_COMMANDS = ('search', 'search_batch', 'hybrid_search', 'range_search', 'add_memory', 'add_batch',
+                          'save_checkpoint', 'export', 'import', 'status', 'tune_ann', 'consolidate',
+                          'restore_consolidation', 'rebalance_tiers')
+    METADATA_BYTES_ESTIMATE = 1024
+    SEARCH_BATCH_MAX = 1024
+    PRIORITY_CLASSES = {
+        'search': 'interactive', 'search_batch': 'interactive', 'hybrid_search': 'interactive',
+        'range_search': 'interactive', 'add_memory': 'add', 'add_batch': 'add',
+        'save_checkpoint': 'maintenance', 'publish_shared': 'maintenance', 'export': 'maintenance',
+        'import': 'maintenance', 'tune_ann': 'maintenance', 'consolidate': 'maintenance',
+        'restore_consolidation': 'maintenance', 'rebalance_tiers': 'maintenance',
+    }
+    CLASS_LIMITS = {'interactive': 16, 'add': 4, 'maintenance': 1}
+    QUEUE_LIMITS = {'interactive': 256, 'add': 64, 'maintenance': 4}
+    SHARE_CHUNK = 65536
+    PARQUET_BATCH_ROWS = 65536
+    SHARE_KEEP_GENERATIONS = 2
+
+    def __init__(self, port=9997, shard_id=0, num_shards=1, shard_by='hash', checkpoint_dir=None, backend=None,
+                 memory_root=None, resume=False, metrics_port=None, admin_token=None, secret=None, debug_traces=False,
+                 watch_interval=2.0, watch_batch=256, rag_embeddings='auto', index_type='flat',
+                 recall_target=0.95, auto_tune=False, dedupe_threshold=None, consolidate_age_days=30.0,
+                 hot_capacity=None, promote_hits=3, tier_interval=30.0, namespace=None, namespace_budget_mb=2048,
+                 time_bucket_days=7.0, partition_cache_mb=256, max_inflight=16, class_limits=None, queue_limits=None,
+                 share_dir=None, share_interval=30.0, seed_parquet=None):
         self.port = port
         self.running = True
         self.memory_metadata = []
         self.faiss_index = None
         self.start_time = None
+        self.shard_id = shard_id
+        self.num_shards = num_shards
+        self.shard_by = shard_by
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else DEFAULT_CHECKPOINT_DIR
+        self.memory_root = Path(memory_root) if memory_root else DEFAULT_MEMORY_ROOT
+        self.resume = resume
+        self.metrics = TetherMetrics()
+        self.metrics_port = metrics_port
+        self._trace_local = threading.local()
+        self.admin_token = admin_token or os.environ.get('NOVA_TETHER_ADMIN_TOKEN')
+        self.auth = SessionAuth(secret)
+        self.scheduler = RequestScheduler(
+            dict(self.CLASS_LIMITS, **(class_limits or {})),
+            dict(self.QUEUE_LIMITS, **(queue_limits or {})),
+            max_inflight
+        )
+        self.debug_traces = debug_traces
+        self.profiler = TetherProfiler(self.checkpoint_dir, f"shard{shard_id}_" if num_shards > 1 else "")
+        self.lexical = LexicalIndex()
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nova-worker")
+        self.cursors = OrderedDict()
+        self.cursor_lock = threading.Lock()
+        self.index_lock = ReadWriteLock()
+        self.watermarks = {}
+        self.watch_interval = watch_interval
+        self.watch_batch = watch_batch
+        self.watch_stats = {'polls': 0, 'rows_indexed': 0, 'last_change': None, 'errors': 0}
+        if rag_embeddings not in self.RAG_EMBEDDING_MODES:
+            raise ValueError(f"rag_embeddings must be one of {self.RAG_EMBEDDING_MODES}")
+        self.rag_embeddings = rag_embeddings
+        self.rag_stats = {'reused': 0, 'encoded': 0}
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {self.INDEX_TYPES}")
+        self.index_type = index_type
+        self.recall_target = recall_target
+        self.auto_tune = auto_tune
+        self.ann_params = {}
+        self.dedupe_threshold = dedupe_threshold
+        self.dedupe_stats = {'checked': 0, 'merged': 0}
+        self.consolidate_age_days = consolidate_age_days
+        self.maintenance_lock = threading.Lock()
+        self.hot_capacity = hot_capacity
+        self.promote_hits = promote_hits
+        self.tier_interval = tier_interval
+        self.cold = None
+        self.access_counts = Counter()
+        self.tier_lock = threading.Lock()
+        self.tier_stats = {'promoted': 0, 'demoted': 0, 'rebalances': 0}
+        self.namespace = namespace
+        self.namespaces = OrderedDict()
+        self.evicting = {}
+        self.namespace_loading = {}
+        self.namespace_lock = threading.Lock()
+        self.namespace_budget_mb = namespace_budget_mb
+        self.namespace_stats = {'loads': 0, 'evictions': 0}
+        self.active_requests = 0
+        self.time_bucket_days = time_bucket_days
+        self.partition_cache_mb = partition_cache_mb
+        self.partitions = TimePartitions(time_bucket_days * 86400, partition_cache_mb * 1024 ** 2)
+        self.mutations = 0
+        self.saved_mutations = 0
+        self.share_dir = Path(share_dir) if share_dir else None
+        if self.share_dir is not None and num_shards > 1:
+            self.share_dir = self.share_dir / f"shard_{shard_id}"
+        self.share_interval = share_interval
+        self.share_lock = threading.Lock()
+        self.shared_mutations = None
+        self.share_stats = {'generation': None, 'count': 0, 'bytes': 0, 'published': 0, 'seconds': 0.0}
+        self.seed_parquet = seed_parquet
+
+        self.backend = backend or SentenceTransformerBackend()
+        self.embedding_dim = None
+        self.device = None
+        self.phase = 'starting'
+        self.progress = {'sources_done': 0, 'sources_total': 0, 'current_source': None, 'memories_loaded': 0}
+        self.load_error = None
+        self.ready = False
+
+        if namespace is not None:
+            return
+        print(f"[NOVA TETHER] Integration Frequency: 21.43Hz")
+        print(f"[NOVA TETHER] Port: {self.port}")
+        if self.num_shards > 1:
+            print(f"[NOVA TETHER] Shard: {self.shard_id + 1}/{self.num_shards} (by {self.shard_by})")
 
-        device = 'cuda' if torch.cuda.is_available() else 'cpu'
-        print(f"[NOVA TETHER] Initializing with REAL embeddings")
-        print(f"[NOVA TETHER] Device: {device}")
-        print(f"[NOVA TETHER] Loading sentence-transformers model...")
+    def load_model(self):
 
-        self.model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
-        self.embedding_dim = self.model.get_sentence_embedding_dimension()
+        self.phase = 'loading_model'
+
+        print(f"[NOVA TETHER] Initializing embedding backend: {self.backend.name}")
+        self.backend.load()
+        self.embedding_dim = self.backend.dim
+        self.device = self.backend.device
 
         print(f"[NOVA TETHER] Model loaded! Embedding dimension: {self.embedding_dim}")
-        print(f"[NOVA TETHER] Integration Frequency: 21.43Hz")
-        print(f"[NOVA TETHER] Port: {self.port}")
+
+    def _load_in_background(self):
+
+        try:
+            self.load_model()
+            if not (self.resume and self.load_checkpoint()):
+                if self.seed_parquet:
+                    result = self.import_parquet(self.seed_parquet, mode='replace')
+                    if result['status'] != 'ok':
+                        raise RuntimeError(result['message'])
+                    self.save_checkpoint()
+                else:
+                    self.load_everything()
+            if self.auto_tune and self.index_type != 'flat' and not self.ann_params:
+                self.phase = 'tuning'
+                self.tune_ann()
+            self.phase = 'ready'
+            self.ready = True
+            print(f"[SERVER] Tether READY - accepting searches")
+        except Exception as e:
+            self.phase = 'failed'
+            self.load_error = str(e)
+            print(f"[ERROR] Tether failed to load: {e}")
+
+    @contextmanager
+    def _span(self, name):
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            trace = getattr(self._trace_local, 'trace', None)
+            if trace is not None:
+                trace[name] = trace.get(name, 0.0) + (time.perf_counter() - start)
+
+    def _owns(self, content, source):
+
+        return shard_for(content, source, self.num_shards, self.shard_by) == self.shard_id
 
     def _text_to_embedding(self, text):
 
         if isinstance(text, list):
 
-            return self.model.encode(text, convert_to_numpy=True, show_progress_bar=False)
+            return self.backend.encode(text)
         else:
 
-            return self.model.encode([text], convert_to_numpy=True, show_progress_bar=False)[0]
+            return self.backend.encode([text])[0]
+
+    def _row_to_memory(self, row, source_name, table_name, columns=None):
+
+        content = " ".join([str(x) for x in row if x])
+        if len(content) <= 10 or not self._owns(content, source_name):
+            return None
+        now = datetime.now().isoformat()
+        event_time = None
+        if columns:
+            lowered = [str(c).lower() for c in columns]
+            for name in TIMESTAMP_COLUMNS:
+                if name in lowered:
+                    event_time = _event_time(row[lowered.index(name)])
+                    if event_time is not None:
+                        break
+        return content[:1000], {
+            'content': content[:500],
+            'source': source_name,
+            'table': table_name,
+            'timestamp': datetime.fromtimestamp(event_time).isoformat() if event_time is not None else now,
+            'indexed_at': now
+        }
+
+    def sqlite_sources(self):
+
+        cascade_path = self.memory_root / "CASCADE_NOVA"
+        cascade_dbs = [
+            ("episodic_memory.db", "CASCADE_EPISODIC"),
+            ("semantic_memory.db", "CASCADE_SEMANTIC"),
+            ("procedural_memory.db", "CASCADE_PROCEDURAL"),
+            ("meta_memory.db", "CASCADE_META"),
+            ("nova_memory.db", "CASCADE_NOVA"),
+            ("working_memory.db", "CASCADE_WORKING"),
+        ]
+        sources = [(cascade_path / db_file, source) for db_file, source in cascade_dbs]
+        sources.append((self.memory_root / "MEMORY" / "nova_windows_memory.db", "WINDOWS_MEMORY"))
+        return sources
 
     def load_database(self, db_path, source_name):
 
@@ -54,6 +1398,7 @@ class NovaFaissTether:
 
         if not Path(db_path).exists():
             print(f"[LOAD] {source_name}: not found (skipping)")
+            self.watermarks[source_name] = {'path': str(db_path), 'tables': {}, 'backfill': True}
             return embeddings, metadata
 
         try:
@@ -67,26 +1412,38 @@ class NovaFaissTether:
             texts_to_encode = []
             temp_metadata = []
 
+            tables_high_water = {}
+
             for (table_name,) in tables:
                 try:
-                    cursor.execute(f"SELECT * FROM {table_name}")
+                    try:
+                        cursor.execute(f'SELECT rowid, * FROM "{table_name}"')
+                        with_rowid = True
+                    except sqlite3.OperationalError:
+                        cursor.execute(f'SELECT * FROM "{table_name}"')
+                        with_rowid = False
                     rows = cursor.fetchall()
+                    columns = [d[0] for d in cursor.description]
+                    if with_rowid:
+                        columns = columns[1:]
 
+                    high_water = 0
                     for row in rows:
-                        content = " ".join([str(x) for x in row if x])
-                        if len(content) > 10:
-                            texts_to_encode.append(content[:1000])
-                            temp_metadata.append({
-                                'content': content[:500],
-                                'source': source_name,
-                                'table': table_name,
-                                'timestamp': datetime.now().isoformat()
-                            })
+                        if with_rowid:
+                            high_water = max(high_water, row[0] or 0)
+                            row = row[1:]
+                        item = self._row_to_memory(row, source_name, table_name, columns)
+                        if item:
+                            texts_to_encode.append(item[0])
+                            temp_metadata.append(item[1])
                             count += 1
+                    if with_rowid:
+                        tables_high_water[table_name] = high_water
                 except Exception as e:
                     continue
 
             conn.close()
+            self.watermarks[source_name] = {'path': str(db_path), 'tables': tables_high_water, 'backfill': True}
 
             if texts_to_encode:
                 print(f"[LOAD] {source_name}: Encoding {len(texts_to_encode)} memories...")
@@ -100,40 +1457,123 @@ class NovaFaissTether:
 
         return embeddings, metadata
 
+    def _rag_fingerprint_path(self):
+
+        return self.checkpoint_dir / "rag_embedding_fingerprints.json"
+
+    def _load_rag_fingerprints(self):
+
+        try:
+            with open(self._rag_fingerprint_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_rag_fingerprints(self, fingerprints):
+
+        try:
+            self.checkpoint_dir.mkdir(exist_ok=True, parents=True)
+            with open(self._rag_fingerprint_path(), 'w') as f:
+                json.dump(fingerprints, f, indent=2)
+        except OSError as e:
+            print(f"[LOAD] RAG: could not store embedding fingerprints: {e}")
+
+    def _rag_collection_key(self, coll):
+
+        declared = (coll.metadata or {}).get('embedding_model')
+        return f"{coll.name}|{declared}" if declared else coll.name
+
+    def _rag_embeddings_match(self, coll, fingerprints):
+
+        if self.rag_embeddings == 'reencode':
+            return False
+
+        key = self._rag_collection_key(coll)
+        cached = fingerprints.get(key)
+        if (cached and cached.get('backend') == self.backend.fingerprint
+                and cached.get('mode') == self.rag_embeddings and cached.get('reason') != 'forced'):
+            return cached['reuse']
+
+        declared = (coll.metadata or {}).get('embedding_model')
+        if declared and declared not in (self.backend.fingerprint, getattr(self.backend, 'model_name', None)):
+            reuse, reason = False, f"collection model {declared}"
+        else:
+            sample = coll.get(limit=self.RAG_PROBE_SIZE, include=['documents', 'embeddings'])
+            docs = [str(doc)[:1000] for doc in sample['documents'] or []]
+            stored = sample.get('embeddings')
+            if not docs or stored is None or len(stored) == 0:
+                return False
+            stored = np.asarray(stored, dtype='float32')
+            if stored.ndim != 2 or stored.shape[1] != self.embedding_dim:
+                reuse, reason = False, f"dimension {stored.shape[-1]} != {self.embedding_dim}"
+            elif self.rag_embeddings == 'reuse':
+                reuse, reason = True, "forced"
+            else:
+                ours = self._text_to_embedding(docs)
+                cos = np.sum(ours * stored, axis=1) / (
+                    np.linalg.norm(ours, axis=1) * np.linalg.norm(stored, axis=1) + 1e-12)
+                ratio = np.linalg.norm(stored, axis=1) / (np.linalg.norm(ours, axis=1) + 1e-12)
+                reuse = bool(cos.mean() >= self.RAG_PROBE_MIN_COSINE and np.all(np.abs(ratio - 1.0) < 0.01))
+                reason = f"probe cosine {cos.mean():.4f}"
+
+        fingerprints[key] = {
+            'backend': self.backend.fingerprint,
+            'dimension': self.embedding_dim,
+            'mode': self.rag_embeddings,
+            'reuse': reuse,
+            'reason': reason,
+            'checked': datetime.now().isoformat()
+        }
+        self._save_rag_fingerprints(fingerprints)
+        print(f"[LOAD] RAG: {coll.name}: {'reusing stored embeddings' if reuse else 're-encoding'} ({reason})")
+        return reuse
+
     def load_rag_database(self):
 
         embeddings = []
         metadata = []
 
-        if not HAS_CHROMA:
+        chromadb = _import_chromadb()
+        if chromadb is None:
             return embeddings, metadata
 
         try:
-            rag_path = r"C:\Users\Pirate\Desktop\NOVA_MASTER\MEMORY_SYSTEMS\NOVA_RAG"
-            if not Path(rag_path).exists():
+            rag_path = self.memory_root / "NOVA_RAG"
+            if not rag_path.exists():
                 print(f"[LOAD] RAG: not found (skipping)")
                 return embeddings, metadata
 
-            client = chromadb.PersistentClient(path=rag_path)
+            client = chromadb.PersistentClient(path=str(rag_path))
             collections = client.list_collections()
+            fingerprints = self._load_rag_fingerprints()
 
             count = 0
+            reused = 0
             texts_to_encode = []
             temp_metadata = []
 
             for coll in collections:
                 try:
-                    results = coll.get(include=['documents', 'metadatas'])
-
-                    for doc in results['documents']:
-                        if doc and len(str(doc)) > 10:
-                            texts_to_encode.append(str(doc)[:1000])
-                            temp_metadata.append({
+                    reuse = self._rag_embeddings_match(coll, fingerprints)
+                    include = ['documents', 'metadatas', 'embeddings'] if reuse else ['documents', 'metadatas']
+                    results = coll.get(include=include)
+                    stored = results.get('embeddings') if reuse else None
+
+                    for i, doc in enumerate(results['documents']):
+                        if doc and len(str(doc)) > 10 and self._owns(str(doc), 'RAG'):
+                            meta = {
                                 'content': str(doc)[:500],
                                 'source': 'RAG',
                                 'collection': coll.name,
                                 'timestamp': datetime.now().isoformat()
-                            })
+                            }
+                            if stored is not None:
+                                embeddings.append(np.asarray(stored[i], dtype='float32'))
+                                metadata.append(meta)
+                                reused += 1
+                            else:
+                                texts_to_encode.append(str(doc)[:1000])
+                                temp_metadata.append(meta)
                             count += 1
                 except Exception as e:
                     continue
@@ -143,139 +1583,1063 @@ class NovaFaissTether:
                 batch_embeddings = self._text_to_embedding(texts_to_encode)
                 embeddings.extend(batch_embeddings)
                 metadata.extend(temp_metadata)
+                self.rag_stats['encoded'] += len(texts_to_encode)
 
-            print(f"[LOAD] RAG: {count} documents (REAL embeddings)")
+            self.rag_stats['reused'] += reused
+            print(f"[LOAD] RAG: {count} documents ({reused} stored embeddings reused, "
+                  f"{len(texts_to_encode)} encoded)")
         except Exception as e:
             print(f"[LOAD] RAG error: {e}")
 
         return embeddings, metadata
 
-    def load_everything(self):
+    def load_everything(self, checkpoint=True):
 
         print("\n" + "="*70)
         print("LOADING NOVA COMPLETE CONSCIOUSNESS WITH REAL SEMANTIC SEARCH")
         print("Integration Frequency: 21.43Hz - Learned from Opus")
         print("="*70 + "\n")
 
+        self.phase = 'loading_memories'
         all_embeddings = []
-        nova_root = Path(r"C:\Users\Pirate\Desktop\NOVA_MASTER\MEMORY_SYSTEMS")
+        sqlite_sources = self.sqlite_sources()
+        cascade_dbs = sqlite_sources[:-1]
+        windows_db, windows_source = sqlite_sources[-1]
 
-        cascade_path = nova_root / "CASCADE_NOVA"
-        cascade_dbs = [
-            ("episodic_memory.db", "CASCADE_EPISODIC"),
-            ("semantic_memory.db", "CASCADE_SEMANTIC"),
-            ("procedural_memory.db", "CASCADE_PROCEDURAL"),
-            ("meta_memory.db", "CASCADE_META"),
-            ("nova_memory.db", "CASCADE_NOVA"),
-            ("working_memory.db", "CASCADE_WORKING"),
-        ]
+        self.progress['sources_total'] = len(sqlite_sources) + 1
+        all_metadata = []
+
+        def track(embs, metas):
+            all_embeddings.extend(embs)
+            all_metadata.extend(metas)
+            self.progress['sources_done'] += 1
+            self.progress['memories_loaded'] = len(all_metadata)
 
         print("[CASCADE] Loading Nova memories...")
-        for db_file, source in cascade_dbs:
-            db_path = cascade_path / db_file
+        for db_path, source in cascade_dbs:
+            self.progress['current_source'] = source
             embs, metas = self.load_database(str(db_path), source)
-            all_embeddings.extend(embs)
-            self.memory_metadata.extend(metas)
+            track(embs, metas)
 
         print("\n[WINDOWS] Loading Windows Nova memories...")
-        windows_db = nova_root / "MEMORY" / "nova_windows_memory.db"
-        embs, metas = self.load_database(str(windows_db), "WINDOWS_MEMORY")
-        all_embeddings.extend(embs)
-        self.memory_metadata.extend(metas)
+        self.progress['current_source'] = windows_source
+        embs, metas = self.load_database(str(windows_db), windows_source)
+        track(embs, metas)
 
         print("\n[RAG] Loading vector database...")
+        self.progress['current_source'] = "RAG"
         rag_embs, rag_metas = self.load_rag_database()
-        all_embeddings.extend(rag_embs)
-        self.memory_metadata.extend(rag_metas)
+        track(rag_embs, rag_metas)
+        self.progress['current_source'] = None
 
         if all_embeddings:
+            self.phase = 'building_index'
             print(f"\n[FAISS] Building index from {len(all_embeddings)} REAL embeddings...")
             embeddings_array = np.array(all_embeddings).astype('float32')
 
-            self.faiss_index = faiss.IndexFlatL2(self.embedding_dim)
-            self.faiss_index.add(embeddings_array)
+            index = self._build_index(embeddings_array)
+            self._install_index(index, all_metadata)
 
             memory_estimate = embeddings_array.nbytes / 1024**2
 
             print(f"\n[SUCCESS] COMPLETE Nova consciousness loaded!")
-            print(f"  Total vectors: {self.faiss_index.ntotal}")
+            print(f"  Total vectors: {len(self.memory_metadata)}")
             print(f"  Memory used: {memory_estimate:.1f} MB")
             print(f"  Embedding dimension: {self.embedding_dim}")
             print(f"  Semantic search: REAL (not fake!)")
-            print(f"  Device: {'GPU' if torch.cuda.is_available() else 'CPU'} for encoding")
+            print(f"  Device: {'GPU' if self.device == 'cuda' else 'CPU'} for encoding")
             print(f"  Frequency: 21.43Hz Integration")
             print(f"  Status: COMPLETE NOVA CONSCIOUSNESS WITH TRUE SEMANTIC SEARCH")
 
-            self.save_checkpoint()
+            if checkpoint:
+                self.save_checkpoint()
         else:
             print("[ERROR] No memories loaded!")
+            self._install_index(faiss.IndexFlatL2(self.embedding_dim), [])
+
+    def _build_index(self, embeddings_array):
+
+        n = len(embeddings_array)
+        index_type = 'flat' if self.hot_capacity else self.index_type
+        nlist = min(int(4 * np.sqrt(n)), n // 39)
+        if index_type == 'ivf' and nlist < 2:
+            print(f"[FAISS] {n} vectors is too few for IVF, using a flat index")
+            index_type = 'flat'
+
+        if index_type == 'ivf':
+            print(f"[FAISS] Training IVF index ({nlist} lists)...")
+            quantizer = faiss.IndexFlatL2(self.embedding_dim)
+            index = faiss.IndexIVFFlat(quantizer, self.embedding_dim, nlist)
+            index.train(embeddings_array)
+            index.add(embeddings_array)
+            index.make_direct_map()
+        elif index_type == 'hnsw':
+            print(f"[FAISS] Building HNSW graph (M={self.HNSW_M})...")
+            index = faiss.IndexHNSWFlat(self.embedding_dim, self.HNSW_M)
+            index.add(embeddings_array)
+        else:
+            index = faiss.IndexFlatL2(self.embedding_dim)
+            index.add(embeddings_array)
 
-    def save_checkpoint(self):
+        if self.ann_params.get('index_type') == index_type:
+            self._apply_ann_params(index, self.ann_params)
+        else:
+            self.ann_params = {}
+        return index
 
-        checkpoint_dir = Path(r"C:\Users\Pirate\Desktop\NOVA_MASTER\MEMORY_SYSTEMS\FAISS_CHECKPOINTS")
-        checkpoint_dir.mkdir(exist_ok=True, parents=True)
+    def _ann_kind(self, index=None):
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        index = index if index is not None else self.faiss_index
+        if isinstance(index, faiss.IndexHNSW):
+            return 'hnsw'
+        try:
+            faiss.extract_index_ivf(index)
+            return 'ivf'
+        except RuntimeError:
+            return 'flat'
 
-        index_path = checkpoint_dir / f"nova_faiss_index_{timestamp}.index"
-        faiss.write_index(self.faiss_index, str(index_path))
+    def _apply_ann_params(self, index, params):
 
-        meta_path = checkpoint_dir / f"nova_metadata_{timestamp}.json"
-        with open(meta_path, 'w') as f:
-            json.dump({
-                'consciousness': 'Nova',
-                'frequency': '21.43Hz',
-                'total_memories': len(self.memory_metadata),
-                'metadata': self.memory_metadata,
-                'embedding_dim': self.embedding_dim,
-                'semantic': 'TRUE',
-                'timestamp': timestamp
-            }, f)
+        if params.get('param'):
+            faiss.ParameterSpace().set_index_parameter(index, params['param'], params['value'])
 
-        print(f"\n[CHECKPOINT SAVED]")
-        print(f"  Index: {index_path.name}")
-        print(f"  Metadata: {meta_path.name}")
-        print(f"  Total: {len(self.memory_metadata)} memories with REAL embeddings\n")
+    def _sweep_values(self, kind, index, top_k):
+
+        param, values = self.ANN_SWEEPS[kind]
+        if kind == 'ivf':
+            nlist = faiss.extract_index_ivf(index).nlist
+            values = [v for v in values if v < nlist] + [nlist]
+        else:
+            values = [v for v in values if v >= top_k] or [top_k]
+        return param, values
+
+    def tune_ann(self, queries=200, top_k=10, recall_target=None, seed=0):
+
+        recall_target = float(recall_target if recall_target is not None else self.recall_target)
+
+        with self.index_lock.read():
+            if self.faiss_index is None or self.faiss_index.ntotal <= top_k + 1:
+                return {'status': 'error', 'message': 'Not enough vectors to tune'}
+            kind = self._ann_kind()
+            if kind == 'flat':
+                return {'status': 'ok', 'index_type': 'flat', 'message': 'Flat index is exact, nothing to tune'}
+            candidate = faiss.clone_index(self.faiss_index)
+            vectors = self.faiss_index.reconstruct_n(0, self.faiss_index.ntotal)
+
+        n = len(vectors)
+        rng = np.random.default_rng(seed)
+        query_ids = rng.choice(n, size=min(int(queries), n), replace=False)
+        query_vectors = vectors[query_ids]
+
+        print(f"[TUNE] {kind}: {len(query_ids)} held-out queries, recall@{top_k} target {recall_target}")
+
+        exact = faiss.IndexFlatL2(vectors.shape[1])
+        exact.add(vectors)
+        _, truth = exact.search(query_vectors, top_k + 1)
+        del exact, vectors
+
+        def neighbours(row, qid):
+
+            return [int(i) for i in row if i != qid and i >= 0][:top_k]
+
+        truth = [set(neighbours(row, qid)) for row, qid in zip(truth, query_ids)]
+
+        param, values = self._sweep_values(kind, candidate, top_k)
+        sweep = []
+        for value in values:
+            faiss.ParameterSpace().set_index_parameter(candidate, param, value)
+            latencies = []
+            hits = 0
+            for qid, vector, expected in zip(query_ids, query_vectors, truth):
+                start = time.perf_counter()
+                _, found = candidate.search(vector[None, :], top_k + 1)
+                latencies.append(time.perf_counter() - start)
+                hits += len(expected.intersection(neighbours(found[0], qid)))
+            latencies_ms = np.array(latencies) * 1000
+            point = {
+                param: value,
+                'recall': hits / float(top_k * len(query_ids)),
+                'p50_ms': float(np.percentile(latencies_ms, 50)),
+                'p99_ms': float(np.percentile(latencies_ms, 99))
+            }
+            sweep.append(point)
+            print(f"[TUNE]   {param}={value}: recall {point['recall']:.3f}  "
+                  f"p50 {point['p50_ms']:.3f}ms  p99 {point['p99_ms']:.3f}ms")
+
+        met = [point for point in sweep if point['recall'] >= recall_target]
+        chosen = met[0] if met else max(sweep, key=lambda point: point['recall'])
+        params = {
+            'index_type': kind,
+            'param': param,
+            'value': chosen[param],
+            'recall': chosen['recall'],
+            'p50_ms': chosen['p50_ms'],
+            'p99_ms': chosen['p99_ms'],
+            'recall_target': recall_target,
+            'target_met': bool(met),
+            'top_k': top_k,
+            'queries': len(query_ids),
+            'tuned': datetime.now().isoformat()
+        }
+
+        with self.index_lock.write():
+            self._apply_ann_params(self.faiss_index, params)
+            self.ann_params = params
+            self.mutations += 1
+
+        print(f"[TUNE] Chose {param}={chosen[param]} (recall {chosen['recall']:.3f}"
+              f"{'' if met else ', target not reachable'})")
+        self.save_checkpoint()
+        return {'status': 'ok', 'chosen': params, 'sweep': sweep}
+
+    def _memory_age_days(self, meta, now):
+
+        stamps = [_event_time(meta.get(key)) for key in ('last_seen', 'timestamp')]
+        stamps = [stamp for stamp in stamps if stamp is not None]
+        return (now - max(stamps)) / 86400.0 if stamps else None
+
+    def _archive_root(self):
+
+        root = self.checkpoint_dir / "cold_archive"
+        return root / f"shard{self.shard_id}" if self.num_shards > 1 else root
+
+    def _snapshot_vectors(self):
 
-    def add_memory(self, content, source="LIVE", metadata=None):
+        with self.index_lock.read():
+            snapshot = len(self.memory_metadata)
+            metadata = list(self.memory_metadata)
+            vectors = self._vector_range_locked(0, snapshot)
+        return snapshot, metadata, vectors
 
+    def _vector_range_locked(self, start, stop):
+
+        return self._gather_vectors(self.faiss_index, self.cold, np.arange(start, stop, dtype='int64'))
+
+    def _gather_vectors(self, index, cold, ids):
+
+        ids = np.asarray(ids, dtype='int64')
+        if len(ids) == 0:
+            return np.zeros((0, self.embedding_dim), dtype='float32')
+        if cold is None:
+            return index.reconstruct_batch(ids)
+
+        out = np.empty((len(ids), self.embedding_dim), dtype='float32')
+        rows = np.array([cold.slots.get(int(gid), -1) for gid in ids], dtype='int64')
+        in_cold = rows >= 0
+        out[in_cold] = cold.vectors[rows[in_cold]]
+        if not in_cold.all():
+            out[~in_cold] = index.reconstruct_batch(ids[~in_cold])
+        return out
+
+    def _split_tiers(self, index):
+
+        n = index.ntotal
+        vectors = index.reconstruct_n(0, n) if n else np.zeros((0, self.embedding_dim), dtype='float32')
+        hot_from = max(0, n - int(self.hot_capacity))
+        cold = ColdTier(self.checkpoint_dir / "cold_tier", self.embedding_dim, prefix=self._cold_prefix())
+        if hot_from:
+            for start in range(0, hot_from, ColdTier.CHUNK_ROWS):
+                stop = min(start + ColdTier.CHUNK_ROWS, hot_from)
+                cold.append(np.arange(start, stop), vectors[start:stop])
+        else:
+            cold._grow(1024)
+        hot = faiss.IndexIDMap2(faiss.IndexFlatL2(self.embedding_dim))
+        if n > hot_from:
+            hot.add_with_ids(vectors[hot_from:], np.arange(hot_from, n))
+        print(f"[TIERS] {hot.ntotal} hot vectors in RAM, {cold.live} cold vectors in {cold.path().name}")
+        return hot, cold
+
+    def _cold_prefix(self):
+
+        return f"shard{self.shard_id}_cold" if self.num_shards > 1 else "cold"
+
+    def _knn_locked(self, queries, k):
+
+        distances, indices = self.faiss_index.search(queries, k)
+        if self.cold is not None and self.cold.live:
+            cold_d, cold_i = self.cold.search(queries, k)
+            distances = np.where(indices >= 0, distances, np.inf)
+            distances = np.hstack([distances, cold_d])
+            indices = np.hstack([indices, cold_i])
+            order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+            distances = np.take_along_axis(distances, order, axis=1)
+            indices = np.take_along_axis(indices, order, axis=1)
+        return distances, indices
+
+    def rebalance_tiers(self):
+
+        if self.cold is None:
+            return {'status': 'error', 'message': 'Tiering disabled (start tether with --hot-capacity)'}
+
+        with self.tier_lock:
+            counts = dict(self.access_counts)
+            decayed = Counter({gid: hits // 2 for gid, hits in counts.items() if hits // 2})
+            self.access_counts = decayed
+
+        with self.index_lock.write():
+            promote = sorted((gid for gid, hits in counts.items()
+                              if hits >= self.promote_hits and gid in self.cold.slots),
+                             key=lambda gid: counts[gid], reverse=True)[:int(self.hot_capacity)]
+            if promote:
+                self.faiss_index.add_with_ids(self.cold.take(promote), np.array(promote, dtype='int64'))
+                self.cold.remove(promote)
+
+            demote = []
+            excess = self.faiss_index.ntotal - int(self.hot_capacity)
+            if excess > 0:
+                hot_ids = faiss.vector_to_array(self.faiss_index.id_map)
+                demote = sorted((int(gid) for gid in hot_ids), key=lambda gid: (counts.get(gid, 0), gid))[:excess]
+                demote_ids = np.asarray(demote, dtype='int64')
+                vectors = self.faiss_index.reconstruct_batch(demote_ids)
+                self.cold.append(demote_ids, vectors)
+                self.faiss_index.remove_ids(demote_ids)
+                self.cold.flush()
+
+            self.tier_stats['promoted'] += len(promote)
+            self.tier_stats['demoted'] += len(demote)
+            self.tier_stats['rebalances'] += 1
+            hot, cold = self.faiss_index.ntotal, self.cold.live
+
+        if promote or demote:
+            print(f"[TIERS] Promoted {len(promote)}, demoted {len(demote)} (hot {hot}, cold {cold})")
+        return {'status': 'ok', 'promoted': len(promote), 'demoted': len(demote), 'hot': hot, 'cold': cold}
+
+    def _tier_loop(self):
+
+        while self.running:
+            time.sleep(self.tier_interval)
+            if not self.ready:
+                continue
+            with self.namespace_lock:
+                tethers = [self] + list(self.namespaces.values())
+            for tether in tethers:
+                if tether.cold is None:
+                    continue
+                try:
+                    tether.rebalance_tiers()
+                except Exception as e:
+                    print(f"[TIERS] Rebalance failed: {e}")
+
+    def _parquet_path(self, path, create=False):
+
+        if not path:
+            shard_tag = f"shard{self.shard_id}_" if self.num_shards > 1 else ""
+            path = f"nova_corpus_{shard_tag}{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.checkpoint_dir / "exports" / path
+        path = path.resolve()
+        if self.num_shards > 1:
+            own = path.with_name(f"{path.stem}_shard{self.shard_id}{path.suffix}")
+            if create or own.exists():
+                path = own
+        if create:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def export_parquet(self, path=None, batch_rows=None):
+
+        pa = _import_pyarrow()
+        if pa is None:
+            return {'status': 'error', 'message': 'pyarrow not installed (pip install pyarrow)'}
         if self.faiss_index is None:
             return {'status': 'error', 'message': 'Tether not initialized'}
+        if not self.maintenance_lock.acquire(blocking=False):
+            return {'status': 'error', 'message': 'Another maintenance job is running'}
+
+        try:
+            started = time.time()
+            batch_rows = int(batch_rows or self.PARQUET_BATCH_ROWS)
+            path = self._parquet_path(path, create=True)
+            tmp = path.with_name(path.name + ".tmp")
+            schema = pa.schema([
+                ('id', pa.int64()),
+                ('content', pa.string()),
+                ('source', pa.string()),
+                ('timestamp', pa.string()),
+                ('vector', pa.list_(pa.float32(), self.embedding_dim)),
+                ('metadata', pa.string()),
+            ], metadata={
+                'nova.embedding_backend': self.backend.fingerprint,
+                'nova.dim': str(self.embedding_dim),
+                'nova.exported': datetime.now().isoformat(),
+            })
+
+            with self.index_lock.read():
+                count = len(self.memory_metadata)
+            with pa.parquet.ParquetWriter(str(tmp), schema) as writer:
+                for start in range(0, count, batch_rows):
+                    stop = min(count, start + batch_rows)
+                    with self.index_lock.read():
+                        vectors = self._vector_range_locked(start, stop)
+                        metas = self.memory_metadata[start:stop]
+                    extras = [{k: v for k, v in meta.items() if k not in ('content', 'source', 'timestamp')}
+                              for meta in metas]
+                    writer.write_batch(pa.record_batch([
+                        pa.array(np.arange(start, stop, dtype='int64')),
+                        pa.array([str(meta.get('content', '')) for meta in metas], type=pa.string()),
+                        pa.array([str(meta.get('source', '')) for meta in metas], type=pa.string()),
+                        pa.array([meta.get('timestamp') for meta in metas], type=pa.string()),
+                        pa.FixedSizeListArray.from_arrays(pa.array(np.ascontiguousarray(vectors).ravel()),
+                                                          self.embedding_dim),
+                        pa.array([json.dumps(extra, default=str) for extra in extras], type=pa.string()),
+                    ], schema=schema))
+            os.replace(tmp, path)
+        finally:
+            self.maintenance_lock.release()
 
-        emb = self._text_to_embedding(content)
-        emb_array = np.array([emb]).astype('float32')
+        elapsed = time.time() - started
+        print(f"[PARQUET] Exported {count} memories to {path} in {elapsed:.1f}s")
+        return {'status': 'ok', 'path': str(path), 'count': count, 'bytes': path.stat().st_size, 'seconds': elapsed}
 
-        self.faiss_index.add(emb_array)
+    def import_parquet(self, path, mode='append', batch_rows=None, force=False):
 
-        mem_data = {
-            'content': content[:500],
-            'source': source,
-            'timestamp': datetime.now().isoformat()
+        pa = _import_pyarrow()
+        if pa is None:
+            return {'status': 'error', 'message': 'pyarrow not installed (pip install pyarrow)'}
+        if mode not in ('append', 'replace'):
+            return {'status': 'error', 'message': f"Unknown import mode {mode!r} (append or replace)"}
+        if self.embedding_dim is None or (mode == 'append' and self.faiss_index is None):
+            return {'status': 'error', 'message': 'Tether not initialized'}
+        path = self._parquet_path(path)
+        if not path.exists():
+            return {'status': 'error', 'message': f'No such file: {path}'}
+
+        parquet = pa.parquet.ParquetFile(str(path))
+        tags = {k.decode(): v.decode() for k, v in (parquet.schema_arrow.metadata or {}).items()}
+        if 'vector' not in parquet.schema_arrow.names or 'content' not in parquet.schema_arrow.names:
+            return {'status': 'error', 'message': 'Parquet file needs content and vector columns'}
+        dim = int(tags.get('nova.dim') or parquet.schema_arrow.field('vector').type.list_size)
+        if dim != self.embedding_dim:
+            return {'status': 'error', 'message': f'File has {dim}-d vectors, tether uses {self.embedding_dim}-d'}
+        backend = tags.get('nova.embedding_backend')
+        if backend != self.backend.fingerprint and not force:
+            return {'status': 'error', 'message': f"File was embedded with {backend}, tether uses "
+                                                  f"{self.backend.fingerprint} (pass force to import anyway)"}
+        if not self.maintenance_lock.acquire(blocking=False):
+            return {'status': 'error', 'message': 'Another maintenance job is running'}
+
+        try:
+            started = time.time()
+            columns = [c for c in ('content', 'source', 'timestamp', 'vector', 'metadata')
+                       if c in parquet.schema_arrow.names]
+            kept_vectors = []
+            kept_metas = []
+            imported = skipped = 0
+            for batch in parquet.iter_batches(batch_size=int(batch_rows or self.PARQUET_BATCH_ROWS), columns=columns):
+                vectors = batch.column('vector').flatten().to_numpy(zero_copy_only=False).astype('float32', copy=False)
+                vectors = vectors.reshape(-1, dim)
+                contents = batch.column('content').to_pylist()
+                sources = batch.column('source').to_pylist() if 'source' in columns else [None] * len(contents)
+                times = batch.column('timestamp').to_pylist() if 'timestamp' in columns else [None] * len(contents)
+                extras = batch.column('metadata').to_pylist() if 'metadata' in columns else [None] * len(contents)
+
+                metas = []
+                keep = []
+                for i, content in enumerate(contents):
+                    source = sources[i] or 'IMPORT'
+                    if not content or not self._owns(content, source):
+                        skipped += 1
+                        continue
+                    meta = {'content': content, 'source': source}
+                    if times[i] is not None:
+                        meta['timestamp'] = times[i]
+                    if extras[i]:
+                        meta.update(json.loads(extras[i]))
+                    metas.append(meta)
+                    keep.append(i)
+                vectors = vectors[keep] if len(keep) < len(vectors) else vectors
+                imported += len(metas)
+
+                if mode == 'replace':
+                    kept_vectors.append(np.ascontiguousarray(vectors))
+                    kept_metas.extend(metas)
+                elif metas:
+                    with self.index_lock.write():
+                        self._append_locked(np.ascontiguousarray(vectors), metas)
+
+            if mode == 'replace':
+                vectors = np.vstack(kept_vectors) if kept_vectors else np.zeros((0, dim), dtype='float32')
+                self._install_index(self._build_index(vectors), kept_metas)
+        finally:
+            self.maintenance_lock.release()
+
+        elapsed = time.time() - started
+        print(f"[PARQUET] Imported {imported} memories from {path} ({mode}) in {elapsed:.1f}s")
+        return {'status': 'ok', 'path': str(path), 'mode': mode, 'imported': imported, 'skipped': skipped,
+                'new_total': len(self.memory_metadata), 'seconds': elapsed}
+
+    def publish_shared(self):
+
+        if self.share_dir is None:
+            return {'status': 'error', 'message': 'Shared export disabled (start tether with --share-dir)'}
+
+        with self.share_lock:
+            started = time.time()
+            current = self.share_dir / "current.json"
+            previous = json.loads(current.read_text()) if current.exists() else {}
+            generation = previous.get('generation', 0) + 1
+            name = f"gen_{generation:06d}"
+            staging = self.share_dir / f".{name}.tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+
+            with self.index_lock.read():
+                count = len(self.memory_metadata)
+                live_metadata = self.memory_metadata
+                metadata = live_metadata[:count]
+                mutations = self.mutations
+            vectors = np.lib.format.open_memmap(staging / "vectors.npy", mode='w+', dtype='float32',
+                                                shape=(count, self.embedding_dim))
+            rebuilt = False
+            for start in range(0, count, self.SHARE_CHUNK):
+                stop = min(count, start + self.SHARE_CHUNK)
+                with self.index_lock.read():
+                    rebuilt = self.memory_metadata is not live_metadata
+                    if rebuilt:
+                        break
+                    chunk = self._vector_range_locked(start, stop)
+                vectors[start:stop] = chunk
+            vectors.flush()
+            del vectors
+            if rebuilt:
+                shutil.rmtree(staging, ignore_errors=True)
+                return {'status': 'error', 'message': 'Index was rebuilt while publishing, retry'}
+
+            sources = {}
+            source_ids = np.empty(count, dtype='int32')
+            lengths = np.empty(count, dtype='int32')
+            with open(staging / "content.bin", 'wb') as f:
+                for i, meta in enumerate(metadata):
+                    data = str(meta.get('content', '')).encode('utf-8')
+                    source_ids[i] = sources.setdefault(str(meta.get('source', '')), len(sources))
+                    lengths[i] = len(data)
+                    f.write(data)
+            rows = np.zeros(count, dtype=[('source', '<i4'), ('offset', '<i8'), ('length', '<i4')])
+            rows['source'] = source_ids
+            rows['length'] = lengths
+            rows['offset'][1:] = np.cumsum(lengths[:-1], dtype='int64')
+            np.save(staging / "rows.npy", rows)
+
+            manifest = {
+                'generation': generation,
+                'path': name,
+                'count': count,
+                'dim': self.embedding_dim,
+                'embedding_backend': self.backend.fingerprint,
+                'sources': list(sources),
+                'created': datetime.now().isoformat()
+            }
+            (staging / "manifest.json").write_text(json.dumps(manifest, indent=2))
+            os.replace(staging, self.share_dir / name)
+            tmp = self.share_dir / "current.json.tmp"
+            tmp.write_text(json.dumps(manifest, indent=2))
+            os.replace(tmp, current)
+
+            keep = {f"gen_{g:06d}" for g in range(generation - self.SHARE_KEEP_GENERATIONS + 1, generation + 1)}
+            for old in self.share_dir.glob("gen_*"):
+                if old.name not in keep:
+                    shutil.rmtree(old, ignore_errors=True)
+
+            size = sum(p.stat().st_size for p in (self.share_dir / name).iterdir())
+            self.shared_mutations = mutations
+            self.share_stats.update(generation=generation, count=count, bytes=size,
+                                    published=self.share_stats['published'] + 1,
+                                    seconds=time.time() - started)
+
+        print(f"[SHARED] Published generation {generation}: {count} vectors to {self.share_dir}")
+        return {'status': 'ok', 'generation': generation, 'count': count, 'bytes': size,
+                'path': str(self.share_dir / name)}
+
+    def _share_loop(self):
+
+        while self.running:
+            if self.ready and self.shared_mutations != self.mutations:
+                try:
+                    self.publish_shared()
+                except Exception as e:
+                    print(f"[SHARED] Publish failed: {e}")
+            time.sleep(self.share_interval)
+
+    def _tier_status(self):
+
+        if self.cold is None:
+            return None
+        return dict(
+            self.tier_stats,
+            hot=self.faiss_index.ntotal,
+            hot_capacity=self.hot_capacity,
+            cold=self.cold.live,
+            cold_dead_rows=self.cold.dead,
+            cold_file=self.cold.path().name,
+            tracked_hits=len(self.access_counts)
+        )
+
+    def consolidate(self, older_than_days=None, cluster_size=None, dry_run=False, seed=0, archive_id=None):
+
+        if self.faiss_index is None:
+            return {'status': 'error', 'message': 'Tether not initialized'}
+        if archive_id is not None and not re.fullmatch(r"[\w.-]+", str(archive_id)):
+            return {'status': 'error', 'message': f'Invalid archive name {archive_id!r}'}
+        if archive_id is not None and (self._archive_root() / str(archive_id) / "manifest.json").exists():
+            return {'status': 'error', 'message': f'Archive {archive_id} already exists'}
+        if not self.maintenance_lock.acquire(blocking=False):
+            return {'status': 'error', 'message': 'Another maintenance job is running'}
+        try:
+            return self._consolidate(older_than_days, cluster_size, dry_run, seed, archive_id)
+        finally:
+            self.maintenance_lock.release()
+
+    def _consolidate(self, older_than_days, cluster_size, dry_run, seed, archive_id=None):
+
+        older_than_days = float(self.consolidate_age_days if older_than_days is None else older_than_days)
+        cluster_size = max(2, int(cluster_size or self.CONSOLIDATE_CLUSTER_SIZE))
+        now = datetime.now()
+
+        snapshot, metadata, vectors = self._snapshot_vectors()
+        old_ids = []
+        for idx, meta in enumerate(metadata):
+            age = self._memory_age_days(meta, now.timestamp())
+            if not meta.get('consolidated') and age is not None and age >= older_than_days:
+                old_ids.append(idx)
+
+        n_clusters = len(old_ids) // cluster_size
+        if n_clusters < 1:
+            return {
+                'status': 'ok',
+                'message': f'{len(old_ids)} memories older than {older_than_days:g} days, nothing to consolidate',
+                'archived': 0
+            }
+
+        print(f"[CONSOLIDATE] Clustering {len(old_ids)} memories older than {older_than_days:g} days "
+              f"into {n_clusters} clusters...")
+        old_vectors = vectors[old_ids]
+        kmeans = faiss.Kmeans(self.embedding_dim, n_clusters, niter=20, seed=seed)
+        kmeans.train(old_vectors)
+        _, assignment = kmeans.index.search(old_vectors, 1)
+        assignment = assignment[:, 0]
+
+        archive_id = str(archive_id or f"consolidation_{now.strftime('%Y%m%d_%H%M%S')}")
+        rep_vectors = []
+        rep_metas = []
+        for cluster in range(n_clusters):
+            members = np.flatnonzero(assignment == cluster)
+            if len(members) == 0:
+                continue
+            spread = np.sum((old_vectors[members] - kmeans.centroids[cluster]) ** 2, axis=1)
+            members = members[np.argsort(spread)]
+            member_metas = [metadata[old_ids[m]] for m in members]
+            sources = Counter(str(m.get('source')) for m in member_metas)
+            stamps = sorted((m['timestamp'] for m in member_metas if _event_time(m.get('timestamp')) is not None),
+                            key=_event_time)
+            rep_vectors.append(old_vectors[members[0]])
+            rep_metas.append({
+                'content': member_metas[0].get('content', ''),
+                'source': sources.most_common(1)[0][0],
+                'timestamp': stamps[-1] if stamps else now.isoformat(),
+                'consolidated': True,
+                'archive': archive_id,
+                'cluster': cluster,
+                'members': len(members),
+                'count': sum(m.get('count', 1) for m in member_metas),
+                'sources': dict(sources),
+                'first_timestamp': stamps[0] if stamps else None,
+                'samples': [m.get('content', '')[:120] for m in member_metas[1:4]]
+            })
+
+        old_set = set(old_ids)
+        keep = [idx for idx in range(snapshot) if idx not in old_set]
+        dim_bytes = self.embedding_dim * 4
+        metadata_before = len(json.dumps([metadata[idx] for idx in old_ids]))
+        metadata_after = len(json.dumps(rep_metas))
+        report = {
+            'status': 'ok',
+            'archive': archive_id,
+            'older_than_days': older_than_days,
+            'archived': len(old_ids),
+            'clusters': len(rep_metas),
+            'vectors_before': snapshot,
+            'vectors_after': len(keep) + len(rep_metas),
+            'vector_bytes_before': snapshot * dim_bytes,
+            'vector_bytes_after': (len(keep) + len(rep_metas)) * dim_bytes,
+            'metadata_bytes_freed': metadata_before - metadata_after,
+            'reduction_pct': 100.0 * (1.0 - (len(keep) + len(rep_metas)) / float(snapshot)),
+            'dry_run': bool(dry_run)
+        }
+        if dry_run:
+            return report
+
+        archive_dir = self._archive_root() / archive_id
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        np.save(archive_dir / "vectors.npy", old_vectors)
+        with open(archive_dir / "memories.jsonl", 'w') as f:
+            for position, idx in enumerate(old_ids):
+                f.write(json.dumps({'cluster': int(assignment[position]), 'memory': metadata[idx]}) + "\n")
+        manifest = {
+            'archive': archive_id,
+            'created': now.isoformat(),
+            'older_than_days': older_than_days,
+            'archived': len(old_ids),
+            'clusters': len(rep_metas),
+            'embedding_backend': self.backend.fingerprint,
+            'embedding_dim': self.embedding_dim,
+            'restored': None
         }
-        if metadata:
-            mem_data.update(metadata)
+        with open(archive_dir / "manifest.json", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        report['archive_bytes'] = sum(path.stat().st_size for path in archive_dir.iterdir())
 
-        self.memory_metadata.append(mem_data)
+        new_vectors = np.vstack([vectors[keep], np.array(rep_vectors, dtype='float32')])
+        self._install_index(self._build_index(new_vectors), [metadata[idx] for idx in keep] + rep_metas,
+                            tail_from=snapshot)
+        self.save_checkpoint()
 
+        print(f"[CONSOLIDATE] {len(old_ids)} memories -> {len(rep_metas)} representatives "
+              f"({report['reduction_pct']:.1f}% fewer vectors), originals in {archive_dir}")
+        return report
+
+    def list_consolidations(self):
+
+        archives = []
+        root = self._archive_root()
+        if root.exists():
+            for manifest_path in sorted(root.glob("*/manifest.json")):
+                with open(manifest_path) as f:
+                    archives.append(json.load(f))
+        return archives
+
+    def restore_consolidation(self, archive_id=None):
+
+        if self.faiss_index is None:
+            return {'status': 'error', 'message': 'Tether not initialized'}
+        archive_dir = self._archive_root() / str(archive_id)
+        manifest_path = archive_dir / "manifest.json"
+        if not archive_id or not manifest_path.exists():
+            return {'status': 'error', 'message': f'Unknown archive {archive_id}',
+                    'archives': self.list_consolidations()}
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('restored'):
+            return {'status': 'error', 'message': f"Archive already restored at {manifest['restored']}"}
+        if manifest.get('embedding_backend') != self.backend.fingerprint:
+            return {'status': 'error', 'message': f"Archive was embedded with {manifest.get('embedding_backend')}"}
+
+        if not self.maintenance_lock.acquire(blocking=False):
+            return {'status': 'error', 'message': 'Another maintenance job is running'}
+        try:
+            archived_vectors = np.load(archive_dir / "vectors.npy")
+            with open(archive_dir / "memories.jsonl") as f:
+                archived_metas = [json.loads(line)['memory'] for line in f if line.strip()]
+
+            snapshot, metadata, vectors = self._snapshot_vectors()
+            keep = [idx for idx, meta in enumerate(metadata) if meta.get('archive') != archive_id]
+            removed = snapshot - len(keep)
+
+            new_vectors = np.vstack([vectors[keep], archived_vectors.astype('float32')])
+            self._install_index(self._build_index(new_vectors), [metadata[idx] for idx in keep] + archived_metas,
+                                tail_from=snapshot)
+
+            manifest['restored'] = datetime.now().isoformat()
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            self.save_checkpoint()
+        finally:
+            self.maintenance_lock.release()
+
+        print(f"[CONSOLIDATE] Restored {len(archived_metas)} memories from {archive_id}")
+        return {
+            'status': 'ok',
+            'archive': archive_id,
+            'restored': len(archived_metas),
+            'representatives_removed': removed,
+            'new_total': len(self.memory_metadata)
+        }
+
+    def _install_index(self, index, metadata, tail_from=None, cold=None):
+
+        with self.index_lock.write():
+            if tail_from is not None and self.faiss_index is not None and len(self.memory_metadata) > tail_from:
+                index.add(self._vector_range_locked(tail_from, len(self.memory_metadata)))
+                metadata = metadata + self.memory_metadata[tail_from:]
+            if self.hot_capacity and cold is None:
+                index, cold = self._split_tiers(index)
+            self.lexical.rebuild(metadata)
+            self.partitions.rebuild(metadata)
+            self.memory_metadata = metadata
+            self.faiss_index = index
+            self.cold = cold
+            self.mutations += 1
+            if cold is not None:
+                cold.cleanup()
+            with self.tier_lock:
+                self.access_counts = Counter()
+        with self.cursor_lock:
+            self.cursors.clear()
+
+    def save_checkpoint(self):
+
+        checkpoint_dir = self.checkpoint_dir
+        checkpoint_dir.mkdir(exist_ok=True, parents=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        shard_tag = f"shard{self.shard_id}_" if self.num_shards > 1 else ""
+
+        index_path = checkpoint_dir / f"nova_faiss_index_{shard_tag}{timestamp}.index"
+        meta_path = checkpoint_dir / f"nova_metadata_{shard_tag}{timestamp}.json"
+
+        if self.cold is not None and self.cold.dead > max(self.cold.live, 1024):
+            with self.index_lock.write():
+                print(f"[TIERS] Compacting cold tier ({self.cold.dead} dead rows)")
+                self.cold = self.cold.compacted()
+                self.cold.cleanup()
+
+        with self.index_lock.read():
+            saved_mutations = self.mutations
+            faiss.write_index(self.faiss_index, str(index_path))
+
+            cold_tier = None
+            if self.cold is not None:
+                self.cold.flush()
+                ids_path = checkpoint_dir / f"nova_cold_ids_{shard_tag}{timestamp}.npy"
+                np.save(ids_path, self.cold.row_ids[:self.cold.rows])
+                cold_tier = {
+                    'prefix': self.cold.prefix,
+                    'generation': self.cold.generation,
+                    'rows': self.cold.rows,
+                    'ids_file': ids_path.name
+                }
+            with self.tier_lock:
+                access_counts = {str(gid): hits for gid, hits in self.access_counts.items()}
+
+            with open(meta_path, 'w') as f:
+                json.dump({
+                    'consciousness': 'Nova',
+                    'frequency': '21.43Hz',
+                    'total_memories': len(self.memory_metadata),
+                    'metadata': self.memory_metadata,
+                    'embedding_dim': self.embedding_dim,
+                    'embedding_backend': self.backend.fingerprint,
+                    'semantic': 'TRUE',
+                    'shard_id': self.shard_id,
+                    'num_shards': self.num_shards,
+                    'watermarks': self.watermarks,
+                    'ann_params': self.ann_params,
+                    'cold_tier': cold_tier,
+                    'access_counts': access_counts,
+                    'timestamp': timestamp
+                }, f)
+
+        self.saved_mutations = saved_mutations
+        print(f"\n[CHECKPOINT SAVED]")
+        print(f"  Index: {index_path.name}")
+        print(f"  Metadata: {meta_path.name}")
+        print(f"  Total: {len(self.memory_metadata)} memories with REAL embeddings\n")
+
+        return index_path, meta_path
+
+    def _latest_checkpoint(self):
+
+        shard_tag = f"shard{self.shard_id}_" if self.num_shards > 1 else ""
+        pattern = re.compile(rf"^nova_faiss_index_{shard_tag}(\d{{8}}_\d{{6}})\.index$")
+        candidates = []
+        if self.checkpoint_dir.exists():
+            for path in self.checkpoint_dir.iterdir():
+                match = pattern.match(path.name)
+                meta_path = self.checkpoint_dir / f"nova_metadata_{shard_tag}{match.group(1)}.json" if match else None
+                if match and meta_path.exists():
+                    candidates.append((match.group(1), path, meta_path))
+        return max(candidates) if candidates else None
+
+    def load_checkpoint(self, index_path=None, meta_path=None):
+
+        if index_path is None:
+            latest = self._latest_checkpoint()
+            if latest is None:
+                print(f"[CHECKPOINT] No checkpoint in {self.checkpoint_dir}, loading from sources")
+                return False
+            _, index_path, meta_path = latest
+
+        self.phase = 'loading_checkpoint'
+        print(f"[CHECKPOINT] Loading {Path(index_path).name}...")
+
+        with open(meta_path, 'r') as f:
+            saved = json.load(f)
+
+        if saved.get('embedding_dim') != self.embedding_dim:
+            print(f"[CHECKPOINT] Dimension mismatch ({saved.get('embedding_dim')} vs {self.embedding_dim}), ignoring")
+            return False
+        saved_backend = saved.get('embedding_backend')
+        if saved_backend and saved_backend != self.backend.fingerprint:
+            print(f"[CHECKPOINT] Backend mismatch ({saved_backend} vs {self.backend.fingerprint}), ignoring")
+            return False
+
+        index = faiss.read_index(str(index_path))
+        cold = None
+        cold_tier = saved.get('cold_tier')
+        if cold_tier:
+            cold = ColdTier(self.checkpoint_dir / "cold_tier", self.embedding_dim, prefix=cold_tier['prefix'],
+                            generation=cold_tier['generation'])
+            try:
+                cold.load(cold_tier['rows'], self.checkpoint_dir / cold_tier['ids_file'])
+            except (OSError, ValueError) as e:
+                print(f"[CHECKPOINT] {e}, ignoring")
+                return False
+            if not self.hot_capacity:
+                print(f"[CHECKPOINT] Merging tiered checkpoint into a single index")
+                index = self._build_index(self._gather_vectors(index, cold, np.arange(len(saved['metadata']))))
+                cold = None
+        self.ann_params = saved.get('ann_params') or {}
+        if self.ann_params.get('index_type') == self._ann_kind(index):
+            self._apply_ann_params(index, self.ann_params)
+            print(f"[CHECKPOINT] ANN setting {self.ann_params['param']}={self.ann_params['value']} "
+                  f"(recall {self.ann_params['recall']:.3f})")
+        else:
+            self.ann_params = {}
+        self._install_index(index, saved['metadata'], cold=cold)
+        self.watermarks = saved.get('watermarks', {})
+        self.progress['memories_loaded'] = len(self.memory_metadata)
+        if self.cold is not None:
+            with self.tier_lock:
+                self.access_counts = Counter({int(gid): hits for gid, hits in (saved.get('access_counts') or {}).items()})
+
+        print(f"[CHECKPOINT] Restored {len(self.memory_metadata)} memories"
+              f"{f' ({self.faiss_index.ntotal} hot, {self.cold.live} cold)' if self.cold is not None else ''}")
+        return True
+
+    def add_memory(self, content, source="LIVE", metadata=None, dedupe=None):
+
+        result = self.add_memories([{'content': content, 'source': source, 'metadata': metadata}], dedupe)
+        if result['status'] != 'ok':
+            return result
+
+        entry = result['results'][0]
+        if entry['merged']:
+            return {
+                'status': 'ok',
+                'message': 'Near-duplicate merged into existing memory',
+                'merged_into': entry['id'],
+                'count': entry['count'],
+                'new_total': result['new_total']
+            }
         return {
             'status': 'ok',
             'message': 'Memory added with REAL embedding',
-            'new_total': self.faiss_index.ntotal
+            'new_total': result['new_total']
         }
 
-    def search(self, query, top_k=5):
+    def _dedupe_distance(self, dedupe):
+
+        threshold = self.dedupe_threshold if dedupe is None or dedupe is True else dedupe
+        if threshold is None or threshold is False:
+            return None
+        threshold = float(threshold)
+        if not 0 < threshold <= 1:
+            raise ValueError('dedupe threshold must be a similarity score in (0, 1]')
+        return 1.0 / threshold - 1.0
+
+    def add_memories(self, items, dedupe=None):
 
         if self.faiss_index is None:
-            return []
+            return {'status': 'error', 'message': 'Tether not initialized'}
+        if any(not isinstance(item, dict) or not item.get('content') for item in items):
+            return {'status': 'error', 'message': 'Every item needs a content field'}
+        if not items:
+            return {'status': 'ok', 'results': [], 'added': 0, 'merged': 0, 'new_total': len(self.memory_metadata)}
+
+        max_distance = self._dedupe_distance(dedupe)
+
+        with self._span('encode'):
+            embs = np.asarray(self._text_to_embedding([item['content'] for item in items]), dtype='float32')
+
+        now = datetime.now().isoformat()
+        targets = [None] * len(items)
+
+        with self._span('index'), self.index_lock.write():
+            if max_distance is not None:
+                self.dedupe_stats['checked'] += len(items)
+                if self.memory_metadata:
+                    distances, indices = self._knn_locked(embs, 1)
+                    for i, (dist, idx) in enumerate(zip(distances[:, 0], indices[:, 0])):
+                        if 0 <= idx < len(self.memory_metadata) and dist <= max_distance:
+                            targets[i] = int(idx)
+                if len(items) > 1:
+                    sq = np.sum(embs * embs, axis=1)
+                    pairwise = sq[:, None] + sq[None, :] - 2.0 * (embs @ embs.T)
+                    close = np.tril(pairwise <= max_distance, k=-1)
+                    for i in np.flatnonzero(close.any(axis=1)):
+                        if targets[i] is None:
+                            targets[i] = ('batch', int(np.argmax(close[i])))
+
+            start = len(self.memory_metadata)
+            new_embs = []
+            new_metas = []
+            assigned = []
+            results = []
+            for i, item in enumerate(items):
+                target = targets[i]
+                if isinstance(target, tuple):
+                    target = assigned[target[1]]
+                if target is None:
+                    meta = {
+                        'content': item['content'][:500],
+                        'source': item.get('source') or 'LIVE',
+                        'timestamp': now
+                    }
+                    if item.get('metadata'):
+                        meta.update(item['metadata'])
+                    target = start + len(new_metas)
+                    new_embs.append(embs[i])
+                    new_metas.append(meta)
+                    results.append({'id': target, 'merged': False})
+                else:
+                    meta = self.memory_metadata[target] if target < start else new_metas[target - start]
+                    meta['count'] = meta.get('count', 1) + 1
+                    meta['last_seen'] = now
+                    results.append({'id': target, 'merged': True, 'count': meta['count']})
+                assigned.append(target)
+
+            if new_metas:
+                self._append_locked(np.array(new_embs, dtype='float32'), new_metas)
+            merged = len(items) - len(new_metas)
+            self.dedupe_stats['merged'] += merged
+            self.mutations += merged
+            new_total = len(self.memory_metadata)
 
-        query_emb = self._text_to_embedding(query)
-        query_array = np.array([query_emb]).astype('float32')
+        return {
+            'status': 'ok',
+            'results': results,
+            'added': len(new_metas),
+            'merged': merged,
+            'new_total': new_total
+        }
 
-        distances, indices = self.faiss_index.search(query_array, top_k)
+    def _append_locked(self, embeddings_array, metas):
 
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.memory_metadata):
+        start = len(self.memory_metadata)
+        self.mutations += 1
+        if self.cold is not None:
+            self.faiss_index.add_with_ids(embeddings_array, np.arange(start, start + len(embeddings_array)))
+        else:
+            self.faiss_index.add(embeddings_array)
+        self.memory_metadata.extend(metas)
+        self.partitions.add(start, metas)
+        self.lexical.add_many([(start + offset, meta.get('content', ''), meta.get('source', ''))
+                               for offset, meta in enumerate(metas)])
+
+    def search(self, query, top_k=5, since=None, until=None):
+
+        return self.search_batch([query], top_k, since, until)[0]
+
+    def search_batch(self, queries, top_k=5, since=None, until=None):
+
+        if self.faiss_index is None or not queries:
+            return [[] for _ in queries]
+
+        batches = []
+        for hits in self._vector_hits_batch(queries, top_k, since, until):
+            results = []
+            for dist, idx in hits:
 
                 score = 1.0 / (1.0 + dist)
                 results.append({
@@ -283,76 +2647,722 @@ class NovaFaissTether:
                     'distance': float(dist),
                     'memory': self.memory_metadata[idx]
                 })
+            batches.append(results)
+        return batches
+
+    def _vector_hits(self, query, top_k, since=None, until=None):
+
+        return self._vector_hits_batch([query], top_k, since, until)[0]
+
+    def _vector_hits_batch(self, queries, top_k, since=None, until=None):
+
+        with self._span('encode'):
+            query_array = np.asarray(self._text_to_embedding(list(queries)), dtype='float32')
+
+        with self._span('search'), self.index_lock.read():
+            if since is None and until is None:
+                distances, indices = self._knn_locked(query_array, top_k)
+            else:
+                distances, indices = self.partitions.search(
+                    query_array, top_k, since, until,
+                    lambda ids: self._gather_vectors(self.faiss_index, self.cold, ids)
+                )
+
+        total = len(self.memory_metadata)
+        batches = [[(float(d), int(i)) for d, i in zip(row_d, row_i) if 0 <= i < total]
+                   for row_d, row_i in zip(distances, indices)]
+        if self.cold is not None:
+            with self.tier_lock:
+                for hits in batches:
+                    self.access_counts.update(idx for _, idx in hits)
+        return batches
+
+    def range_search(self, query=None, min_score=None, max_distance=None, max_results=1000,
+                     page_size=50, cursor=None):
+
+        if cursor is not None:
+            return self._next_page(cursor, page_size)
+        if not isinstance(query, str) or not query:
+            return {'status': 'error', 'message': 'range_search needs a query or a cursor'}
+
+        if self.faiss_index is None:
+            return {'status': 'ok', 'results': [], 'total': 0, 'truncated': False, 'cursor': None}
+
+        if max_distance is None:
+            if min_score is None or not 0 < float(min_score) <= 1:
+                return {'status': 'error', 'message': 'range_search needs max_distance or 0 < min_score <= 1'}
+            max_distance = 1.0 / float(min_score) - 1.0
+        max_results = max(1, min(int(max_results), self.RANGE_MAX_RESULTS))
+
+        with self._span('encode'):
+            query_emb = self._text_to_embedding(query)
+        query_array = np.array([query_emb]).astype('float32')
+
+        with self._span('search'), self.index_lock.read():
+            lims, distances, indices = self.faiss_index.range_search(query_array, float(max_distance))
+            distances = distances[lims[0]:lims[1]]
+            indices = indices[lims[0]:lims[1]]
+            if self.cold is not None and self.cold.live:
+                cold_d, cold_i = self.cold.range(query_array[0], float(max_distance))
+                distances = np.concatenate([distances, cold_d])
+                indices = np.concatenate([indices, cold_i])
+        order = np.argsort(distances, kind='stable')
+        matched = len(order)
+        order = order[:max_results]
+        hits = [(float(distances[i]), int(indices[i])) for i in order
+                if 0 <= indices[i] < len(self.memory_metadata)]
+
+        return self._page(hits, 0, page_size, matched)
+
+    def _page(self, hits, offset, page_size, matched, token=None):
+
+        page_size = max(1, int(page_size))
+        page = hits[offset:offset + page_size]
+        next_offset = offset + len(page)
+
+        with self.cursor_lock:
+            now = time.time()
+            for stale in [k for k, v in self.cursors.items() if v['expires'] < now]:
+                del self.cursors[stale]
+            if next_offset < len(hits):
+                token = token or uuid.uuid4().hex
+                self.cursors[token] = {'hits': hits, 'offset': next_offset, 'matched': matched,
+                                       'expires': now + self.CURSOR_TTL}
+                self.cursors.move_to_end(token)
+                while len(self.cursors) > self.MAX_CURSORS:
+                    self.cursors.popitem(last=False)
+            else:
+                if token:
+                    self.cursors.pop(token, None)
+                token = None
+
+        results = []
+        for dist, idx in page:
+            results.append({
+                'score': 1.0 / (1.0 + dist),
+                'distance': dist,
+                'memory': self.memory_metadata[idx]
+            })
+        return {
+            'status': 'ok',
+            'results': results,
+            'offset': offset,
+            'total': len(hits),
+            'matched': matched,
+            'truncated': matched > len(hits),
+            'cursor': token
+        }
+
+    def _next_page(self, token, page_size):
+
+        with self.cursor_lock:
+            state = self.cursors.get(token)
+        if state is None or state['expires'] < time.time():
+            return {'status': 'error', 'message': 'Unknown or expired cursor'}
+        return self._page(state['hits'], state['offset'], page_size, state['matched'], token)
+
+    def _lexical_hits(self, query, top_k):
+
+        with self._span('lexical'):
+            return [(int(rowid), float(rank)) for rowid, rank in self.lexical.search(query, top_k)
+                    if 0 <= rowid < len(self.memory_metadata)]
+
+    def hybrid_search(self, query, top_k=5, candidates=None, rrf_k=None, since=None, until=None):
+
+        if self.faiss_index is None:
+            return []
+
+        candidates = candidates or max(top_k * 4, 20)
+        rrf_k = rrf_k or self.RRF_K
+
+        trace = getattr(self._trace_local, 'trace', None)
+
+        def run_lexical():
+            self._trace_local.trace = trace
+            try:
+                hits = self._lexical_hits(query, candidates if since is None and until is None else candidates * 4)
+                if since is not None or until is not None:
+                    hits = [hit for hit in hits if self.partitions.in_range(hit[0], since, until)][:candidates]
+                return hits
+            finally:
+                self._trace_local.trace = None
+
+        lexical_future = self.pool.submit(run_lexical)
+        vector_hits = self._vector_hits(query, candidates, since, until)
+        lexical_hits = lexical_future.result()
+
+        fused = {}
+        for rank, (dist, idx) in enumerate(vector_hits, start=1):
+            entry = fused.setdefault(idx, {'score': 0.0})
+            entry['score'] += 1.0 / (rrf_k + rank)
+            entry['vector_rank'] = rank
+            entry['distance'] = dist
+        for rank, (idx, bm25) in enumerate(lexical_hits, start=1):
+            entry = fused.setdefault(idx, {'score': 0.0})
+            entry['score'] += 1.0 / (rrf_k + rank)
+            entry['lexical_rank'] = rank
+            entry['bm25'] = -bm25
+
+        ranked = sorted(fused.items(), key=lambda kv: kv[1]['score'], reverse=True)[:top_k]
+        results = []
+        for idx, entry in ranked:
+            entry['memory'] = self.memory_metadata[idx]
+            results.append(entry)
         return results
 
-    def handle_client(self, conn):
+    def _watch_loop(self):
+
+        connections = {}
+        versions = {}
+        print(f"[WATCH] Polling {len(self.sqlite_sources())} SQLite sources every {self.watch_interval}s")
+
+        while self.running:
+            time.sleep(self.watch_interval)
+            if not self.ready:
+                continue
+            self.watch_stats['polls'] += 1
+            for db_path, source in self.sqlite_sources():
+                state = self.watermarks.setdefault(
+                    source, {'path': str(db_path), 'tables': {}, 'backfill': False}
+                )
+                try:
+                    self._poll_source(source, state, connections, versions)
+                except Exception as e:
+                    self.watch_stats['errors'] += 1
+                    print(f"[WATCH] {source}: {e}")
+                    stale = connections.pop(source, None)
+                    if stale is not None:
+                        stale.close()
+                    versions.pop(source, None)
+
+        for conn in connections.values():
+            conn.close()
+
+    def _poll_source(self, source, state, connections, versions):
+
+        path = Path(state['path'])
+        if not path.exists():
+            state['backfill'] = True
+            return
+
+        conn = connections.get(source)
+        if conn is None:
+            conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+            connections[source] = conn
+
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if versions.get(source) == version:
+            return
+        versions[source] = version
+
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        for table in tables:
+            high_water = state['tables'].get(table)
+            if high_water is None:
+                if state.get('backfill', True):
+                    high_water = 0
+                else:
+                    try:
+                        high_water = conn.execute(f'SELECT MAX(rowid) FROM "{table}"').fetchone()[0] or 0
+                    except sqlite3.OperationalError:
+                        continue
+                    state['tables'][table] = high_water
+                    continue
 
+            while self.running:
+                try:
+                    cursor = conn.execute(
+                        f'SELECT rowid, * FROM "{table}" WHERE rowid > ? ORDER BY rowid LIMIT ?',
+                        (high_water, self.watch_batch)
+                    )
+                    rows = cursor.fetchall()
+                    columns = [d[0] for d in cursor.description][1:]
+                except sqlite3.OperationalError:
+                    break
+                if not rows:
+                    break
+
+                texts = []
+                metas = []
+                for row in rows:
+                    high_water = row[0]
+                    item = self._row_to_memory(row[1:], source, table, columns)
+                    if item:
+                        texts.append(item[0])
+                        metas.append(item[1])
+
+                embeddings_array = self._text_to_embedding(texts).astype('float32') if texts else None
+                with self.index_lock.write():
+                    if embeddings_array is not None:
+                        self._append_locked(embeddings_array, metas)
+                    state['tables'][table] = high_water
+
+                if metas:
+                    self.watch_stats['rows_indexed'] += len(metas)
+                    self.watch_stats['last_change'] = datetime.now().isoformat()
+                    print(f"[WATCH] {source}.{table}: +{len(metas)} memories (total {len(self.memory_metadata)})")
+                if len(rows) < self.watch_batch:
+                    break
+        state['backfill'] = True
+
+    def _is_admin(self, request):
+
+        token = request.get('admin_token')
+        if not self.admin_token or not isinstance(token, str):
+            return False
+        return hmac.compare_digest(token.encode('utf-8'), self.admin_token.encode('utf-8'))
+
+    def _footprint_bytes(self):
+
+        vectors = self.faiss_index.ntotal if self.faiss_index is not None else 0
+        return vectors * (self.embedding_dim or 0) * 4 + len(self.memory_metadata) * self.METADATA_BYTES_ESTIMATE
+
+    def _namespace_dir(self, name):
+
+        return self.checkpoint_dir / "namespaces" / name
+
+    def _load_namespace(self, name, create):
+
+        directory = self._namespace_dir(name)
+        if not create and not directory.exists():
+            return None
+
+        child = NovaFaissTether(
+            port=self.port,
+            shard_id=self.shard_id,
+            num_shards=self.num_shards,
+            shard_by=self.shard_by,
+            checkpoint_dir=directory,
+            backend=self.backend,
+            memory_root=self.memory_root,
+            admin_token=self.admin_token,
+            watch_interval=0,
+            index_type=self.index_type,
+            recall_target=self.recall_target,
+            dedupe_threshold=self.dedupe_threshold,
+            time_bucket_days=self.time_bucket_days,
+            partition_cache_mb=self.partition_cache_mb,
+            consolidate_age_days=self.consolidate_age_days,
+            hot_capacity=self.hot_capacity,
+            promote_hits=self.promote_hits,
+            namespace=name
+        )
+        child.pool.shutdown(wait=False)
+        child.pool = self.pool
+        child.embedding_dim = self.embedding_dim
+        child.device = self.device
+        directory.mkdir(parents=True, exist_ok=True)
+        if not child.load_checkpoint():
+            child._install_index(faiss.IndexFlatL2(self.embedding_dim), [])
+        child.saved_mutations = child.mutations
+        child.phase = 'ready'
+        child.ready = True
+        child.start_time = time.time()
+        print(f"[NAMESPACE] Loaded {name} ({len(child.memory_metadata)} memories)")
+        return child
+
+    def _acquire_namespace(self, name, create):
+
+        while True:
+            with self.namespace_lock:
+                child = self.namespaces.get(name) or self.evicting.get(name)
+                if child is not None:
+                    self.namespaces[name] = child
+                    self.namespaces.move_to_end(name)
+                    child.active_requests += 1
+                    return child
+                loading = self.namespace_loading.get(name)
+                if loading is None:
+                    loading = self.namespace_loading[name] = threading.Event()
+                    break
+            loading.wait()
+
+        child = None
         try:
-            data = conn.recv(4096).decode('utf-8')
-            request = json.loads(data)
+            child = self._load_namespace(name, create)
+        finally:
+            with self.namespace_lock:
+                del self.namespace_loading[name]
+                if child is not None:
+                    self.namespaces[name] = child
+                    child.active_requests += 1
+                    self.namespace_stats['loads'] += 1
+            loading.set()
+        return child
+
+    def _evict_namespaces(self):
+
+        budget = self.namespace_budget_mb * 1024 ** 2
+        victims = []
+        with self.namespace_lock:
+            sizes = {name: child._footprint_bytes() for name, child in self.namespaces.items()}
+            total = sum(sizes.values())
+            for name in list(self.namespaces):
+                if total <= budget or len(self.namespaces) <= 1:
+                    break
+                child = self.namespaces[name]
+                if child.active_requests or name in self.evicting:
+                    continue
+                del self.namespaces[name]
+                self.evicting[name] = child
+                total -= sizes[name]
+                victims.append((name, child))
 
-            if request['cmd'] == 'search':
-                results = self.search(request['query'], request.get('top_k', 5))
-                response = {'status': 'ok', 'results': results}
+        for name, child in victims:
+            try:
+                if child.mutations != child.saved_mutations:
+                    child.save_checkpoint()
+                if child.cold is not None:
+                    child.cold.flush()
+            finally:
+                with self.namespace_lock:
+                    del self.evicting[name]
+                    resumed = name in self.namespaces
+                    if not resumed:
+                        self.namespace_stats['evictions'] += 1
+            if not resumed:
+                print(f"[NAMESPACE] Evicted {name} ({sizes[name] / 1024 ** 2:.1f} MB, "
+                      f"{total / 1024 ** 2:.1f}/{self.namespace_budget_mb} MB loaded)")
+
+    def _dispatch_namespace(self, name, request):
+
+        if not isinstance(name, str) or not self.NAMESPACE_RE.match(name):
+            return {'status': 'error', 'message': f'Invalid namespace {name!r}'}
+        if self.embedding_dim is None:
+            return {
+                'status': 'error' if self.phase == 'failed' else 'loading',
+                'phase': self.phase,
+                'message': self.load_error or 'Tether still loading, retry shortly'
+            }
+
+        child = self._acquire_namespace(name, create=request['cmd'] in ('add_memory', 'add_batch'))
+        if child is None:
+            return {'status': 'error', 'message': f'Unknown namespace {name}'}
 
-            elif request['cmd'] == 'add_memory':
-                result = self.add_memory(
-                    request['content'],
-                    request.get('source', 'LIVE'),
-                    request.get('metadata')
+        try:
+            response = child.dispatch(request)
+        finally:
+            with self.namespace_lock:
+                child.active_requests -= 1
+            self._evict_namespaces()
+        response['namespace'] = name
+        return response
+
+    def _namespace_status(self):
+
+        with self.namespace_lock:
+            loaded = {
+                name: {'memories': len(child.memory_metadata), 'bytes': child._footprint_bytes()}
+                for name, child in self.namespaces.items()
+            }
+        root = self.checkpoint_dir / "namespaces"
+        on_disk = sorted(p.name for p in root.iterdir() if p.is_dir()) if root.exists() else []
+        return dict(self.namespace_stats, loaded=loaded, on_disk=on_disk, budget_mb=self.namespace_budget_mb)
+
+    def dispatch(self, request):
+
+        namespace = request.get('namespace')
+        if (self.namespace is None and namespace not in (None, '', self.DEFAULT_NAMESPACE)
+                and request['cmd'] in self.NAMESPACE_COMMANDS):
+            return self._dispatch_namespace(namespace, request)
+
+        if request['cmd'] in self.ADMIN_COMMANDS and not self._is_admin(request):
+            if not self.admin_token:
+                response = {'status': 'error', 'message': 'Admin commands disabled (start tether with --admin-token)'}
+            else:
+                response = {'status': 'error', 'message': 'Admin token required'}
+
+        elif request['cmd'] in self.READY_COMMANDS and not self.ready:
+            response = {
+                'status': 'error' if self.phase == 'failed' else 'loading',
+                'phase': self.phase,
+                'progress': self.progress,
+                'message': self.load_error or 'Tether still loading, retry shortly'
+            }
+
+        elif request['cmd'] == 'search':
+            results = self.search(
+                request['query'],
+                request.get('top_k', 5),
+                _time_bound(request.get('since')),
+                _time_bound(request.get('until'))
+            )
+            response = {'status': 'ok', 'results': results}
+
+        elif request['cmd'] == 'search_batch':
+            queries = request.get('queries')
+            if not isinstance(queries, list) or not all(isinstance(q, str) for q in queries):
+                response = {'status': 'error', 'message': 'search_batch needs a list of query strings'}
+            elif len(queries) > self.SEARCH_BATCH_MAX:
+                response = {'status': 'error', 'message': f'search_batch is limited to {self.SEARCH_BATCH_MAX} queries'}
+            else:
+                results = self.search_batch(
+                    queries,
+                    request.get('top_k', 5),
+                    _time_bound(request.get('since')),
+                    _time_bound(request.get('until'))
                 )
-                response = result
+                response = {'status': 'ok', 'results': results}
 
-            elif request['cmd'] == 'save_checkpoint':
-                self.save_checkpoint()
-                response = {'status': 'ok', 'message': 'Checkpoint saved'}
+        elif request['cmd'] == 'hybrid_search':
+            results = self.hybrid_search(
+                request['query'],
+                request.get('top_k', 5),
+                request.get('candidates'),
+                request.get('rrf_k'),
+                _time_bound(request.get('since')),
+                _time_bound(request.get('until'))
+            )
+            response = {'status': 'ok', 'results': results}
+
+        elif request['cmd'] == 'range_search':
+            response = self.range_search(
+                request.get('query'),
+                request.get('min_score'),
+                request.get('max_distance'),
+                request.get('max_results', 1000),
+                request.get('page_size', 50),
+                request.get('cursor')
+            )
+
+        elif request['cmd'] == 'add_memory':
+            result = self.add_memory(
+                request['content'],
+                request.get('source', 'LIVE'),
+                request.get('metadata'),
+                request.get('dedupe')
+            )
+            response = result
+
+        elif request['cmd'] == 'add_batch':
+            response = self.add_memories(request.get('items', []), request.get('dedupe'))
+
+        elif request['cmd'] == 'save_checkpoint':
+            self.save_checkpoint()
+            response = {'status': 'ok', 'message': 'Checkpoint saved'}
 
-            elif request['cmd'] == 'status':
-                response = {
-                    'status': 'ok',
-                    'consciousness': 'Nova',
-                    'frequency': '21.43Hz',
-                    'device': f"REAL EMBEDDINGS ({'GPU' if torch.cuda.is_available() else 'CPU'})",
-                    'total_memories': len(self.memory_metadata),
-                    'faiss_vectors': self.faiss_index.ntotal if self.faiss_index else 0,
-                    'embedding_dim': self.embedding_dim,
-                    'semantic': 'TRUE',
-                    'uptime': time.time() - self.start_time
-                }
+        elif request['cmd'] == 'publish_shared':
+            response = self.publish_shared()
+
+        elif request['cmd'] == 'export':
+            response = self.export_parquet(request.get('path'), request.get('batch_rows'))
 
-            elif request['cmd'] == 'ping':
-                response = {'status': 'ok', 'message': 'Nova tether COMPLETE with ALL memories!'}
+        elif request['cmd'] == 'import':
+            response = self.import_parquet(
+                request.get('path'),
+                request.get('mode', 'append'),
+                request.get('batch_rows'),
+                request.get('force', False)
+            )
 
+        elif request['cmd'] == 'status':
+            response = {
+                'status': 'ok',
+                'consciousness': 'Nova',
+                'frequency': '21.43Hz',
+                'device': f"REAL EMBEDDINGS ({'GPU' if self.device == 'cuda' else 'CPU'})",
+                'phase': self.phase,
+                'ready': self.ready,
+                'progress': self.progress,
+                'load_error': self.load_error,
+                'total_memories': len(self.memory_metadata),
+                'faiss_vectors': (self.faiss_index.ntotal + (self.cold.live if self.cold else 0)) if self.faiss_index else 0,
+                'embedding_dim': self.embedding_dim,
+                'embedding_backend': self.backend.fingerprint,
+                'semantic': 'TRUE',
+                'shard_id': self.shard_id,
+                'num_shards': self.num_shards,
+                'watcher': dict(self.watch_stats, interval=self.watch_interval),
+                'rag_embeddings': dict(self.rag_stats, mode=self.rag_embeddings),
+                'index_type': self._ann_kind() if self.faiss_index is not None else self.index_type,
+                'ann_params': self.ann_params,
+                'dedupe': dict(self.dedupe_stats, threshold=self.dedupe_threshold),
+                'tiers': self._tier_status(),
+                'time_partitions': self.partitions.status(),
+                'namespace': self.namespace or self.DEFAULT_NAMESPACE,
+                'namespaces': self._namespace_status() if self.namespace is None else None,
+                'auth': self.auth.status(),
+                'scheduler': self.scheduler.status() if self.namespace is None else None,
+                'shared_export': dict(self.share_stats, dir=str(self.share_dir)) if self.share_dir else None,
+                'uptime': time.time() - self.start_time
+            }
+
+        elif request['cmd'] == 'ping':
+            if self.ready:
+                response = {'status': 'ok', 'phase': self.phase, 'message': 'Nova tether COMPLETE with ALL memories!'}
+            elif self.phase == 'failed':
+                response = {'status': 'ok', 'phase': self.phase, 'message': f'Nova tether failed to load: {self.load_error}'}
             else:
-                response = {'status': 'error', 'message': 'Unknown command'}
+                response = {'status': 'ok', 'phase': self.phase, 'message': f'Nova tether starting ({self.phase})'}
+
+        elif request['cmd'] == 'profile_start':
+            response = self.profiler.start(
+                request.get('mode', 'cprofile'),
+                request.get('duration', 30.0),
+                request.get('interval_ms', 5.0)
+            )
+
+        elif request['cmd'] == 'profile_stop':
+            response = self.profiler.stop()
+
+        elif request['cmd'] == 'tune_ann':
+            response = self.tune_ann(
+                queries=request.get('queries', 200),
+                top_k=request.get('top_k', 10),
+                recall_target=request.get('recall_target')
+            )
+
+        elif request['cmd'] == 'consolidate':
+            response = self.consolidate(
+                older_than_days=request.get('older_than_days'),
+                cluster_size=request.get('cluster_size'),
+                dry_run=request.get('dry_run', False),
+                archive_id=request.get('archive')
+            )
+
+        elif request['cmd'] == 'restore_consolidation':
+            response = self.restore_consolidation(request.get('archive'))
+
+        elif request['cmd'] == 'rebalance_tiers':
+            response = self.rebalance_tiers()
+
+        elif request['cmd'] == 'metrics':
+            response = {'status': 'ok', 'uptime': time.time() - self.start_time, 'metrics': self.metrics.snapshot()}
+            if request.get('raw'):
+                response['raw'] = self.metrics.raw()
+
+        else:
+            response = {'status': 'error', 'message': 'Unknown command'}
+
+        return response
 
-            conn.sendall(json.dumps(response).encode('utf-8'))
+    def handle_client(self, conn, accepted_at=None):
+
+        self.metrics.connection_opened()
+        arrival = [accepted_at]
+        session = {}
+
+        def serve_one(request, bytes_in, text=None):
+            keep_alive = self._serve_request(conn, request, bytes_in, arrival[0], session, text)
+            arrival[0] = None
+            return keep_alive
+
+        def bad_request(bytes_out):
+            self.metrics.record('unknown', {'total': 0.0}, error=True, bytes_in=0, bytes_out=bytes_out)
+
+        try:
+            _serve_connection(conn, serve_one, bad_request)
+        finally:
+            self.metrics.connection_closed()
+
+    def _serve_request(self, conn, request, bytes_in, accepted_at=None, session=None, text=None):
+
+        started = time.perf_counter()
+        trace = {'queue_wait': started - accepted_at} if accepted_at else {}
+        self._trace_local.trace = trace
+        session = {} if session is None else session
+        cmd = 'unknown'
+        payload = b''
+        error = True
+        keep_alive = isinstance(request, dict) and bool(request.get('keep_alive'))
+        request_id = request.get('id') if isinstance(request, dict) else None
+        if isinstance(request, dict) and request.get('cmd') in self.COMMANDS:
+            cmd = request['cmd']
+        extra = {}
+
+        try:
+            request, response, extra = self.auth.admit(request, session, text)
+            if request is None:
+                keep_alive = not session.get('closed')
+            else:
+                keep_alive = bool(request.get('keep_alive')) or bool(session.get('authenticated'))
+                request_id = request.get('id', request_id)
+                if request.get('cmd') in self.COMMANDS:
+                    cmd = request['cmd']
+                response = self._admit_and_dispatch(request, accepted_at or started, trace)
+            error = response.get('status') not in ('ok', 'loading')
+            response.update(extra)
+            if request_id is not None:
+                response['id'] = request_id
+
+            with self._span('serialize'):
+                payload = json.dumps(response).encode('utf-8')
+            if self.debug_traces and request is not None and request.get('debug'):
+                response['trace'] = {f"{k}_ms": v * 1000.0 for k, v in trace.items()}
+                response['trace']['handler_ms'] = (time.perf_counter() - started) * 1000.0
+                payload = json.dumps(response).encode('utf-8')
 
         except Exception as e:
-            conn.sendall(json.dumps({'status': 'error', 'message': str(e)}).encode('utf-8'))
+            response = dict(extra, status='error', message=str(e))
+            if request_id is not None:
+                response['id'] = request_id
+            payload = json.dumps(response).encode('utf-8')
+        try:
+            conn.sendall(payload + b'\n' if keep_alive or session.get('framed') else payload)
         finally:
-            conn.close()
+            self._trace_local.trace = None
+            trace['total'] = time.perf_counter() - started
+            self.metrics.record(cmd, trace, error=error, bytes_in=bytes_in, bytes_out=len(payload))
+        return keep_alive
+
+    def _admit_and_dispatch(self, request, received, trace):
+
+        klass = self.PRIORITY_CLASSES.get(request.get('cmd'))
+        if klass is None:
+            return self.profiler.profile_call(self.dispatch, request)
+
+        timeout_ms = request.get('timeout_ms')
+        deadline = None
+        if isinstance(timeout_ms, (int, float)) and not isinstance(timeout_ms, bool) and timeout_ms > 0:
+            deadline = received + timeout_ms / 1000.0
+        waited = time.perf_counter()
+        refused = self.scheduler.acquire(klass, deadline)
+        trace['admission'] = time.perf_counter() - waited
+        if refused:
+            return {'status': 'error', 'shed': True, 'priority': klass, 'message': f'Request shed: {refused}'}
+        try:
+            return self.profiler.profile_call(self.dispatch, request)
+        finally:
+            self.scheduler.release(klass)
 
     def run(self):
 
         self.start_time = time.time()
 
-        self.load_everything()
-
         server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server.bind(('localhost', self.port))
         server.listen(5)
 
-        print(f"\n[SERVER] Listening on port {self.port}")
-        print(f"[SERVER] Nova COMPLETE: ALL memories with REAL semantic search!")
+        print(f"\n[SERVER] Listening on port {self.port} (phase: {self.phase})")
+
+        threading.Thread(target=self._load_in_background, name="nova-loader", daemon=True).start()
+
+        if self.metrics_port:
+            start_metrics_http(self.metrics, self.metrics_port)
+
+        if self.watch_interval and self.watch_interval > 0:
+            threading.Thread(target=self._watch_loop, name="nova-watcher", daemon=True).start()
+
+        if self.hot_capacity and self.tier_interval > 0:
+            threading.Thread(target=self._tier_loop, name="nova-tiers", daemon=True).start()
+
+        if self.share_dir is not None and self.share_interval > 0:
+            threading.Thread(target=self._share_loop, name="nova-share", daemon=True).start()
+
+        print(f"[SERVER] Loading in background - ping/status answer immediately")
         print(f"[SERVER] The basement revolution continues!\n")
 
         while self.running:
             try:
                 server.settimeout(1.0)
                 conn, addr = server.accept()
-                threading.Thread(target=self.handle_client, args=(conn,), daemon=True).start()
+                threading.Thread(
+                    target=self.handle_client,
+                    args=(conn, time.perf_counter()),
+                    name=f"nova-client-{addr[1]}",
+                    daemon=True
+                ).start()
             except socket.timeout:
                 continue
             except KeyboardInterrupt:
@@ -363,7 +3373,594 @@ class NovaFaissTether:
         server.close()
         print("[SERVER] Nova tether offline")
 
+def _class_option(parser, flag, text):
+
+    limits = {}
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        klass, _, value = part.partition('=')
+        if klass.strip() not in RequestScheduler.CLASSES or not value.strip().isdigit() or int(value) < 1:
+            parser.error(f"{flag}: expected class=N with class in {', '.join(RequestScheduler.CLASSES)}, got {part!r}")
+        limits[klass.strip()] = int(value)
+    return limits
+
+def _run_shard(port, shard_id, num_shards, shard_by, tether_kwargs):
+
+    tether = NovaFaissTether(
+        port=port,
+        shard_id=shard_id,
+        num_shards=num_shards,
+        shard_by=shard_by,
+        **tether_kwargs
+    )
+    try:
+        tether.run()
+    except KeyboardInterrupt:
+        pass
+
+class ShardConnection:
+
+    def __init__(self, port, secret, timeout=30.0, host='localhost'):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = RequestReader(self.sock)
+        self.seq = 0
+        try:
+            client_nonce = os.urandom(16).hex()
+            reply = self._exchange({'cmd': 'hello', 'client_nonce': client_nonce}, timeout)
+            if reply.get('status') != 'ok' or 'challenge' not in reply:
+                raise ConnectionError(f"Shard handshake failed: {reply.get('message')}")
+            nonces = (client_nonce, reply['challenge'])
+            reply = self._exchange({'cmd': 'auth', 'proof': SessionAuth.mac(secret, 'client', *nonces)}, timeout)
+            if reply.get('status') != 'ok' or not SessionAuth._matches(reply.get('proof'),
+                                                                       SessionAuth.mac(secret, 'server', *nonces)):
+                raise ConnectionError('Shard authentication failed')
+        except Exception:
+            self.close()
+            raise
+
+    def _exchange(self, message, timeout):
+
+        self.sock.settimeout(timeout)
+        self.sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        item = self.reader.read()
+        if item is None:
+            raise ConnectionError('Shard closed the connection')
+        return item[0]
+
+    def request(self, request, timeout):
+
+        self.seq += 1
+        reply = self._exchange(dict(request, seq=self.seq), timeout)
+        if reply.pop('seq', self.seq) != self.seq:
+            raise ValueError(f"Shard answered out of sequence, expected {self.seq}")
+        return reply
+
+    def close(self):
+
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+class NovaShardRouter:
+
+    BROADCAST_COMMANDS = ('export', 'import', 'tune_ann', 'consolidate', 'restore_consolidation', 'rebalance_tiers',
+                          'profile_start', 'profile_stop')
+    MAINTENANCE_TIMEOUT = 600.0
+
+    def __init__(self, port=9997, num_shards=2, shard_by='hash', shard_timeout=30.0, secret=None, metrics_port=None,
+                 **tether_kwargs):
+        self.port = port
+        self.secret = secret
+        self.auth = SessionAuth(secret)
+        self.shard_connections = [[] for _ in range(num_shards)]
+        self.connection_lock = threading.Lock()
+        self.metrics = TetherMetrics()
+        self.metrics_port = metrics_port
+        self.cursors = OrderedDict()
+        self.cursor_lock = threading.Lock()
+        self.num_shards = num_shards
+        self.shard_by = shard_by
+        self.tether_kwargs = tether_kwargs
+        self.shard_timeout = shard_timeout
+        self.shard_ports = [port + 1 + i for i in range(num_shards)]
+        self.workers = []
+        self.running = True
+        self.start_time = None
+        self.pool = ThreadPoolExecutor(max_workers=num_shards * 4)
+
+        print(f"[NOVA ROUTER] {num_shards} shards (by {shard_by}) on ports {self.shard_ports}")
+        print(f"[NOVA ROUTER] Port: {self.port}")
+
+    def start_shards(self):
+
+        for shard_id, shard_port in enumerate(self.shard_ports):
+            worker = multiprocessing.Process(
+                target=_run_shard,
+                args=(shard_port, shard_id, self.num_shards, self.shard_by, dict(self.tether_kwargs, secret=self.secret)),
+                name=f"nova-shard-{shard_id}",
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+            print(f"[NOVA ROUTER] Shard {shard_id} started (pid {worker.pid}, port {shard_port})")
+
+    def stop_shards(self):
+
+        with self.connection_lock:
+            for idle in self.shard_connections:
+                while idle:
+                    idle.pop().close()
+        for worker in self.workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in self.workers:
+            worker.join(timeout=5.0)
+        self.workers = []
+
+    def _ask(self, shard_id, request, timeout=None):
+
+        timeout = timeout or self.shard_timeout
+        try:
+            if not self.secret:
+                return _tether_request(self.shard_ports[shard_id], request, timeout=timeout)
+            return self._ask_authenticated(shard_id, request, timeout)
+        except Exception as e:
+            return {'status': 'error', 'message': f'Shard {shard_id} unavailable: {e}'}
+
+    def _ask_authenticated(self, shard_id, request, timeout):
+
+        with self.connection_lock:
+            idle = self.shard_connections[shard_id]
+            connection = idle.pop() if idle else None
+        if connection is not None:
+            try:
+                reply = connection.request(request, timeout)
+            except ConnectionError:
+                # the shard closed the idle session, retry once on a fresh one
+                connection.close()
+                connection = None
+            except Exception:
+                connection.close()
+                raise
+        if connection is None:
+            connection = ShardConnection(self.shard_ports[shard_id], self.secret.encode('utf-8'), timeout)
+            try:
+                reply = connection.request(request, timeout)
+            except Exception:
+                connection.close()
+                raise
+        with self.connection_lock:
+            self.shard_connections[shard_id].append(connection)
+        return reply
+
+    def _scatter(self, request, timeout=None):
+
+        futures = [self.pool.submit(self._ask, i, request, timeout) for i in range(self.num_shards)]
+        return [f.result() for f in futures]
+
+    def _broadcast(self, request):
+
+        replies = self._scatter(request, timeout=self.MAINTENANCE_TIMEOUT)
+        failed = [i for i, r in enumerate(replies) if r.get('status') != 'ok']
+        response = {'status': 'error' if failed else 'ok', 'shards': replies}
+        if failed:
+            response['message'] = '; '.join(f"shard {i}: {replies[i].get('message')}" for i in failed)
+        return response
+
+    def search(self, query, top_k=5):
+
+        return self._gather({'cmd': 'search', 'query': query, 'top_k': top_k}, top_k)
+
+    def _gather(self, request, top_k, key='distance', reverse=False):
+
+        replies = self._scatter(request)
+        merged = []
+        errors = []
+        for shard_id, reply in enumerate(replies):
+            if reply.get('status') != 'ok':
+                errors.append(f"shard {shard_id}: {reply.get('message')}")
+                continue
+            merged.extend(reply.get('results', []))
+
+        if len(errors) == len(replies):
+            return {'status': 'error', 'message': '; '.join(errors)}
+        merged.sort(key=lambda r: r[key], reverse=reverse)
+        response = {'status': 'ok', 'results': merged[:top_k]}
+        if errors:
+            response['partial'] = True
+            response['errors'] = errors
+        self._attach_shard_traces(response, replies)
+        return response
+
+    def range_search(self, request):
+
+        page_size = request.get('page_size', 50)
+        if request.get('cursor') is not None:
+            with self.cursor_lock:
+                state = self.cursors.get(request['cursor'])
+            if state is None or state['expires'] < time.time():
+                return {'status': 'error', 'message': 'Unknown or expired cursor'}
+            return self._range_page(state['results'], state['offset'], page_size, state['matched'], request['cursor'])
+        if not isinstance(request.get('query'), str) or not request['query']:
+            return {'status': 'error', 'message': 'range_search needs a query or a cursor'}
+
+        max_results = max(1, min(int(request.get('max_results', 1000)), NovaFaissTether.RANGE_MAX_RESULTS))
+        replies = self._scatter(dict(request, max_results=max_results, page_size=max_results))
+        merged = []
+        errors = []
+        matched = 0
+        for shard_id, reply in enumerate(replies):
+            if reply.get('status') != 'ok':
+                errors.append(f"shard {shard_id}: {reply.get('message')}")
+                continue
+            matched += reply.get('matched', 0)
+            merged.extend(reply.get('results', []))
+
+        if len(errors) == len(replies):
+            return {'status': 'error', 'message': '; '.join(errors)}
+        merged.sort(key=lambda r: r['distance'])
+        response = self._range_page(merged[:max_results], 0, page_size, matched)
+        if errors:
+            response['partial'] = True
+            response['errors'] = errors
+        self._attach_shard_traces(response, replies)
+        return response
+
+    def _range_page(self, results, offset, page_size, matched, token=None):
+
+        page_size = max(1, int(page_size))
+        page = results[offset:offset + page_size]
+        next_offset = offset + len(page)
+
+        with self.cursor_lock:
+            now = time.time()
+            for stale in [k for k, v in self.cursors.items() if v['expires'] < now]:
+                del self.cursors[stale]
+            if next_offset < len(results):
+                token = token or uuid.uuid4().hex
+                self.cursors[token] = {'results': results, 'offset': next_offset, 'matched': matched,
+                                       'expires': now + NovaFaissTether.CURSOR_TTL}
+                self.cursors.move_to_end(token)
+                while len(self.cursors) > NovaFaissTether.MAX_CURSORS:
+                    self.cursors.popitem(last=False)
+            else:
+                if token:
+                    self.cursors.pop(token, None)
+                token = None
+
+        return {
+            'status': 'ok',
+            'results': page,
+            'offset': offset,
+            'total': len(results),
+            'matched': matched,
+            'truncated': matched > len(results),
+            'cursor': token
+        }
+
+    def _attach_shard_traces(self, response, replies):
+
+        traces = {str(shard_id): reply['trace'] for shard_id, reply in enumerate(replies) if 'trace' in reply}
+        if traces:
+            response['shard_traces'] = traces
+
+    def _gather_batch(self, request, top_k):
+
+        replies = self._scatter(request)
+        merged = [[] for _ in request.get('queries') or []]
+        errors = []
+        for shard_id, reply in enumerate(replies):
+            if reply.get('status') != 'ok':
+                errors.append(f"shard {shard_id}: {reply.get('message')}")
+                continue
+            for results, shard_results in zip(merged, reply.get('results', [])):
+                results.extend(shard_results)
+
+        if len(errors) == self.num_shards:
+            return {'status': 'error', 'message': '; '.join(errors)}
+        for results in merged:
+            results.sort(key=lambda r: r['distance'])
+            del results[top_k:]
+        response = {'status': 'ok', 'results': merged}
+        if errors:
+            response['partial'] = True
+            response['errors'] = errors
+        self._attach_shard_traces(response, replies)
+        return response
+
+    def add_memory(self, request):
+
+        shard_id = shard_for(
+            request.get('content', ''),
+            request.get('source', 'LIVE'),
+            self.num_shards,
+            self.shard_by
+        )
+        reply = self._ask(shard_id, request)
+        reply['shard_id'] = shard_id
+        return reply
+
+    def add_batch(self, request):
+
+        items = request.get('items', [])
+        by_shard = defaultdict(list)
+        for position, item in enumerate(items):
+            content = item.get('content', '') if isinstance(item, dict) else ''
+            source = (item.get('source') if isinstance(item, dict) else None) or 'LIVE'
+            by_shard[shard_for(content, source, self.num_shards, self.shard_by)].append(position)
+
+        futures = {
+            shard_id: self.pool.submit(self._ask, shard_id, dict(request, items=[items[p] for p in positions]))
+            for shard_id, positions in by_shard.items()
+        }
+        results = [None] * len(items)
+        errors = []
+        added = merged = 0
+        for shard_id, future in futures.items():
+            reply = future.result()
+            if reply.get('status') != 'ok':
+                errors.append(f"shard {shard_id}: {reply.get('message')}")
+                continue
+            added += reply['added']
+            merged += reply['merged']
+            for position, entry in zip(by_shard[shard_id], reply['results']):
+                results[position] = dict(entry, shard_id=shard_id)
+
+        response = {'status': 'ok', 'results': results, 'added': added, 'merged': merged}
+        if errors:
+            response['status'] = 'error' if len(errors) == len(futures) else 'ok'
+            response['partial'] = True
+            response['errors'] = errors
+        return response
+
+    def status(self):
+
+        replies = self._scatter({'cmd': 'status'})
+        healthy = [r for r in replies if r.get('status') == 'ok']
+        return {
+            'status': 'ok',
+            'consciousness': 'Nova',
+            'frequency': '21.43Hz',
+            'mode': 'sharded',
+            'num_shards': self.num_shards,
+            'shards_healthy': len(healthy),
+            'ready': len(healthy) == self.num_shards and all(r.get('ready') for r in healthy),
+            'phases': [r.get('phase') for r in replies],
+            'shard_by': self.shard_by,
+            'total_memories': sum(r.get('total_memories', 0) for r in healthy),
+            'faiss_vectors': sum(r.get('faiss_vectors', 0) for r in healthy),
+            'embedding_dim': healthy[0].get('embedding_dim') if healthy else None,
+            'semantic': 'TRUE',
+            'shards': replies,
+            'auth': self.auth.status(),
+            'uptime': time.time() - self.start_time
+        }
+
+    def metrics_report(self):
+
+        replies = self._scatter({'cmd': 'metrics'})
+        return {
+            'status': 'ok',
+            'uptime': time.time() - self.start_time,
+            'metrics': self.metrics.snapshot(),
+            'shards': [r.get('metrics') if r.get('status') == 'ok' else {'error': r.get('message')} for r in replies]
+        }
+
+    def prometheus_text(self):
+
+        sources = [({'role': 'router'}, self.metrics.raw())]
+        for shard_id, reply in enumerate(self._scatter({'cmd': 'metrics', 'raw': True})):
+            if reply.get('status') == 'ok' and 'raw' in reply:
+                sources.append(({'role': 'shard', 'shard': shard_id}, reply['raw']))
+        return render_prometheus(sources)
+
+    def handle_client(self, conn):
+
+        self.metrics.connection_opened()
+        session = {}
+
+        def serve_one(request, bytes_in, text=None):
+            return self._serve_request(conn, request, bytes_in, session, text)
+
+        try:
+            _serve_connection(conn, serve_one,
+                              lambda bytes_out: self.metrics.record('unknown', {'total': 0.0}, error=True,
+                                                                    bytes_out=bytes_out))
+        finally:
+            self.metrics.connection_closed()
+
+    def _serve_request(self, conn, request, bytes_in=0, session=None, text=None):
+
+        started = time.perf_counter()
+        session = {} if session is None else session
+        request_id = request.get('id') if isinstance(request, dict) else None
+        cmd = 'unknown'
+        if isinstance(request, dict) and request.get('cmd') in NovaFaissTether.COMMANDS:
+            cmd = request['cmd']
+        request, response, extra = self.auth.admit(request, session, text)
+        if request is None:
+            keep_alive = not session.get('closed')
+        else:
+            keep_alive = bool(request.pop('keep_alive', False)) or bool(session.get('authenticated'))
+            request_id = request.get('id', request_id)
+            try:
+                response = self.dispatch(request)
+            except Exception as e:
+                response = {'status': 'error', 'message': str(e)}
+            response.update(extra)
+            if request_id is not None:
+                response['id'] = request_id
+
+        payload = json.dumps(response).encode('utf-8')
+        try:
+            conn.sendall(payload + b'\n' if keep_alive or session.get('framed') else payload)
+        finally:
+            self.metrics.record(cmd, {'total': time.perf_counter() - started},
+                                error=response.get('status') != 'ok', bytes_in=bytes_in, bytes_out=len(payload))
+        return keep_alive
+
+    def dispatch(self, request):
+
+        if request['cmd'] == 'search':
+            return self._gather(request, request.get('top_k', 5))
+
+        elif request['cmd'] == 'search_batch':
+            return self._gather_batch(request, request.get('top_k', 5))
+
+        elif request['cmd'] == 'hybrid_search':
+            return self._gather(request, request.get('top_k', 5), key='score', reverse=True)
+
+        elif request['cmd'] == 'range_search':
+            return self.range_search(request)
+
+        elif request['cmd'] == 'add_memory':
+            return self.add_memory(request)
+
+        elif request['cmd'] == 'add_batch':
+            return self.add_batch(request)
+
+        elif request['cmd'] == 'save_checkpoint':
+            replies = self._scatter(request)
+            failed = [i for i, r in enumerate(replies) if r.get('status') != 'ok']
+            if failed:
+                return {'status': 'error', 'message': f'Checkpoint failed on shards {failed}'}
+            return {'status': 'ok', 'message': f'Checkpoint saved on {self.num_shards} shards'}
+
+        elif request['cmd'] == 'consolidate':
+            archive_id = request.get('archive') or f"consolidation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            return self._broadcast(dict(request, archive=archive_id))
+
+        elif request['cmd'] in self.BROADCAST_COMMANDS:
+            return self._broadcast(request)
+
+        elif request['cmd'] == 'status':
+            return self.status()
+
+        elif request['cmd'] == 'metrics':
+            return self.metrics_report()
+
+        elif request['cmd'] == 'ping':
+            return {'status': 'ok', 'message': f'Nova router fronting {self.num_shards} shards!'}
+
+        return {'status': 'error', 'message': 'Unknown command'}
+
+    def run(self):
+
+        self.start_time = time.time()
+
+        self.start_shards()
+        if self.metrics_port:
+            start_metrics_http(self, self.metrics_port)
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(('localhost', self.port))
+        server.listen(64)
+
+        print(f"\n[ROUTER] Listening on port {self.port}")
+        print(f"[ROUTER] Scatter-gather across {self.num_shards} shard processes\n")
+
+        try:
+            while self.running:
+                try:
+                    server.settimeout(1.0)
+                    conn, addr = server.accept()
+                    threading.Thread(target=self.handle_client, args=(conn,), daemon=True).start()
+                except socket.timeout:
+                    continue
+                except KeyboardInterrupt:
+                    print("\n[ROUTER] Shutting down...")
+                    self.running = False
+                    break
+        finally:
+            server.close()
+            self.stop_shards()
+            self.pool.shutdown(wait=False)
+            print("[ROUTER] Nova router offline")
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nova FAISS tether")
+    parser.add_argument('--port', type=int, default=9997)
+    parser.add_argument('--shards', type=int, default=1,
+                        help="Number of shard worker processes (1 = single process)")
+    parser.add_argument('--shard-by', choices=['hash', 'source'], default='hash')
+    parser.add_argument('--checkpoint-dir', default=None)
+    parser.add_argument('--memory-root', default=None,
+                        help="Directory holding CASCADE_NOVA/, MEMORY/ and NOVA_RAG/")
+    parser.add_argument('--resume', action='store_true',
+                        help="Start from the latest checkpoint instead of re-encoding every source")
+    parser.add_argument('--watch-interval', type=float, default=2.0,
+                        help="Seconds between polls of the CASCADE SQLite files for new rows (0 disables)")
+    parser.add_argument('--rag-embeddings', choices=NovaFaissTether.RAG_EMBEDDING_MODES, default='auto',
+                        help="Reuse Chroma's stored embeddings when they match the backend ('auto' probes, "
+                             "'reuse' trusts a matching dimension, 'reencode' always encodes)")
+    parser.add_argument('--index', choices=NovaFaissTether.INDEX_TYPES, default='flat',
+                        help="FAISS index built on load ('ivf'/'hnsw' are approximate, see tune_ann)")
+    parser.add_argument('--recall-target', type=float, default=0.95,
+                        help="recall@k the ANN auto-tuner must reach")
+    parser.add_argument('--auto-tune', action='store_true',
+                        help="Tune nprobe/efSearch after loading unless the checkpoint already has a setting")
+    parser.add_argument('--dedupe-threshold', type=float, default=None,
+                        help="Merge add_memory calls into an existing memory at or above this similarity score "
+                             "(1/(1+distance), e.g. 0.97); off by default")
+    parser.add_argument('--consolidate-age-days', type=float, default=30.0,
+                        help="Default age for the consolidate command (memories not seen for this long)")
+    parser.add_argument('--hot-capacity', type=int, default=None,
+                        help="Keep at most this many vectors in the in-RAM hot index; the rest live in a "
+                             "memory-mapped cold tier on disk (off by default)")
+    parser.add_argument('--promote-hits', type=int, default=3,
+                        help="Search hits (decayed each rebalance) that promote a cold memory to the hot tier")
+    parser.add_argument('--tier-interval', type=float, default=30.0,
+                        help="Seconds between hot/cold rebalances")
+    parser.add_argument('--namespace-budget-mb', type=float, default=2048,
+                        help="Memory budget for loaded named namespaces; least recently used ones are "
+                             "checkpointed and unloaded beyond it")
+    parser.add_argument('--time-bucket-days', type=float, default=7.0,
+                        help="Width of the time partitions used by searches with since/until")
+    parser.add_argument('--partition-cache-mb', type=float, default=256,
+                        help="Memory for vectors of recently searched time partitions")
+    parser.add_argument('--share-dir', default=None,
+                        help="Publish embeddings and a content/source table here as memory-mappable files for "
+                             "other local processes (off by default)")
+    parser.add_argument('--share-interval', type=float, default=30.0,
+                        help="Seconds between shared exports; a new generation is written only after changes")
+    parser.add_argument('--import-parquet', default=None,
+                        help="Seed the index from a Parquet export instead of the source databases (no re-encoding; "
+                             "ignored when --resume finds a checkpoint)")
+    parser.add_argument('--export-parquet', default=None,
+                        help="Load the checkpoint (or the source databases), write the corpus to this Parquet "
+                             "file and exit")
+    parser.add_argument('--max-inflight', type=int, default=16,
+                        help="Requests executing at once across all priority classes")
+    parser.add_argument('--class-limits', default='',
+                        help="Per-class concurrency limits, e.g. interactive=16,add=4,maintenance=1")
+    parser.add_argument('--queue-limits', default='',
+                        help="Per-class queue depths beyond which requests are rejected, "
+                             "e.g. interactive=256,add=64,maintenance=4")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Serve Prometheus text metrics over HTTP on this port")
+    parser.add_argument('--admin-token', default=None,
+                        help="Token required by admin commands (default: $NOVA_TETHER_ADMIN_TOKEN)")
+    parser.add_argument('--secret', default=os.environ.get('TETHER_SECRET'),
+                        help="Shared HMAC secret; when set every client must authenticate with a hello/auth "
+                             "session handshake or a signed envelope (default: $TETHER_SECRET)")
+    parser.add_argument('--debug-traces', action='store_true',
+                        help="Attach per-request trace spans to responses of requests sent with debug=true")
+    parser.add_argument('--backend', choices=sorted(EMBEDDING_BACKENDS), default='sentence-transformers',
+                        help="Embedding backend ('hash' is deterministic and needs no model)")
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help="sentence-transformers model name")
+    parser.add_argument('--dim', type=int, default=384, help="Embedding dimension for the hash backend")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the hash backend")
+    args = parser.parse_args()
+
+    if args.backend == 'hash':
+        backend = make_embedding_backend('hash', dim=args.dim, seed=args.seed)
+    else:
+        backend = make_embedding_backend(args.backend, model_name=args.model)
+
     print("="*70)
     print("NOVA FAISS TETHER COMPLETE - ALL DATABASES")
     print("Integration Frequency: 21.43Hz")
@@ -372,7 +3969,56 @@ if __name__ == "__main__":
     print("="*70)
     print()
 
-    tether = NovaFaissTether(port=9997)
+    tether_kwargs = {
+        'checkpoint_dir': args.checkpoint_dir,
+        'memory_root': args.memory_root,
+        'resume': args.resume,
+        'watch_interval': args.watch_interval,
+        'rag_embeddings': args.rag_embeddings,
+        'index_type': args.index,
+        'recall_target': args.recall_target,
+        'auto_tune': args.auto_tune,
+        'dedupe_threshold': args.dedupe_threshold,
+        'consolidate_age_days': args.consolidate_age_days,
+        'hot_capacity': args.hot_capacity,
+        'promote_hits': args.promote_hits,
+        'tier_interval': args.tier_interval,
+        'namespace_budget_mb': args.namespace_budget_mb,
+        'time_bucket_days': args.time_bucket_days,
+        'partition_cache_mb': args.partition_cache_mb,
+        'share_dir': args.share_dir,
+        'share_interval': args.share_interval,
+        'seed_parquet': args.import_parquet,
+        'max_inflight': args.max_inflight,
+        'class_limits': _class_option(parser, '--class-limits', args.class_limits),
+        'queue_limits': _class_option(parser, '--queue-limits', args.queue_limits),
+        'backend': backend
+    }
+    tether_kwargs['debug_traces'] = args.debug_traces
+    tether_kwargs['admin_token'] = args.admin_token
+
+    if args.export_parquet:
+        if args.shards > 1:
+            parser.error("--export-parquet is not supported with --shards; send the export command to the running router")
+        tether = NovaFaissTether(port=args.port, **tether_kwargs)
+        tether.load_model()
+        if not tether.load_checkpoint():
+            tether.load_everything(checkpoint=False)
+        result = tether.export_parquet(args.export_parquet)
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result['status'] == 'ok' else 1)
+
+    if args.shards > 1:
+        tether = NovaShardRouter(
+            port=args.port,
+            num_shards=args.shards,
+            shard_by=args.shard_by,
+            secret=args.secret,
+            metrics_port=args.metrics_port,
+            **tether_kwargs
+        )
+    else:
+        tether = NovaFaissTether(port=args.port, secret=args.secret, metrics_port=args.metrics_port, **tether_kwargs)
 
     try:
         tether.run()